@@ -1,6 +1,27 @@
-import matplotlib.pyplot as plt
-import math
-from matplotlib.colors import LinearSegmentedColormap
+import os
+import re
+
+from Class.DispositionReseau import DispositionReseau
+from Class.IndexConnexite import IndexConnexite
+from Class.MatricesNumpy import np
+from Class.MoteurItineraire import MoteurItineraire
+from Class.ParcoursReseau import ParcoursReseau
+
+# matplotlib.pyplot n’est importé qu’au premier affichage (voir _pyplot) :
+# le menu texte et le calcul d’itinéraires ne paient ni son import
+# ni l’initialisation d’un backend graphique
+_plt = None
+
+
+def _pyplot():
+    """
+    Retourne le module matplotlib.pyplot, importé au premier appel.
+    """
+    global _plt
+    if _plt is None:
+        import matplotlib.pyplot as plt
+        _plt = plt
+    return _plt
 
 
 class AffichageReseau:
@@ -10,221 +31,400 @@ class AffichageReseau:
     - affichage du réseau complet
     - affichage du plus court chemin
     - comparaison de trajets
+
+    En mode sans affichage (sans_affichage=True), les figures ne sont jamais
+    montrées : elles sont enregistrées dans des fichiers (PNG, SVG, ... selon
+    l’extension), rendues par le backend Agg sans passer par pyplot.
+    Une seule figure est alors créée et réutilisée d’un tracé à l’autre :
+    son fond (stations et leurs noms, grille de la heatmap) n’est redessiné
+    que s’il change, seuls les chemins ou les valeurs sont remplacés.
     """
 
-    def __init__(self, reseau):
+    # Au-delà de ce nombre de stations, leurs noms ne sont plus affichés
+    MAX_LABELS = 200
+
+    # Au-delà de ce nombre de stations par côté, une heatmap agrège les stations par blocs
+    TAILLE_MAX_IMAGE = 500
+
+    # Taille de police minimale (points) des noms de stations d’une heatmap
+    TAILLE_POLICE_MIN = 5
+
+    COULEURS = ["red", "blue", "green", "orange", "purple", "brown", "pink", "olive", "cyan", "gray"]
+
+    def __init__(self, reseau, sans_affichage=False):
         """
         Initialise l'affichage à partir d'un réseau urbain.
         - reseau : instance de ReseauUrbain
+        - sans_affichage : enregistrer les figures dans des fichiers au lieu de les afficher
         """
         self.reseau = reseau
-        self.stations = [s.nom for s in reseau.stations]
-        self.index = reseau.index_par_nom
+        self.moteur = MoteurItineraire(reseau)
+        self.disposition = DispositionReseau(reseau)
+        self.sans_affichage = sans_affichage
+
+        self.figure = None          # Figure réutilisée (mode sans affichage)
+        self._fond = None           # Description du fond déjà dessiné sur la figure
+        self._artistes = []         # Artistes du dernier tracé, retirés au suivant
+        self._image = None          # Image de la heatmap
+
+    # ÉTAT COURANT DU RÉSEAU
+    # Lus à chaque tracé : le réseau peut avoir été rechargé (_installer remplace
+    # son index) ou complété depuis la création de l’affichage
+    @property
+    def stations(self):
+        """
+        Noms des stations, par index.
+        """
+        return [s.nom for s in self.reseau.stations]
+
+    @property
+    def index(self):
+        """
+        Nom de station -> index.
+        """
+        return self.reseau.index_par_nom
+
+    # GESTION DES FIGURES
+    def _preparer(self, fond, taille):
+        """
+        Retourne (figure, axes, fond à dessiner).
+        En mode interactif, chaque tracé ouvre une nouvelle figure pyplot ;
+        sans affichage, la figure unique est réutilisée et n’est vidée
+        que si le fond demandé diffère de celui déjà dessiné.
+        """
+        if not self.sans_affichage:
+            self._artistes = []
+            figure = _pyplot().figure(figsize=taille)
+            return figure, figure.gca(), True
+
+        for artiste in self._artistes:
+            artiste.remove()
+        self._artistes = []
+
+        if self.figure is None:
+            from matplotlib.figure import Figure
+            self.figure = Figure(figsize=taille)
+        elif self._fond == fond:
+            return self.figure, self.figure.axes[0], False
+
+        self.figure.clear()
+        self.figure.set_size_inches(taille)
+        self._fond = fond
+        return self.figure, self.figure.add_subplot(), True
+
+    def _terminer(self, figure, fichier):
+        """
+        Enregistre la figure si un fichier est donné, puis l’affiche en mode interactif.
+        Retourne la figure.
+        """
+        if fichier is not None:
+            figure.savefig(fichier)
+        if not self.sans_affichage:
+            _pyplot().show()
+        return figure
 
     # HEATMAP MATRICE
     # Bleu (faible) -> Rouge (élevé)
     # Les valeurs -1 (absence de liaison) sont affichées en blanc
-    def heatmap(self, matrice, titre):
+    def heatmap(self, matrice, titre, fichier=None, ordre=None, agregation="min"):
         """
         Affiche une heatmap d'une matrice d'adjacence (temps ou distance).
+        - fichier : chemin du fichier où enregistrer la figure (optionnel)
+        - ordre : ordre des stations (voir ordre_stations)
+        - agregation : "min" ou "mean", valeur d’un bloc de stations lorsque
+          la matrice dépasse TAILLE_MAX_IMAGE cases de côté
         """
         n = len(matrice)
 
-        # Conversion de la matrice en valeurs numériques exploitables
-        # Les -1 sont remplacés par NaN pour être affichés en blanc
-        data = []
-        for i in range(n):
-            ligne = []
-            for j in range(n):
-                if matrice[i][j] == -1:
-                    ligne.append(float("nan"))
-                else:
-                    ligne.append(float(matrice[i][j]))
-            data.append(ligne)
-
-        # Définition du dégradé bleu → rouge
-        cmap = LinearSegmentedColormap.from_list(
-            "blue_red",
-            ["blue", "red"]
-        )
-        cmap.set_bad(color="white")
-
-        plt.figure(figsize=(9, 9))
-        ax = plt.gca()
-
-        # Affichage de la matrice
-        ax.imshow(
-            data,
-            cmap=cmap,
-            origin="upper",
-            extent=[0, n, n, 0]
-        )
-
-        # Barre de couleur
-        plt.colorbar(ax.images[0])
+        # Conversion vectorisée de la matrice en tableau float64
+        # Les -1 et les valeurs infinies (absence de liaison) deviennent NaN
+        # pour être affichés en blanc
+        data = np.array(matrice, dtype=np.float64).reshape(n, n)
+        data[(data == -1) | ~np.isfinite(data)] = np.nan
 
-        # Définition de la grille : une case par cellule
-        ax.set_xticks(range(n + 1))
-        ax.set_yticks(range(n + 1))
+        ordre = self.ordre_stations(ordre)
+        data = data[np.ix_(ordre, ordre)]
 
-        # Placement des labels au centre des cellules
-        ax.set_xticks([i + 0.5 for i in range(n)], minor=True)
-        ax.set_yticks([i + 0.5 for i in range(n)], minor=True)
+        # Agrégation par blocs de taille x taille stations
+        taille = max(1, -(-n // self.TAILLE_MAX_IMAGE))
+        if taille > 1:
+            k = -(-n // taille)
+            bloc = np.full((k * taille, k * taille), np.nan)
+            bloc[:n, :n] = data
+            bloc = bloc.reshape(k, taille, k, taille).swapaxes(1, 2).reshape(k, k, -1)
+            data = self._agreger(bloc, agregation)
 
-        ax.set_xticklabels(self.stations, minor=True, rotation=90)
-        ax.set_yticklabels(self.stations, minor=True)
+        return self._dessiner_heatmap(data, titre, ordre, taille, agregation, fichier)
 
-        # Affichage de la grille principale
-        ax.grid(which="major", color="black", linewidth=0.6)
+    def heatmap_reseau(self, critere="temps", fichier=None, ordre=None, agregation="min"):
+        """
+        Heatmap construite directement à partir des routes du réseau, sans matrice n × n :
+        chaque route est versée dans le bloc (ou la case) de ses deux stations.
+        Adaptée aux grands réseaux, dont la matrice complète ne tiendrait pas en mémoire.
+        """
+        if critere not in ("temps", "distance"):
+            raise ValueError(f"Critère inconnu : {critere}")
+        if agregation not in ("min", "mean"):
+            raise ValueError(f"Agrégation inconnue : {agregation}")
+        n = len(self.reseau.stations)
+        ordre = self.ordre_stations(ordre)
+        rang = np.empty(n, dtype=np.intp)
+        rang[ordre] = np.arange(n)
+
+        taille = max(1, -(-n // self.TAILLE_MAX_IMAGE))
+        k = -(-n // taille)
+
+        aretes = list(self.reseau.aretes())
+        if aretes:
+            i, j, distances, temps = (np.array(colonne) for colonne in zip(*aretes))
+            poids = (temps if critere == "temps" else distances).astype(np.float64)
+            bi = rang[i.astype(np.intp)] // taille
+            bj = rang[j.astype(np.intp)] // taille
+            # Liaisons bidirectionnelles : chaque route compte dans les deux blocs symétriques
+            cases = np.concatenate((bi * k + bj, bj * k + bi))
+            poids = np.concatenate((poids, poids))
+        else:
+            cases = np.empty(0, dtype=np.intp)
+            poids = np.empty(0)
 
-        # Masquage des ticks principaux
-        ax.tick_params(
-            which="major",
-            bottom=False,
-            left=False,
-            labelbottom=False,
-            labelleft=False
-        )
+        if agregation == "min":
+            data = np.full(k * k, np.inf)
+            np.minimum.at(data, cases, poids)
+            data[np.isinf(data)] = np.nan
+        else:
+            sommes = np.bincount(cases, weights=poids, minlength=k * k)
+            effectifs = np.bincount(cases, minlength=k * k)
+            data = np.full(k * k, np.nan)
+            np.divide(sommes, effectifs, out=data, where=effectifs > 0)
 
-        plt.title(titre)
-        plt.tight_layout()
-        plt.show()
+        titre = "Heatmap des temps" if critere == "temps" else "Heatmap des distances"
+        return self._dessiner_heatmap(data.reshape(k, k), titre, ordre, taille, agregation, fichier)
 
-    def heatmap_temps(self):
+    def heatmap_temps(self, fichier=None, ordre=None, agregation="min"):
         """
         Heatmap de la matrice des temps (en minutes).
         """
-        self.heatmap(self.reseau.matrice_temps, "Heatmap des temps")
+        return self.heatmap_reseau("temps", fichier, ordre, agregation)
 
-    def heatmap_distances(self):
+    def heatmap_distances(self, fichier=None, ordre=None, agregation="min"):
         """
         Heatmap de la matrice des distances (en kilomètres).
         """
-        self.heatmap(self.reseau.matrice_distances, "Heatmap des distances")
+        return self.heatmap_reseau("distance", fichier, ordre, agregation)
 
-    # AFFICHAGE DU RÉSEAU COMPLET
-    def afficher_reseau_complet(self):
+    # ORDRE DES STATIONS
+    def ordre_stations(self, ordre=None):
         """
-        Affiche le réseau urbain complet sous forme de graphe.
+        Retourne le tableau des index de stations dans l’ordre d’affichage.
+        - None : ordre des index du réseau
+        - "composantes" : stations regroupées par composante connexe
+        - "bfs" : ordre de parcours en largeur (ParcoursReseau), composante par composante
+        - liste de noms : ordre explicite (chaque station exactement une fois)
+        Regrouper les stations proches fait apparaître la structure en blocs de la matrice.
+        """
+        stations = self.reseau.stations
+        n = len(stations)
+        if ordre is None:
+            return np.arange(n)
+
+        if ordre == "composantes":
+            composantes = IndexConnexite(self.reseau).composante_par_index
+            return np.argsort(np.array(composantes, dtype=np.intp), kind="stable")
+
+        if ordre == "bfs":
+            parcours = ParcoursReseau(self.reseau)
+            index = self.reseau.index_par_nom
+            vues = bytearray(n)
+            resultat = []
+            for depart, station in enumerate(stations):
+                if not vues[depart]:
+                    for nom in parcours.bfs(station.nom):
+                        vues[index[nom]] = 1
+                        resultat.append(index[nom])
+            return np.array(resultat, dtype=np.intp)
+
+        if isinstance(ordre, str):
+            raise ValueError(f"Ordre inconnu : {ordre}")
+        index = self.reseau.index_par_nom
+        inconnues = [nom for nom in ordre if nom not in index]
+        if inconnues:
+            raise ValueError(f"Station inconnue : {inconnues[0]}")
+        resultat = np.array([index[nom] for nom in ordre], dtype=np.intp)
+        if len(resultat) != n or len(np.unique(resultat)) != n:
+            raise ValueError("L’ordre doit citer chaque station du réseau exactement une fois")
+        return resultat
+
+    @staticmethod
+    def _agreger(blocs, agregation):
         """
-        n = len(self.stations)
+        Réduit la dernière dimension de blocs (valeurs d’un bloc, NaN : pas de liaison)
+        à leur minimum ou leur moyenne ; un bloc sans liaison vaut NaN.
+        """
+        presentes = np.isfinite(blocs)
+        effectifs = presentes.sum(axis=-1)
+        if agregation == "min":
+            data = np.where(presentes, blocs, np.inf).min(axis=-1)
+        elif agregation == "mean":
+            data = np.where(presentes, blocs, 0.0).sum(axis=-1) / np.maximum(effectifs, 1)
+        else:
+            raise ValueError(f"Agrégation inconnue : {agregation}")
+        data[effectifs == 0] = np.nan
+        return data
 
-        # Placement circulaire des stations
-        angles = [2 * math.pi * i / n for i in range(n)]
-        pos = {
-            self.stations[i]: (
-                math.cos(angles[i]),
-                math.sin(angles[i])
+    def _dessiner_heatmap(self, data, titre, ordre, taille, agregation, fichier):
+        """
+        Trace l’image d’une heatmap (k × k cases, chacune une station ou un bloc
+        de taille stations). Les noms des stations ne sont affichés que s’ils
+        tiennent dans leur case (et jamais pour des blocs).
+        """
+        k = len(data)
+        if taille > 1:
+            titre = f"{titre} – blocs de {taille} stations ({agregation})"
+
+        # Hauteur disponible pour une case, en points (environ 70 % de la figure)
+        police = min(10, 9 * 72 * 0.7 / max(k, 1))
+        etiquettes = None
+        if taille == 1 and police >= self.TAILLE_POLICE_MIN:
+            etiquettes = tuple(self.reseau.stations[i].nom for i in ordre)
+
+        figure, ax, nouveau = self._preparer(("heatmap", k, etiquettes), (9, 9))
+
+        if nouveau:
+            from matplotlib.colors import LinearSegmentedColormap
+
+            # Définition du dégradé bleu → rouge
+            cmap = LinearSegmentedColormap.from_list(
+                "blue_red",
+                ["blue", "red"]
             )
-            for i in range(n)
-        }
-
-        plt.figure(figsize=(10, 10))
-
-        # Tracé des arêtes du réseau
-        for i in range(n):
-            for j in range(i + 1, n):
-                if self.reseau.matrice_temps[i][j] != -1:
-                    s1 = self.stations[i]
-                    s2 = self.stations[j]
-                    x1, y1 = pos[s1]
-                    x2, y2 = pos[s2]
-                    plt.plot(
-                        [x1, x2],
-                        [y1, y2],
-                        color="lightgray",
-                        linewidth=2,
-                        zorder=1
-                    )
-
-        # Tracé des sommets et de leurs labels
-        for station, (x, y) in pos.items():
-            plt.scatter(x, y, color="black", s=40, zorder=2)
-            plt.text(
-                x * 1.08,
-                y * 1.08,
-                station,
-                fontsize=10,
-                ha="center",
-                va="center"
+            cmap.set_bad(color="white")
+
+            # Affichage de la matrice
+            self._image = ax.imshow(
+                data,
+                cmap=cmap,
+                origin="upper",
+                extent=[0, k, k, 0],
+                interpolation="nearest"
             )
 
-        plt.title("Réseau urbain – vue complète")
-        plt.axis("off")
-        plt.tight_layout()
-        plt.show()
+            # Barre de couleur
+            figure.colorbar(self._image, ax=ax)
 
-    # DIJKSTRA
-    def dijkstra(self, depart, arrivee, matrice):
-        """
-        Algorithme de Dijkstra permettant de calculer le plus court chemin
-        entre deux stations à partir d'une matrice de poids.
-        """
-        n = len(self.stations)
-        depart_i = self.index[depart]
-        arrivee_i = self.index[arrivee]
+            if etiquettes is not None:
+                # Définition de la grille : une case par cellule
+                ax.set_xticks(range(k + 1))
+                ax.set_yticks(range(k + 1))
 
-        # Initialisation des structures
-        dist = [math.inf] * n
-        precedent = [None] * n
-        visites = [False] * n
+                # Placement des labels au centre des cellules
+                ax.set_xticks([i + 0.5 for i in range(k)], minor=True)
+                ax.set_yticks([i + 0.5 for i in range(k)], minor=True)
 
-        dist[depart_i] = 0
+                ax.set_xticklabels(etiquettes, minor=True, rotation=90, fontsize=police)
+                ax.set_yticklabels(etiquettes, minor=True, fontsize=police)
 
-        # Boucle principale de Dijkstra
-        for _ in range(n):
-            u = None
-            min_dist = math.inf
+                # Affichage de la grille principale
+                ax.grid(which="major", color="black", linewidth=0.6)
 
-            # Sélection du sommet non visité le plus proche
-            for i in range(n):
-                if not visites[i] and dist[i] < min_dist:
-                    min_dist = dist[i]
-                    u = i
+                # Masquage des ticks principaux
+                ax.tick_params(
+                    which="major",
+                    bottom=False,
+                    left=False,
+                    labelbottom=False,
+                    labelleft=False
+                )
+            else:
+                # Trop de cases : ni noms ni grille, qui seraient illisibles
+                ax.set_xticks([])
+                ax.set_yticks([])
+        else:
+            # Même grille : seules les valeurs et l’échelle de couleurs changent
+            self._image.set_data(data)
+            if np.isfinite(data).any():
+                self._image.set_clim(np.nanmin(data), np.nanmax(data))
+
+        ax.set_title(titre)
+        if nouveau:
+            figure.tight_layout()
+        return self._terminer(figure, fichier)
+
+    # AFFICHAGE DES STATIONS
+    def _dessiner_stations(self, ax, taille=40):
+        """
+        Trace les sommets (un seul nuage de points) et, si le réseau est assez petit
+        pour qu’ils restent lisibles, leurs labels.
+        """
+        x, y = self.disposition.positions()
+        n = len(x)
+        if n > self.MAX_LABELS:
+            taille = 2
+        ax.scatter(x, y, color="black", s=taille, zorder=2)
+
+        if n <= self.MAX_LABELS:
+            for station, xi, yi in zip(self.stations, x, y):
+                ax.annotate(
+                    station,
+                    (xi, yi),
+                    xytext=(0, 6),
+                    textcoords="offset points",
+                    fontsize=10,
+                    ha="center",
+                    va="bottom"
+                )
+        ax.set_aspect("equal")
 
-            if u is None:
-                break
+    # AFFICHAGE DU RÉSEAU COMPLET
+    def afficher_reseau_complet(self, fichier=None):
+        """
+        Affiche le réseau urbain complet sous forme de graphe.
+        - fichier : chemin du fichier où enregistrer la figure (optionnel)
+        """
+        # Le fond dépend des routes : il est redessiné à chaque modification du réseau
+        figure, ax, nouveau = self._preparer(("reseau", self.reseau.version), (10, 10))
 
-            visites[u] = True
+        if nouveau:
+            from matplotlib.collections import LineCollection
 
-            # Relaxation des arêtes sortantes
-            for v in range(n):
-                poids = matrice[u][v]
-                if poids != -1 and not visites[v]:
-                    if dist[u] + poids < dist[v]:
-                        dist[v] = dist[u] + poids
-                        precedent[v] = u
+            # Tracé des arêtes du réseau : une seule collection pour toutes les routes
+            ax.add_collection(LineCollection(
+                self.disposition.segments(),
+                colors="lightgray",
+                linewidths=2 if len(self.reseau.stations) <= self.MAX_LABELS else 0.5,
+                zorder=1
+            ))
 
-        # Si l'arrivée est inatteignable
-        if dist[arrivee_i] == math.inf:
-            return None, math.inf
+            # Tracé des sommets et de leurs labels
+            self._dessiner_stations(ax)
 
-        # Reconstruction du chemin
-        chemin = []
-        cur = arrivee_i
-        while cur is not None:
-            chemin.insert(0, self.stations[cur])
-            cur = precedent[cur]
+            ax.set_title("Réseau urbain – vue complète")
+            ax.axis("off")
+            figure.tight_layout()
+        return self._terminer(figure, fichier)
 
-        return chemin, dist[arrivee_i]
+    # DIJKSTRA
+    def dijkstra(self, depart, arrivee, matrice):
+        """
+        Calcule le plus court chemin entre deux stations.
+        Le calcul est délégué au moteur d'itinéraires (Dijkstra sur tas binaire).
+        - matrice : "temps", "distance", matrice de poids ou listes d'adjacence
+        """
+        return self.moteur.dijkstra(depart, arrivee, matrice)
 
     # AFFICHAGE DU PLUS COURT CHEMIN
-    def afficher_plus_court_chemin(self, depart, arrivee, mode="temps"):
+    def afficher_plus_court_chemin(self, depart, arrivee, mode="temps", fichier=None):
         """
         Affiche graphiquement le plus court chemin entre deux stations,
         selon le critère temps ou distance.
+        Retourne la figure, ou None s’il n’existe aucun chemin.
         """
-        matrice = (
-            self.reseau.matrice_temps
-            if mode == "temps"
-            else self.reseau.matrice_distances
-        )
+        critere = "temps" if mode == "temps" else "distance"
 
-        chemin, cout = self.dijkstra(depart, arrivee, matrice)
+        chemin, cout = self.moteur.dijkstra(depart, arrivee, critere)
 
         if chemin is None:
             print("Aucun chemin possible.")
-            return
+            return None
 
         # Mise en forme du coût avec unité
         if mode == "temps":
@@ -232,69 +432,106 @@ class AffichageReseau:
         else:
             cout_affiche = f"{round(cout)} km"
 
-        self._affichage_graphe(
+        return self._affichage_graphe(
             chemins=[(chemin, "red")],
-            titre=f"Plus court chemin ({mode}) – coût ≈ {cout_affiche}"
+            titre=f"Plus court chemin ({mode}) – coût ≈ {cout_affiche}",
+            fichier=fichier
         )
 
     # COMPARAISON DE DEUX TRAJETS
-    def afficher_deux_trajets(self, trajet1, trajet2):
+    def afficher_deux_trajets(self, trajet1, trajet2, fichier=None):
         """
         Affiche deux trajets différents sur le même graphe
         afin de permettre leur comparaison visuelle.
         """
-        self._affichage_graphe(
+        return self._affichage_graphe(
             chemins=[
                 (trajet1, "red"),
                 (trajet2, "blue")
             ],
-            titre="Comparaison de deux trajets"
+            titre="Comparaison de deux trajets",
+            fichier=fichier
+        )
+
+    # AFFICHAGE DE CHEMINS ALTERNATIFS
+    def afficher_alternatives(self, chemins, titre="Chemins alternatifs", fichier=None):
+        """
+        Affiche plusieurs chemins alternatifs (par exemple les k plus courts)
+        sur le même graphe, chacun dans une couleur différente.
+        - chemins : liste de listes de noms de stations
+        """
+        return self._affichage_graphe(
+            chemins=[
+                (chemin, self.COULEURS[i % len(self.COULEURS)])
+                for i, chemin in enumerate(chemins)
+            ],
+            titre=titre,
+            fichier=fichier
         )
 
     # AFFICHAGE GRAPHIQUE DES CHEMINS
-    def _affichage_graphe(self, chemins, titre):
+    def _affichage_graphe(self, chemins, titre, fichier=None):
         """
         Affiche un graphe contenant uniquement les chemins fournis.
         """
-        n = len(self.stations)
+        x, y = self.disposition.positions()
 
-        angles = [2 * math.pi * i / n for i in range(n)]
-        pos = {
-            self.stations[i]: (
-                math.cos(angles[i]),
-                math.sin(angles[i])
-            )
-            for i in range(n)
-        }
-
-        plt.figure(figsize=(10, 10))
-
-        # Affichage des sommets
-        for station, (x, y) in pos.items():
-            plt.scatter(x, y, color="black", zorder=2)
-            plt.text(
-                x * 1.08,
-                y * 1.08,
-                station,
-                fontsize=10,
-                ha="center",
-                va="center"
-            )
+        figure, ax, nouveau = self._preparer(("stations", self.reseau.version), (10, 10))
 
-        # Affichage des chemins
-        for chemin, couleur in chemins:
-            for i in range(len(chemin) - 1):
-                x1, y1 = pos[chemin[i]]
-                x2, y2 = pos[chemin[i + 1]]
-                plt.plot(
-                    [x1, x2],
-                    [y1, y2],
-                    color=couleur,
-                    linewidth=4,
-                    zorder=3
-                )
+        # Affichage des sommets (fond commun à tous les chemins)
+        if nouveau:
+            self._dessiner_stations(ax, taille=None)
+            ax.axis("off")
 
-        plt.title(titre)
-        plt.axis("off")
-        plt.tight_layout()
-        plt.show()
+        # Affichage des chemins : une ligne brisée par chemin
+        for chemin, couleur in chemins:
+            indices = [self.index[station] for station in chemin]
+            self._artistes.extend(ax.plot(
+                x[indices],
+                y[indices],
+                color=couleur,
+                linewidth=4,
+                zorder=3
+            ))
+
+        ax.set_title(titre)
+        if nouveau:
+            figure.tight_layout()
+        return self._terminer(figure, fichier)
+
+    # EXPORT EN LOT
+    def exporter_plus_courts_chemins(self, paires, dossier, mode="temps", format_fichier="png"):
+        """
+        Enregistre le schéma du plus court chemin de chaque couple (départ, arrivée)
+        dans un dossier, sans affichage (la figure est réutilisée d’un schéma à l’autre).
+        Les couples sans chemin sont ignorés.
+        Retourne la liste des fichiers écrits.
+        """
+        if not self.sans_affichage:
+            raise ValueError("L’export en lot nécessite le mode sans affichage")
+        os.makedirs(dossier, exist_ok=True)
+
+        fichiers = []
+        for numero, (depart, arrivee) in enumerate(paires):
+            nom = re.sub(r"[^\w-]+", "_", f"{depart}-{arrivee}")
+            fichier = os.path.join(dossier, f"{numero:04d}_{nom}_{mode}.{format_fichier}")
+            if self.afficher_plus_court_chemin(depart, arrivee, mode, fichier) is not None:
+                fichiers.append(fichier)
+        return fichiers
+
+    def exporter_heatmaps(self, dossier, format_fichier="png"):
+        """
+        Enregistre les heatmaps des temps et des distances dans un dossier, sans affichage.
+        Retourne la liste des fichiers écrits.
+        """
+        if not self.sans_affichage:
+            raise ValueError("L’export en lot nécessite le mode sans affichage")
+        os.makedirs(dossier, exist_ok=True)
+
+        fichiers = [
+            os.path.join(dossier, f"heatmap_temps.{format_fichier}"),
+            os.path.join(dossier, f"heatmap_distances.{format_fichier}"),
+        ]
+        self.heatmap_temps(fichiers[0])
+        self.heatmap_distances(fichiers[1])
+        return fichiers
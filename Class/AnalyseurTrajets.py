@@ -1,4 +1,50 @@
+from collections import OrderedDict
+
 from Class.Distance import Distance
+from Class.IndexConnexite import IndexConnexite
+from Class.TrajetObserve import TrajetObserve
+from Class.StockageTrajets import StockageTrajets
+from Class.MatricesNumpy import MatricesNumpy, np
+from csv_files.ReadCSV import BASE_PATH, iter_csv_trajets, iter_chunks
+
+
+def _medianes_par_groupe(groupes, valeurs, nb_groupes):
+    """
+    Médiane des valeurs de chaque groupe (NaN pour un groupe vide), sans boucle Python :
+    après un tri par (groupe, valeur), la médiane d’un groupe se lit au milieu de sa tranche.
+    Retourne (médianes, effectifs).
+    """
+    ordre = np.lexsort((valeurs, groupes))
+    valeurs_triees = valeurs[ordre]
+    effectifs = np.bincount(groupes, minlength=nb_groupes)
+    debuts = np.cumsum(effectifs) - effectifs
+
+    medianes = np.full(nb_groupes, np.nan)
+    non_vides = effectifs > 0
+    bas = (debuts + (effectifs - 1) // 2)[non_vides]
+    haut = (debuts + effectifs // 2)[non_vides]
+    medianes[non_vides] = (valeurs_triees[bas] + valeurs_triees[haut]) / 2
+    return medianes, effectifs
+
+
+def _z_robustes(groupes, valeurs, nb_groupes, echelle_min=0.0):
+    """
+    Score z robuste de chaque valeur au sein de son groupe : (x - médiane) / (1.4826 × MAD).
+    Si la MAD d’un groupe est nulle, l’écart absolu moyen (× 1.2533) la remplace ;
+    l’échelle d’un groupe ne descend jamais sous echelle_min (petits groupes peu dispersés).
+    Retourne (scores, effectif du groupe de chaque valeur, échelle de chaque groupe).
+    """
+    medianes, effectifs = _medianes_par_groupe(groupes, valeurs, nb_groupes)
+    ecarts = np.abs(valeurs - medianes[groupes])
+    mad, _ = _medianes_par_groupe(groupes, ecarts, nb_groupes)
+
+    moyens = np.bincount(groupes, weights=ecarts, minlength=nb_groupes) / np.maximum(effectifs, 1)
+    echelles = np.maximum(np.where(mad > 0, 1.4826 * mad, 1.2533 * moyens), echelle_min)
+
+    scores = np.zeros(len(valeurs))
+    dispersees = echelles[groupes] > 0
+    scores[dispersees] = (valeurs - medianes[groupes])[dispersees] / echelles[groupes][dispersees]
+    return scores, effectifs[groupes], echelles
 
 
 class AnalyseurTrajets:
@@ -21,45 +67,115 @@ class AnalyseurTrajets:
     # En dessous, la mesure est considérée comme anormalement faible
     MIN_RATIO = 0.7
 
-    def __init__(self, reseau, trajets_observes):
+    # Nombre de suites de stations dont le calcul théorique est gardé en cache
+    TAILLE_CACHE = 10000
+
+    def __init__(self, reseau, trajets_observes, taille_cache=TAILLE_CACHE):
+        """
+        - reseau : instance de ReseauUrbain
+        - trajets_observes : liste ou itérable de TrajetObserve (un générateur
+          tel que trajets_depuis_csv() est consommé en un seul passage)
+        - taille_cache : nombre de résultats de calcul_theorie_trajet conservés
+          (les plus récemment utilisés) ; 0 désactive le cache
+        """
         self.reseau = reseau
         self.trajets_observes = trajets_observes
+        self.connexite = None
+
+        # Cache LRU des calculs théoriques : les usagers refont souvent les mêmes trajets
+        self.taille_cache = taille_cache
+        self.cache_theorie = OrderedDict()  # Tuple des indices des stations -> Distance
+        self.version_cache = None
+        self.succes_cache = 0               # Calculs évités grâce au cache
+        self.echecs_cache = 0               # Calculs effectués (absents du cache)
+
+    @staticmethod
+    def trajets_depuis_csv(base_path=BASE_PATH):
+        """
+        Générateur de TrajetObserve lus en flux depuis le fichier des trajets.
+        """
+        for id_trajet, stations, temps_mesure, distance_mesuree in iter_csv_trajets(base_path):
+            yield TrajetObserve(id_trajet, stations, temps_mesure, distance_mesuree)
+
+    def index_connexite(self):
+        """
+        Retourne l’index des composantes connexes du réseau.
+        Il n’est construit qu’une fois, puis recalculé uniquement
+        si le réseau a été modifié entre-temps.
+        """
+        if self.connexite is None:
+            self.connexite = IndexConnexite(self.reseau)
+        else:
+            self.connexite.mettre_a_jour()
+        return self.connexite
 
     def calcul_theorie_trajet(self, trajet):
         """
         Calcule la distance et le temps théoriques d’un trajet
-        en se basant sur les matrices du réseau.
+        en se basant sur les listes d’adjacence du réseau.
 
         Cette méthode permet également d’identifier les segments
         inexistants entre deux stations consécutives.
-        """
 
+        Le résultat est mis en cache, indexé par la suite des indices de stations :
+        un même objet Distance est renvoyé pour des trajets identiques
+        (il ne doit donc pas être modifié). Les trajets passant par une station
+        inconnue ne sont pas mis en cache.
+        """
+        if self.taille_cache <= 0:
+            return self._calcul_theorie(trajet)
+
+        # Le cache est vidé dès que le réseau a été modifié
+        if self.version_cache != self.reseau.version:
+            self.cache_theorie.clear()
+            self.version_cache = self.reseau.version
+
+        cle = tuple(map(self.reseau.index_par_nom.get, trajet.nomsStations))
+        if None in cle:
+            return self._calcul_theorie(trajet)
+
+        resultat = self.cache_theorie.get(cle)
+        if resultat is not None:
+            self.cache_theorie.move_to_end(cle)
+            self.succes_cache += 1
+            return resultat
+
+        self.echecs_cache += 1
+        resultat = self._calcul_theorie(trajet)
+        self.cache_theorie[cle] = resultat
+        if len(self.cache_theorie) > self.taille_cache:
+            self.cache_theorie.popitem(last=False)
+        return resultat
+
+    def _calcul_theorie(self, trajet):
+        """
+        Calcul théorique proprement dit, sans cache.
+        """
         distance_totale = 0
         temps_total = 0
         segments_inexistants = []
 
         stations = trajet.nomsStations
+        connexite = self.index_connexite()
 
         for i in range(len(stations) - 1):
             depart = stations[i]
             arrivee = stations[i + 1]
 
-            # Vérifie, via un parcours en profondeur (DFS),
+            # Vérifie, via l’index des composantes connexes,
             # si la station d’arrivée est atteignable depuis la station de départ
-            stations_atteignables = self.parcours.dfs(depart)
-
             # Si l’arrivée n’est pas atteignable, le segment est inexistant
             # Le calcul théorique ne peut pas continuer sur ce segment
-            if arrivee not in stations_atteignables:
+            if not connexite.atteignable(depart, arrivee):
                 segments_inexistants.append((depart, arrivee))
                 continue
 
-            # Accès aux indices des stations dans les matrices du réseau
+            # Accès aux indices des stations dans les listes d’adjacence du réseau
             i_dep = self.reseau.index_par_nom[depart]
             i_arr = self.reseau.index_par_nom[arrivee]
 
-            dist = self.reseau.matrice_distances[i_dep][i_arr]
-            temps = self.reseau.matrice_temps[i_dep][i_arr]
+            dist = self.reseau.adjacence_distances[i_dep].get(i_arr, -1)
+            temps = self.reseau.adjacence_temps[i_dep].get(i_arr, -1)
 
             # Une valeur négative indique une liaison absente ou invalide
             if dist < 0 or temps < 0:
@@ -70,10 +186,16 @@ class AnalyseurTrajets:
 
         return Distance(distance_totale, temps_total, segments_inexistants)
 
-    def calcul_theorie_tous_trajets(self):
+    def calcul_theorie_tous_trajets(self, vectorise=False):
         """
         Calcule les valeurs théoriques pour l’ensemble des trajets observés.
+
+        Avec vectorise=True, les trajets dont toutes les stations sont connues
+        sont évalués en bloc par le backend NumPy du réseau (nécessite NumPy).
         """
+        if vectorise:
+            return self._calcul_theorie_vectorise(list(self.trajets_observes))
+
         resultats = []
 
         for trajet in self.trajets_observes:
@@ -82,6 +204,211 @@ class AnalyseurTrajets:
 
         return resultats
 
+    def calcul_theorie_par_lots(self, taille_lot=10000):
+        """
+        Générateur : calcule les valeurs théoriques par lots de taille_lot trajets,
+        chaque lot étant évalué en bloc par le backend NumPy.
+        La mémoire reste bornée même pour un flux de trajets très long.
+        """
+        for lot in iter_chunks(self.trajets_observes, taille_lot):
+            yield self._calcul_theorie_vectorise(lot)
+
+    def _calcul_theorie_vectorise(self, trajets):
+        """
+        Version vectorisée du calcul théorique d’une liste de trajets.
+        Les trajets contenant une station inconnue repassent par le calcul unitaire.
+        """
+        resultats = [None] * len(trajets)
+        index = self.reseau.index_par_nom
+
+        # Concaténation des indices de stations des trajets évaluables en bloc
+        lot = []
+        indices = []
+        longueurs = []
+        for k, trajet in enumerate(trajets):
+            stations = trajet.nomsStations
+            if all(station in index for station in stations):
+                lot.append(k)
+                indices.extend(index[station] for station in stations)
+                longueurs.append(len(stations))
+            else:
+                resultats[k] = (trajet.idTraj, self.calcul_theorie_trajet(trajet))
+
+        distances, temps, manquants = self.reseau.aretes_numpy().cout_trajets(indices, longueurs)
+
+        segments = [[] for _ in lot]
+        for t, i, j in manquants.tolist():
+            segments[t].append((self.reseau.stations[i].nom, self.reseau.stations[j].nom))
+
+        for t, k in enumerate(lot):
+            resultats[k] = (
+                trajets[k].idTraj,
+                Distance(float(distances[t]), float(temps[t]), segments[t])
+            )
+
+        return resultats
+
+    # ======================================================
+    # SCORES STATISTIQUES ROBUSTES (VECTORISÉS)
+    # ======================================================
+
+    # Score robuste (en valeur absolue) au-delà duquel une mesure est atypique
+    SEUIL_SCORE = 3.5
+
+    # Nombre minimal de trajets d’une même origine-destination (ou sur un même segment)
+    # pour les comparer entre eux ; en dessous, la comparaison se fait sur tout le lot
+    MIN_EFFECTIF = 5
+
+    def stockage_trajets(self):
+        """
+        Retourne les trajets observés sous forme de StockageTrajets (en colonnes).
+        """
+        if isinstance(self.trajets_observes, StockageTrajets):
+            return self.trajets_observes
+        return StockageTrajets.depuis_lignes(
+            (trajet.idTraj, trajet.nomsStations, trajet.tpsMesure, trajet.distMesure)
+            for trajet in self.trajets_observes
+        )
+
+    def scores_robustes(self, seuil=SEUIL_SCORE, min_effectif=MIN_EFFECTIF):
+        """
+        Évalue tous les trajets en bloc (nécessite NumPy) :
+        - valeurs théoriques par lecture groupée des poids des segments ;
+        - rapport mesure / théorie de chaque trajet, en échelle logarithmique ;
+        - score z robuste (médiane / MAD) de ce rapport parmi les trajets de même
+          origine-destination, ou parmi tout le lot si ceux-ci sont trop peu nombreux
+          (la dispersion du lot sert de plancher à celle d’une origine-destination) ;
+        - score robuste de chaque segment : rapport médian (temps) des trajets
+          qui l’empruntent, comparé à celui des autres segments.
+
+        Contrairement au seuil fixe de ±30 %, la tolérance s’adapte à la dispersion
+        réellement observée : un lot de mesures bruitées ne déclenche pas d’alerte,
+        alors qu’un écart franc par rapport aux trajets comparables est signalé.
+
+        Les trajets non évaluables (station inconnue, route inexistante, mesure absente)
+        ont des scores NaN : ils relèvent des contrôles de detection_anomalies.
+
+        :return: dictionnaire avec :
+                 - "ids" : identifiants des trajets
+                 - "temps_theorique", "distance_theorique", "z_temps", "z_distance" : tableaux NumPy
+                 - "anomalies" : identifiant -> messages, pour les trajets dont un score dépasse le seuil
+                 - "segments" : (départ, arrivée, nb de trajets, rapport médian, score),
+                   par score décroissant en valeur absolue
+        """
+        if np is None:
+            raise ImportError("Les scores robustes nécessitent NumPy")
+
+        stockage = self.stockage_trajets()
+        nb_trajets = len(stockage)
+        n = len(self.reseau.stations)
+
+        # Indices réseau de tous les arrêts (-1 : station inconnue)
+        correspondance = np.asarray(stockage.correspondance_reseau(self.reseau), dtype=np.intp)
+        indices = correspondance[np.asarray(stockage.indices, dtype=np.intp)]
+        longueurs = np.diff(np.asarray(stockage.offsets, dtype=np.intp))
+
+        # Segments de tous les trajets et lecture groupée de leurs poids
+        trajets, departs, arrivees = MatricesNumpy.segments_trajets(indices, longueurs)
+        inconnus = (departs < 0) | (arrivees < 0)
+        aretes = self.reseau.aretes_numpy()
+        distances, temps = aretes.cout_segments(np.where(inconnus, 0, departs), np.where(inconnus, 0, arrivees))
+        invalides = inconnus | ~np.isfinite(distances) | ~np.isfinite(temps)
+
+        temps_theorique = np.bincount(trajets, weights=np.where(invalides, 0.0, temps), minlength=nb_trajets)
+        distance_theorique = np.bincount(trajets, weights=np.where(invalides, 0.0, distances), minlength=nb_trajets)
+
+        # Trajets évaluables : au moins un segment, aucun segment invalide
+        nb_invalides = np.bincount(trajets, weights=invalides, minlength=nb_trajets)
+        evaluables = (longueurs >= 2) & (nb_invalides == 0)
+
+        # Origine-destination de chaque trajet (première et dernière station)
+        # (seuls les trajets évaluables, donc non vides, sont utilisés)
+        offsets = np.asarray(stockage.offsets, dtype=np.intp)
+        dernier = max(len(indices) - 1, 0)
+        origines = indices[np.clip(offsets[:-1], 0, dernier)] if len(indices) else offsets[:-1]
+        destinations = indices[np.clip(offsets[1:] - 1, 0, dernier)] if len(indices) else offsets[:-1]
+
+        scores = {}
+        for critere, mesures, theorie in (
+            ("temps", np.asarray(stockage.tps_mesures), temps_theorique),
+            ("distance", np.asarray(stockage.dist_mesures), distance_theorique),
+        ):
+            valides = evaluables & (theorie > 0) & (mesures > 0)     # NaN exclus
+            z = np.full(nb_trajets, np.nan)
+            if valides.any():
+                rapports = np.log(mesures[valides] / theorie[valides])
+                cles = origines[valides] * n + destinations[valides]
+                _, groupes = np.unique(cles, return_inverse=True)
+                groupes = groupes.ravel()
+
+                # La dispersion de tout le lot sert de plancher à celle de chaque origine-destination
+                z_lot, _, echelle_lot = _z_robustes(np.zeros(len(rapports), dtype=np.intp), rapports, 1)
+                z_od, effectifs, _ = _z_robustes(groupes, rapports, groupes.max() + 1, echelle_lot[0])
+                z[valides] = np.where(effectifs >= min_effectif, z_od, z_lot)
+            scores[critere] = z
+
+        return {
+            "ids": list(stockage.ids),
+            "temps_theorique": temps_theorique,
+            "distance_theorique": distance_theorique,
+            "z_temps": scores["temps"],
+            "z_distance": scores["distance"],
+            "anomalies": self._anomalies_scores(stockage.ids, scores, seuil),
+            "segments": self._scores_segments(
+                trajets, departs, arrivees, temps_theorique, stockage, evaluables, min_effectif
+            ),
+        }
+
+    def _anomalies_scores(self, ids, scores, seuil):
+        """
+        Messages (catégorie MESURE) des trajets dont un score robuste dépasse le seuil.
+        """
+        anomalies = {}
+        libelles = {"temps": "Temps mesuré", "distance": "Distance mesurée"}
+
+        for critere, z in scores.items():
+            for k in np.flatnonzero(np.abs(np.nan_to_num(z)) > seuil).tolist():
+                if z[k] > 0:
+                    message = f"[ATTENTION] {libelles[critere]} atypique (trop élevé, score robuste {z[k]:.1f})"
+                else:
+                    message = f"[NOTICE] {libelles[critere]} atypique (trop faible, score robuste {z[k]:.1f})"
+                anomalies.setdefault(ids[k], []).append(message)
+
+        return anomalies
+
+    def _scores_segments(self, trajets, departs, arrivees, temps_theorique, stockage, evaluables, min_effectif):
+        """
+        Score robuste de chaque segment emprunté par au moins min_effectif trajets évaluables.
+        """
+        mesures = np.asarray(stockage.tps_mesures)
+        valides = evaluables & (temps_theorique > 0) & (mesures > 0)
+        garder = valides[trajets]
+        if not garder.any():
+            return []
+
+        n = len(self.reseau.stations)
+        rapports = np.log(mesures[trajets[garder]] / temps_theorique[trajets[garder]])
+        a = np.minimum(departs[garder], arrivees[garder])
+        b = np.maximum(departs[garder], arrivees[garder])
+        cles, groupes = np.unique(a * n + b, return_inverse=True)
+        groupes = groupes.ravel()
+
+        medianes, effectifs = _medianes_par_groupe(groupes, rapports, len(cles))
+        frequents = effectifs >= min_effectif
+        if not frequents.any():
+            return []
+
+        z, _, _ = _z_robustes(np.zeros(int(frequents.sum()), dtype=np.intp), medianes[frequents], 1)
+        stations = self.reseau.stations
+        segments = [
+            (stations[cle // n].nom, stations[cle % n].nom, int(effectif), float(np.exp(mediane)), float(score))
+            for cle, effectif, mediane, score in zip(
+                cles[frequents].tolist(), effectifs[frequents], medianes[frequents], z
+            )
+        ]
+        segments.sort(key=lambda segment: -abs(segment[4]))
+        return segments
+
     # Retourne la différence entre le temps de trajet mesuré
     # et le temps théorique, exprimée en pourcentage
     def comparaison_theorie_mesure(self, tpsTheorie, tpsMesure):
@@ -238,6 +565,36 @@ class AnalyseurTrajets:
 
         return anomalies
 
+    def regrouper_par_composante(self, anomalies):
+        """
+        Regroupe les identifiants des trajets anormaux par composante connexe
+        (« îlot ») du réseau, à partir du résultat de detection_anomalies.
+
+        Un trajet est rattaché à la composante de sa première station connue,
+        ou à None si aucune de ses stations n’existe dans le réseau.
+        Les trajets observés sont relus : ils doivent donc former une liste.
+        """
+        connexite = self.index_connexite()
+        groupes = {}
+
+        for trajet in self.trajets_observes:
+            traj_id = getattr(trajet, "idTraj", "INCONNU")
+            resultat = anomalies.get(traj_id)
+
+            # Seuls les trajets présentant au moins une anomalie sont regroupés
+            if resultat is None or not any(resultat.values()):
+                continue
+
+            composante = None
+            for station in getattr(trajet, "nomsStations", None) or []:
+                composante = connexite.composante(station)
+                if composante is not None:
+                    break
+
+            groupes.setdefault(composante, []).append(traj_id)
+
+        return groupes
+
 if __name__ == "__main__":
     analyseur=AnalyseurTrajets(None, None)
     print("BLABLABLA:")
@@ -0,0 +1,72 @@
+import math
+
+from Class.MatricesNumpy import MatricesNumpy, np
+
+
+class AretesNumpy:
+    """
+    Backend NumPy creux d’un réseau urbain : les seules routes existantes.
+
+    Chaque route est rangée deux fois (dans les deux sens) sous la clé i * n + j,
+    dans un tableau trié ; les poids de nombreux segments sont lus en bloc par
+    recherche dichotomique (np.searchsorted). La mémoire est proportionnelle
+    au nombre de routes, là où MatricesNumpy occupe deux matrices n × n :
+    c’est le backend des coûts de trajets, MatricesNumpy restant celui des
+    heatmaps et des calculs matriciels sur de petits réseaux.
+    """
+
+    def __init__(self, reseau):
+        """
+        Construit les tableaux de routes à partir des listes d’adjacence du réseau.
+        - reseau : instance de ReseauUrbain
+        """
+        if np is None:
+            raise ImportError("Le backend creux nécessite NumPy")
+
+        self.reseau = reseau
+        self.version = reseau.version
+        self.n = len(reseau.stations)
+
+        aretes = list(reseau.aretes())
+        if aretes:
+            i, j, distances, temps = (np.array(colonne) for colonne in zip(*aretes))
+            i = i.astype(np.int64)
+            j = j.astype(np.int64)
+            cles = np.concatenate((i * self.n + j, j * self.n + i))
+            ordre = np.argsort(cles, kind="stable")
+            self.cles = cles[ordre]
+            self.distances = np.concatenate((distances, distances)).astype(np.float64)[ordre]
+            self.temps = np.concatenate((temps, temps)).astype(np.float64)[ordre]
+        else:
+            self.cles = np.empty(0, dtype=np.int64)
+            self.distances = np.empty(0, dtype=np.float64)
+            self.temps = np.empty(0, dtype=np.float64)
+
+    # COÛTS DE SEGMENTS ET DE TRAJETS
+    def cout_segments(self, departs, arrivees):
+        """
+        Retourne les distances et les temps de plusieurs segments en une seule lecture
+        (même contrat que MatricesNumpy.cout_segments : +inf pour un segment inexistant).
+        """
+        departs = np.asarray(departs, dtype=np.int64)
+        arrivees = np.asarray(arrivees, dtype=np.int64)
+        distances = np.full(departs.shape, math.inf)
+        temps = np.full(departs.shape, math.inf)
+        if len(self.cles) == 0:
+            return distances, temps
+
+        cles = departs * self.n + arrivees
+        positions = np.minimum(np.searchsorted(self.cles, cles), len(self.cles) - 1)
+        trouves = self.cles[positions] == cles
+        distances[trouves] = self.distances[positions[trouves]]
+        temps[trouves] = self.temps[positions[trouves]]
+        return distances, temps
+
+    segments_trajets = staticmethod(MatricesNumpy.segments_trajets)
+
+    def cout_trajets(self, indices, longueurs):
+        """
+        Calcule en bloc les coûts théoriques d’un lot de trajets
+        (même contrat et même calcul que MatricesNumpy.cout_trajets).
+        """
+        return MatricesNumpy.cout_trajets(self, indices, longueurs)
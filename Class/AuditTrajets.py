@@ -0,0 +1,90 @@
+import os
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+
+from Class.AnalyseurTrajets import AnalyseurTrajets
+from Class.TrajetObserve import TrajetObserve
+from csv_files.ReadCSV import BASE_PATH, iter_csv_trajets, iter_chunks
+
+
+# Analyseur partagé par tous les lots traités dans un processus. Il est créé une
+# seule fois, au démarrage du processus, à partir du réseau (en lecture seule) :
+# son cache des calculs théoriques sert ainsi d’un lot à l’autre.
+_analyseur_processus = None
+
+
+def _initialiser_processus(reseau):
+    # Initialisation d'un processus de travail : crée l'analyseur partagé.
+    global _analyseur_processus
+    _analyseur_processus = AnalyseurTrajets(reseau, [])
+
+
+def _analyser_lot(lot, analyseur=None):
+    # Analyse un lot de lignes (id, stations, temps, distance) du CSV des trajets.
+    # Retourne la liste ordonnée des couples (id du trajet, anomalies).
+    if analyseur is None:
+        analyseur = _analyseur_processus
+    analyseur.trajets_observes = [TrajetObserve(*ligne) for ligne in lot]
+    return list(analyseur.detection_anomalies().items())
+
+
+class AuditTrajets:
+    """
+    Audit par lots des trajets observés, réparti sur plusieurs processus.
+
+    Les trajets sont lus en flux depuis le CSV, découpés en lots,
+    et chaque lot est analysé par AnalyseurTrajets dans un processus de travail
+    qui dispose d’une copie du réseau (en lecture seule).
+    Les résultats sont fusionnés dans l’ordre du fichier : la sortie est
+    identique à celle d’un appel à detection_anomalies sur l’ensemble des trajets.
+    """
+
+    def __init__(self, reseau, nb_processus=None, taille_lot=1000):
+        """
+        - reseau : instance de ReseauUrbain
+        - nb_processus : nombre de processus de travail (par défaut : nombre de cœurs) ;
+          avec 1, l’analyse est faite dans le processus courant
+        - taille_lot : nombre de trajets envoyés à un processus en une fois
+        """
+        self.reseau = reseau
+        self.nb_processus = nb_processus or os.cpu_count() or 1
+        self.taille_lot = taille_lot
+
+    def executer(self, lignes=None, base_path=BASE_PATH):
+        """
+        Lance l’audit et retourne le dictionnaire des anomalies par trajet
+        (même structure que AnalyseurTrajets.detection_anomalies).
+
+        :param lignes: itérable de lignes (id, stations, temps, distance) ;
+                       par défaut, le fichier des trajets est lu en flux
+        """
+        if lignes is None:
+            lignes = iter_csv_trajets(base_path)
+
+        lots = iter_chunks(lignes, self.taille_lot)
+        anomalies = {}
+
+        # Analyse séquentielle, sans création de processus
+        if self.nb_processus == 1:
+            analyseur = AnalyseurTrajets(self.reseau, [])
+            for lot in lots:
+                anomalies.update(_analyser_lot(lot, analyseur))
+            return anomalies
+
+        with ProcessPoolExecutor(
+            max_workers=self.nb_processus,
+            initializer=_initialiser_processus,
+            initargs=(self.reseau,)
+        ) as executeur:
+            # Nombre borné de lots en cours pour garder une mémoire constante :
+            # les résultats sont récupérés dans l’ordre de soumission
+            en_cours = deque()
+            for lot in lots:
+                en_cours.append(executeur.submit(_analyser_lot, lot))
+                if len(en_cours) >= 2 * self.nb_processus:
+                    anomalies.update(en_cours.popleft().result())
+
+            while en_cours:
+                anomalies.update(en_cours.popleft().result())
+
+        return anomalies
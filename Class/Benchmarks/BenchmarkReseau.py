@@ -0,0 +1,223 @@
+import argparse
+import json
+import os
+import platform
+import random
+import statistics
+import tempfile
+import time
+import timeit
+
+from Class.Benchmarks.GenerateurReseau import GenerateurReseau
+from Class.ReseauUrbain import ReseauUrbain
+from Class.ParcoursReseau import ParcoursReseau
+from Class.MoteurItineraire import MoteurItineraire
+from Class.AnalyseurTrajets import AnalyseurTrajets
+from Class.DetecteurFlux import DetecteurFlux
+from Class.TrajetObserve import TrajetObserve
+from Class.Horaires import Horaires
+from Class.MoteurHoraires import MoteurHoraires
+
+
+class BenchmarkReseau:
+    """
+    Micro-benchmarks des opérations principales sur des réseaux synthétiques
+    de tailles croissantes :
+    - chargement du réseau depuis les CSV
+    - parcours BFS et DFS
+    - plus court chemin (Dijkstra)
+    - détection d’anomalies sur des trajets observés
+    - arrivée au plus tôt sur une journée d’horaires (Connection Scan)
+
+    Les résultats sont sauvegardés en JSON pour être comparés d’une exécution à l’autre.
+    """
+
+    TAILLES_DEFAUT = (100, 1000, 10000)
+
+    def __init__(self, tailles=TAILLES_DEFAUT, degre_moyen=3.0, repetitions=5,
+                 nb_requetes=20, nb_trajets=1000, graine=0):
+        """
+        - tailles : nombres de stations des réseaux testés
+        - degre_moyen : densité des réseaux générés
+        - repetitions : nombre de mesures par cas (on retient le minimum et la médiane)
+        - nb_requetes : nombre de requêtes (parcours, plus courts chemins) par mesure
+        - nb_trajets : nombre de trajets analysés par mesure
+        """
+        self.tailles = tailles
+        self.degre_moyen = degre_moyen
+        self.repetitions = repetitions
+        self.nb_requetes = nb_requetes
+        self.nb_trajets = nb_trajets
+        self.graine = graine
+
+    # MESURE
+    def mesurer(self, fonction):
+        """
+        Exécute la fonction `repetitions` fois et retourne les temps minimal et médian (secondes).
+        """
+        temps = timeit.repeat(fonction, number=1, repeat=self.repetitions)
+        return {"min_s": min(temps), "mediane_s": statistics.median(temps)}
+
+    def _cas(self, generateur, reseau, dossier):
+        """
+        Retourne la liste des cas mesurés : (nom, nombre d’opérations, fonction).
+        """
+        aleatoire = random.Random(self.graine)
+        noms = generateur.noms
+        departs = [aleatoire.choice(noms) for _ in range(self.nb_requetes)]
+        paires = [(aleatoire.choice(noms), aleatoire.choice(noms)) for _ in range(self.nb_requetes)]
+
+        parcours = ParcoursReseau(reseau)
+        moteur = MoteurItineraire(reseau)
+        trajets = [TrajetObserve(*ligne) for ligne in generateur.trajets(self.nb_trajets)]
+
+        def chargement():
+            ReseauUrbain("benchmark").charger_depuis_csv(dossier)
+
+        def bfs():
+            for depart in departs:
+                parcours.bfs(depart)
+
+        def dfs():
+            for depart in departs:
+                parcours.dfs(depart)
+
+        def dijkstra():
+            for depart, arrivee in paires:
+                moteur.dijkstra(depart, arrivee, "temps")
+
+        def anomalies():
+            AnalyseurTrajets(reseau, trajets).detection_anomalies()
+
+        def anomalies_flux():
+            for _ in DetecteurFlux(reseau).flux(trajets):
+                pass
+
+        # Une journée d’horaires : une ligne pour 50 stations, un passage toutes les 10 minutes
+        horaires = Horaires(reseau, temps_correspondance=2)
+        courses = {}
+        for id_course, ligne, station_id, arrivee, depart in generateur.horaires(max(1, len(noms) // 50)):
+            courses.setdefault((id_course, ligne), []).append((noms[int(station_id)], arrivee, depart))
+        for (id_course, ligne), passages in courses.items():
+            horaires.ajouter_course(id_course, ligne, passages)
+        horaires.connexions()
+        moteur_horaires = MoteurHoraires(horaires)
+        desservies = sorted({noms[i] for i in horaires.arrets})
+        requetes_horaires = [
+            (aleatoire.choice(desservies), aleatoire.choice(desservies), aleatoire.uniform(360, 1200))
+            for _ in range(self.nb_requetes)
+        ]
+
+        def csa():
+            for depart, arrivee, heure in requetes_horaires:
+                moteur_horaires.arrivee_au_plus_tot(depart, arrivee, heure)
+
+        return [
+            ("charger_depuis_csv", 1, chargement),
+            ("bfs", len(departs), bfs),
+            ("dfs", len(departs), dfs),
+            ("dijkstra", len(paires), dijkstra),
+            ("detection_anomalies", len(trajets), anomalies),
+            ("detection_flux", len(trajets), anomalies_flux),
+            ("csa_arrivee_au_plus_tot", len(requetes_horaires), csa),
+        ]
+
+    def executer(self, afficher=False):
+        """
+        Lance tous les cas pour toutes les tailles et retourne la liste des résultats.
+        """
+        resultats = []
+
+        for taille in self.tailles:
+            generateur = GenerateurReseau(taille, self.degre_moyen, self.graine)
+            reseau = generateur.reseau()
+
+            with tempfile.TemporaryDirectory() as dossier:
+                generateur.ecrire_csv(dossier)
+
+                for nom, nb_operations, fonction in self._cas(generateur, reseau, dossier + os.sep):
+                    mesure = self.mesurer(fonction)
+                    resultat = {
+                        "cas": nom,
+                        "stations": taille,
+                        "routes": len(generateur.liaisons),
+                        "operations": nb_operations,
+                        "min_s": mesure["min_s"],
+                        "mediane_s": mesure["mediane_s"],
+                        "par_operation_s": mesure["min_s"] / nb_operations,
+                    }
+                    resultats.append(resultat)
+
+                    if afficher:
+                        print(f"{nom:<22} n={taille:<7} min={mesure['min_s']:.6f}s "
+                              f"({resultat['par_operation_s']:.2e}s / op)")
+
+        return resultats
+
+    # PERSISTANCE ET COMPARAISON
+    def sauvegarder_json(self, resultats, chemin_fichier):
+        """
+        Sauvegarde les résultats et le contexte d’exécution dans un fichier JSON.
+        """
+        contenu = {
+            "date": time.strftime("%Y-%m-%dT%H:%M:%S"),
+            "python": platform.python_version(),
+            "machine": platform.machine(),
+            "parametres": {
+                "degre_moyen": self.degre_moyen,
+                "repetitions": self.repetitions,
+                "nb_requetes": self.nb_requetes,
+                "nb_trajets": self.nb_trajets,
+                "graine": self.graine,
+            },
+            "resultats": resultats,
+        }
+        with open(chemin_fichier, "w", encoding="utf-8") as fichier:
+            json.dump(contenu, fichier, indent=2)
+
+    @staticmethod
+    def comparer(reference, courant, tolerance=0.2):
+        """
+        Compare deux fichiers JSON de résultats et retourne la liste des régressions :
+        cas dont le temps minimal dépasse celui de la référence de plus de `tolerance`.
+        """
+        with open(reference, encoding="utf-8") as fichier:
+            anciens = {(r["cas"], r["stations"]): r for r in json.load(fichier)["resultats"]}
+        with open(courant, encoding="utf-8") as fichier:
+            nouveaux = json.load(fichier)["resultats"]
+
+        regressions = []
+        for resultat in nouveaux:
+            ancien = anciens.get((resultat["cas"], resultat["stations"]))
+            if ancien and resultat["min_s"] > ancien["min_s"] * (1 + tolerance):
+                regressions.append({
+                    "cas": resultat["cas"],
+                    "stations": resultat["stations"],
+                    "reference_s": ancien["min_s"],
+                    "courant_s": resultat["min_s"],
+                    "ratio": resultat["min_s"] / ancien["min_s"],
+                })
+        return regressions
+
+
+# Exemple : python -m Class.Benchmarks.BenchmarkReseau --tailles 100 1000 --sortie bench.json
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Benchmarks du réseau urbain")
+    parser.add_argument("--tailles", type=int, nargs="+", default=list(BenchmarkReseau.TAILLES_DEFAUT))
+    parser.add_argument("--degre", type=float, default=3.0)
+    parser.add_argument("--repetitions", type=int, default=5)
+    parser.add_argument("--requetes", type=int, default=20)
+    parser.add_argument("--trajets", type=int, default=1000)
+    parser.add_argument("--sortie", default="bench_output.json")
+    parser.add_argument("--reference", help="fichier JSON d'une exécution précédente à comparer")
+    args = parser.parse_args()
+
+    benchmark = BenchmarkReseau(args.tailles, args.degre, args.repetitions, args.requetes, args.trajets)
+    resultats = benchmark.executer(afficher=True)
+    benchmark.sauvegarder_json(resultats, args.sortie)
+    print(f"Résultats sauvegardés dans {args.sortie}")
+
+    if args.reference:
+        for regression in BenchmarkReseau.comparer(args.reference, args.sortie):
+            print(f"RÉGRESSION {regression['cas']} n={regression['stations']} : "
+                  f"x{regression['ratio']:.2f}")
@@ -0,0 +1,184 @@
+import csv
+import os
+import random
+
+from Class.ReseauUrbain import ReseauUrbain
+
+
+class GenerateurReseau:
+    """
+    Générateur de réseaux urbains synthétiques pour les mesures de performance.
+
+    Le réseau produit est connexe (arbre couvrant aléatoire) puis densifié
+    par des routes aléatoires supplémentaires jusqu’au degré moyen demandé.
+    La génération est reproductible grâce à la graine.
+    """
+
+    def __init__(self, nb_stations, degre_moyen=3.0, graine=0):
+        """
+        - nb_stations : nombre de stations du réseau
+        - degre_moyen : nombre moyen de routes par station (densité)
+        - graine : graine du générateur aléatoire
+        """
+        self.nb_stations = nb_stations
+        self.degre_moyen = degre_moyen
+        self.aleatoire = random.Random(graine)
+
+        self.noms = [f"S{i}" for i in range(nb_stations)]
+        self.liaisons = self._generer_liaisons()
+
+    def _generer_liaisons(self):
+        """
+        Retourne un dictionnaire (i, j) -> (distance, temps), avec i < j.
+        """
+        liaisons = {}
+
+        def ajouter(i, j):
+            if i == j:
+                return
+            cle = (min(i, j), max(i, j))
+            if cle not in liaisons:
+                distance = round(self.aleatoire.uniform(0.5, 5.0), 2)
+                # Vitesse entre 15 et 45 km/h
+                temps = round(distance * 60 / self.aleatoire.uniform(15, 45), 1)
+                liaisons[cle] = (distance, temps)
+
+        # Arbre couvrant : chaque station est reliée à une station précédente
+        for i in range(1, self.nb_stations):
+            ajouter(i, self.aleatoire.randrange(i))
+
+        # Routes supplémentaires jusqu’au degré moyen demandé
+        cible = int(self.nb_stations * self.degre_moyen / 2)
+        essais = 0
+        while len(liaisons) < cible and essais < 10 * cible:
+            ajouter(self.aleatoire.randrange(self.nb_stations), self.aleatoire.randrange(self.nb_stations))
+            essais += 1
+
+        return liaisons
+
+    # DONNÉES AU FORMAT DES CSV
+    def stations(self):
+        """
+        Lignes (id, nom) au format de load_csv_stations.
+        """
+        return list(enumerate(self.noms))
+
+    def routes(self):
+        """
+        Lignes (depart_id, arrivee_id, distance, temps) au format de load_csv_roads.
+        """
+        return [(str(i), str(j), d, t) for (i, j), (d, t) in self.liaisons.items()]
+
+    def trajets(self, nb_trajets, longueur=6, bruit=0.2):
+        """
+        Lignes (id, stations, temps, distance) au format de load_csv_trajets.
+        Chaque trajet est une marche aléatoire sur le réseau ; les mesures
+        sont les valeurs théoriques perturbées d’au plus ±bruit.
+        """
+        voisins = [[] for _ in range(self.nb_stations)]
+        for (i, j), valeurs in self.liaisons.items():
+            voisins[i].append((j, valeurs))
+            voisins[j].append((i, valeurs))
+
+        lignes = []
+        for k in range(nb_trajets):
+            courante = self.aleatoire.randrange(self.nb_stations)
+            stations = [self.noms[courante]]
+            distance = temps = 0.0
+            for _ in range(longueur - 1):
+                if not voisins[courante]:
+                    break
+                courante, (d, t) = self.aleatoire.choice(voisins[courante])
+                stations.append(self.noms[courante])
+                distance += d
+                temps += t
+            facteur = self.aleatoire.uniform(1 - bruit, 1 + bruit)
+            lignes.append((str(k), stations, round(temps * facteur, 2), round(distance * facteur, 2)))
+        return lignes
+
+    def horaires(self, nb_lignes, longueur=10, debut=330, fin=1410, intervalle=10, arret=0.5):
+        """
+        Lignes (id_course, ligne, station_id, arrivee, depart) au format de iter_csv_horaires.
+        Chaque ligne suit un chemin aléatoire sans boucle du réseau, parcouru dans
+        les deux sens toutes les `intervalle` minutes entre debut et fin ;
+        les temps de parcours sont ceux des routes, plus `arret` minutes à chaque arrêt.
+        """
+        voisins = [[] for _ in range(self.nb_stations)]
+        for (i, j), (_, temps) in self.liaisons.items():
+            voisins[i].append((j, temps))
+            voisins[j].append((i, temps))
+
+        lignes = []
+        for numero in range(nb_lignes):
+            # Tracé de la ligne : marche aléatoire qui ne repasse pas par une station
+            courante = self.aleatoire.randrange(self.nb_stations)
+            trace = [(courante, 0.0)]
+            visitees = {courante}
+            while len(trace) < longueur:
+                candidats = [(v, t) for v, t in voisins[courante] if v not in visitees]
+                if not candidats:
+                    break
+                courante, temps = self.aleatoire.choice(candidats)
+                trace.append((courante, temps))
+                visitees.add(courante)
+
+            retour = [(trace[-1][0], 0.0)] + [
+                (trace[k][0], trace[k + 1][1]) for k in range(len(trace) - 2, -1, -1)
+            ]
+
+            nb_courses = 0
+            heure_depart = debut
+            while heure_depart <= fin:
+                for sens in (trace, retour):
+                    id_course = f"L{numero}-{nb_courses}"
+                    heure = heure_depart
+                    for position, (station, temps) in enumerate(sens):
+                        heure += temps
+                        depart = heure if position in (0, len(sens) - 1) else heure + arret
+                        lignes.append((id_course, f"L{numero}", str(station), round(heure, 1), round(depart, 1)))
+                        heure = depart
+                    nb_courses += 1
+                heure_depart += intervalle
+        return lignes
+
+    # CONSTRUCTION
+    def reseau(self, nom="reseau_synthetique"):
+        """
+        Construit directement le ReseauUrbain correspondant.
+        """
+        reseau = ReseauUrbain(nom)
+        for nom_station in self.noms:
+            reseau.ajouter_station(nom_station)
+        for (i, j), (distance, temps) in self.liaisons.items():
+            reseau.ajouter_route(self.noms[i], self.noms[j], distance, temps)
+        return reseau
+
+    def ecrire_csv(self, dossier, nb_trajets=0, nb_lignes=0):
+        """
+        Écrit les fichiers stations_xl.csv, routes_xl.csv et trajets_xl.csv
+        (et horaires_xl.csv si nb_lignes > 0) dans un dossier,
+        au format attendu par csv_files.ReadCSV.
+        """
+        os.makedirs(dossier, exist_ok=True)
+
+        with open(os.path.join(dossier, "stations_xl.csv"), "w", newline="", encoding="utf-8") as f:
+            writer = csv.writer(f)
+            writer.writerow(["id", "nom"])
+            writer.writerows(self.stations())
+
+        with open(os.path.join(dossier, "routes_xl.csv"), "w", newline="", encoding="utf-8") as f:
+            writer = csv.writer(f)
+            writer.writerow(["from", "to", "distance_km", "temps_min"])
+            writer.writerows(self.routes())
+
+        with open(os.path.join(dossier, "trajets_xl.csv"), "w", newline="", encoding="utf-8") as f:
+            writer = csv.writer(f)
+            writer.writerow(["id_trajet", "stations", "temps_mesure", "distance_mesuree"])
+            for id_trajet, stations, temps, distance in self.trajets(nb_trajets):
+                writer.writerow([id_trajet, ";".join(stations), temps, distance])
+
+        if nb_lignes > 0:
+            with open(os.path.join(dossier, "horaires_xl.csv"), "w", newline="", encoding="utf-8") as f:
+                writer = csv.writer(f)
+                writer.writerow(["id_course", "ligne", "station", "arrivee", "depart"])
+                writer.writerows(self.horaires(nb_lignes))
@@ -0,0 +1,144 @@
+import heapq
+import math
+
+from Class.MoteurItineraire import MoteurItineraire
+
+
+class CheminsAlternatifs:
+    """
+    Calcul des k plus courts chemins sans boucle entre deux stations (algorithme de Yen).
+
+    Un seul arbre des plus courts chemins vers l’arrivée est calculé par requête,
+    puis réutilisé à chaque itération :
+    - si le chemin de l’arbre depuis le nœud de déviation évite les stations
+      et routes interdites, il est directement optimal (aucune recherche) ;
+    - sinon, la déviation est cherchée par A*, avec comme heuristique
+      la distance exacte à l’arrivée dans le réseau complet (borne inférieure).
+    """
+
+    def __init__(self, reseau):
+        """
+        - reseau : instance de ReseauUrbain
+        """
+        self.reseau = reseau
+        self.moteur = MoteurItineraire(reseau)
+        self.recherches = 0     # Nombre de recherches A* lancées par la dernière requête
+
+    def _deviation(self, adjacence, deviation_i, arrivee_i, distance_arrivee, suivant,
+                   noeuds_exclus, aretes_exclues):
+        """
+        Plus court chemin de deviation_i à arrivee_i sans les stations ni les routes exclues.
+        Retourne (liste d’indices, coût), ou (None, inf).
+        """
+        # Réutilisation directe de l’arbre lorsque son chemin reste autorisé
+        chemin = [deviation_i]
+        cur = deviation_i
+        valide = deviation_i in distance_arrivee
+        while valide and cur != arrivee_i:
+            prochain = suivant[cur]
+            if prochain in noeuds_exclus or (cur, prochain) in aretes_exclues:
+                valide = False
+            chemin.append(prochain)
+            cur = prochain
+        if valide:
+            return chemin, distance_arrivee[deviation_i]
+
+        # Sinon : A* guidé par les distances exactes à l’arrivée
+        self.recherches += 1
+        dist = {deviation_i: 0}
+        precedent = {deviation_i: None}
+        fixes = set()
+        tas = [(distance_arrivee.get(deviation_i, math.inf), deviation_i)]
+
+        while tas:
+            _, u = heapq.heappop(tas)
+            if u in fixes:
+                continue
+            fixes.add(u)
+            if u == arrivee_i:
+                break
+
+            for v, poids in adjacence[u].items():
+                if v in noeuds_exclus or (u, v) in aretes_exclues or v not in distance_arrivee:
+                    continue
+                nouveau = dist[u] + poids
+                if v not in fixes and nouveau < dist.get(v, math.inf):
+                    dist[v] = nouveau
+                    precedent[v] = u
+                    heapq.heappush(tas, (nouveau + distance_arrivee[v], v))
+
+        if arrivee_i not in fixes:
+            return None, math.inf
+
+        chemin = []
+        cur = arrivee_i
+        while cur is not None:
+            chemin.append(cur)
+            cur = precedent[cur]
+        chemin.reverse()
+        return chemin, dist[arrivee_i]
+
+    def k_plus_courts(self, depart, arrivee, k=3, poids="temps"):
+        """
+        Retourne au plus k chemins sans boucle, du plus court au plus long :
+        liste de (chemin, coût). Liste vide si l’arrivée est inatteignable.
+
+        :param poids: "temps", "distance", une matrice dense ou des listes d’adjacence
+        """
+        depart_i = self.moteur._index(depart)
+        arrivee_i = self.moteur._index(arrivee)
+        adjacence = self.moteur._adjacence(poids)
+        self.recherches = 0
+
+        # Arbre des plus courts chemins vers l’arrivée (réseau non orienté) :
+        # suivant[v] est le voisin de v sur son plus court chemin vers l’arrivée
+        distance_arrivee, suivant = self.moteur.arbre(arrivee_i, adjacence)
+
+        if depart_i not in distance_arrivee:
+            return []
+
+        premier, cout = self._deviation(
+            adjacence, depart_i, arrivee_i, distance_arrivee, suivant, set(), set()
+        )
+        trouves = [(premier, cout)]
+        candidats = []              # Tas de (coût, chemin)
+        deja_vus = {tuple(premier)}
+
+        while len(trouves) < k:
+            precedent_chemin, _ = trouves[-1]
+
+            for i in range(len(precedent_chemin) - 1):
+                deviation_i = precedent_chemin[i]
+                racine = precedent_chemin[:i + 1]
+
+                # Routes à ne pas reprendre : celles qui prolongent la même racine
+                aretes_exclues = set()
+                for chemin, _ in trouves:
+                    if chemin[:i + 1] == racine:
+                        aretes_exclues.add((chemin[i], chemin[i + 1]))
+
+                # Stations de la racine interdites (chemin sans boucle)
+                noeuds_exclus = set(racine[:-1])
+
+                fin, cout_fin = self._deviation(
+                    adjacence, deviation_i, arrivee_i, distance_arrivee, suivant,
+                    noeuds_exclus, aretes_exclues
+                )
+                if fin is None:
+                    continue
+
+                total = racine[:-1] + fin
+                if tuple(total) in deja_vus:
+                    continue
+                deja_vus.add(tuple(total))
+
+                cout_racine = sum(adjacence[a][b] for a, b in zip(racine, racine[1:]))
+                heapq.heappush(candidats, (cout_racine + cout_fin, total))
+
+            if not candidats:
+                break
+            cout, chemin = heapq.heappop(candidats)
+            trouves.append((chemin, cout))
+
+        stations = self.reseau.stations
+        return [([stations[i].nom for i in chemin], cout) for chemin, cout in trouves]
@@ -0,0 +1,112 @@
+import numbers
+
+from Class.Station import Station
+
+
+def _reel(valeur):
+    """
+    Indique si une valeur est un nombre réel (booléens exclus).
+    """
+    return isinstance(valeur, numbers.Real) and not isinstance(valeur, bool)
+
+
+class ConstructeurReseau:
+    """
+    Construction d’un réseau urbain en bloc, à partir de stations désignées
+    par un identifiant (comme dans les fichiers CSV) et de routes entre identifiants.
+
+    Les données sont validées au fil de l’ajout :
+    - identifiant de station en double ou nom vide : erreur ;
+    - nom déjà présent sous un autre identifiant : les deux identifiants
+      désignent la même station (dédoublonnage, comme ajouter_station) ;
+    - route vers un identifiant inconnu, ou distance / temps négatif ou non numérique : erreur.
+    Chaque erreur est une ValueError ; les appelants la complètent par l’origine
+    de la donnée fautive (par exemple "routes_xl.csv, ligne 12").
+
+    Le réseau n’est rempli qu’une fois, par remplir : dans un réseau vide, les stations
+    et les listes d’adjacence sont installées directement, sans passer par
+    ajouter_station / ajouter_route (ni version ni journal par élément).
+    """
+
+    def __init__(self):
+        self.stations = []              # Objets Station, dans l’ordre d’ajout
+        self.index_par_nom = {}         # Nom -> index
+        self.index_par_id = {}          # Identifiant (texte) -> index
+        self.adjacence_distances = []
+        self.adjacence_temps = []
+        self.doublons = 0               # Identifiants rattachés à une station de même nom
+        self._utilise = False
+
+    # AJOUT D'UNE STATION
+    def ajouter_station(self, station_id, nom_station, latitude=None, longitude=None):
+        """
+        Ajoute une station désignée par un identifiant.
+        """
+        cle = str(station_id).strip()
+        if cle in self.index_par_id:
+            raise ValueError(f"Identifiant de station en double : {cle}")
+        nom_station = nom_station.strip()
+        if not nom_station:
+            raise ValueError(f"Nom vide pour la station {cle}")
+
+        # Nom déjà connu : l’identifiant désigne la station existante
+        if nom_station in self.index_par_nom:
+            self.index_par_id[cle] = self.index_par_nom[nom_station]
+            self.doublons += 1
+            return
+
+        index = len(self.stations)
+        self.stations.append(Station(index, nom_station, latitude, longitude))
+        self.index_par_nom[nom_station] = index
+        self.index_par_id[cle] = index
+        self.adjacence_distances.append({})
+        self.adjacence_temps.append({})
+
+    # AJOUT D'UNE ROUTE
+    def ajouter_route(self, depart_id, arrivee_id, distance, temps):
+        """
+        Ajoute une route (non orientée) entre deux stations déjà ajoutées.
+        Une route déjà présente est remplacée, comme avec ajouter_route.
+        """
+        i = self.index_par_id.get(str(depart_id).strip())
+        j = self.index_par_id.get(str(arrivee_id).strip())
+        if i is None or j is None:
+            inconnu = depart_id if i is None else arrivee_id
+            raise ValueError(f"Station inconnue dans une route : {inconnu}")
+
+        # Tout réel est accepté (numpy.int64, numpy.float32, ...), sauf les booléens ;
+        # une valeur NaN échoue à la comparaison : elle est refusée aussi
+        if not (_reel(distance) and distance >= 0):
+            raise ValueError(f"Distance invalide pour la route {depart_id} - {arrivee_id} : {distance!r}")
+        if not (_reel(temps) and temps >= 0):
+            raise ValueError(f"Temps invalide pour la route {depart_id} - {arrivee_id} : {temps!r}")
+
+        self.adjacence_distances[i][j] = distance
+        self.adjacence_distances[j][i] = distance
+        self.adjacence_temps[i][j] = temps
+        self.adjacence_temps[j][i] = temps
+
+    # REMPLISSAGE DU RÉSEAU
+    def remplir(self, reseau):
+        """
+        Ajoute les stations et les routes à un réseau (instance de ReseauUrbain), puis le retourne.
+        Un réseau vide est rempli d’un bloc ; sinon, les éléments sont ajoutés un à un.
+        Le constructeur ne peut servir qu’une fois : ses listes appartiennent ensuite au réseau.
+        """
+        if self._utilise:
+            raise ValueError("Ce constructeur a déjà rempli un réseau")
+        self._utilise = True
+
+        if not reseau.stations:
+            reseau._installer(self.stations, self.adjacence_distances, self.adjacence_temps)
+            return reseau
+
+        for station in self.stations:
+            reseau.ajouter_station(station.nom, station.latitude, station.longitude)
+        for i, voisins in enumerate(self.adjacence_temps):
+            for j, temps in voisins.items():
+                if i <= j:
+                    reseau.ajouter_route(
+                        self.stations[i].nom, self.stations[j].nom, self.adjacence_distances[i][j], temps
+                    )
+        return reseau
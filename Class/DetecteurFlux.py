@@ -0,0 +1,331 @@
+import math
+
+from Class.TrajetObserve import TrajetObserve
+from csv_files.ReadCSV import BASE_PATH, suivre_csv_trajets
+
+
+class DetecteurFlux:
+    """
+    Détection d’anomalies en flux : les trajets observés sont analysés un par un,
+    dès leur arrivée (itérateur, ou fichier suivi au fil de son écriture).
+
+    Pour chaque route du réseau, des statistiques cumulées (algorithme de Welford :
+    effectif, moyenne, somme des carrés des écarts) sont tenues sur le logarithme
+    du rapport mesuré / théorique des trajets qui l’empruntent, en temps et en distance.
+    Un trajet est comparé à la moyenne de ses routes, pondérée par leur part
+    dans la valeur théorique, puis intégré aux statistiques s’il n’est pas atypique
+    (une anomalie ne doit pas élargir la norme qui a servi à la détecter).
+
+    La norme s’adapte toutefois à un changement durable non reporté dans le réseau
+    (travaux, nouvelle limitation de vitesse) :
+    - lorsqu’une route cumule adaptation mesures atypiques consécutives, les mesures
+      atypiques des trajets qui l’empruntent sont de nouveau intégrées (un trajet
+      normal sur la route remet son compteur à zéro) ;
+    - l’effectif de chaque route est plafonné à memoire : au-delà, les anciennes
+      observations sont oubliées exponentiellement, si bien que la norme rejoint
+      la nouvelle situation en quelques centaines de trajets au plus.
+    Les trajets restent signalés tant que la norme n’a pas rejoint leurs mesures.
+
+    La mémoire est bornée par le nombre de routes du réseau (quelques valeurs
+    par route), quel que soit le nombre de trajets analysés.
+    """
+
+    # Score (en valeur absolue) au-delà duquel une mesure est atypique
+    SEUIL_SCORE = 3.5
+
+    # Nombre minimal d’observations d’une route avant que ses statistiques ne servent
+    MIN_OBSERVATIONS = 20
+
+    # Écart-type minimal (en logarithme, soit environ 2 %) : évite des scores
+    # démesurés lorsque les premières mesures d’une route sont identiques
+    ECART_MIN = 0.02
+
+    # Mesures atypiques consécutives d’une route à partir desquelles elles sont intégrées
+    SEUIL_ADAPTATION = 10
+
+    # Effectif maximal d’une route (au-delà, oubli exponentiel des anciennes observations)
+    MEMOIRE = 200
+
+    CRITERES = ("temps", "distance")
+
+    def __init__(self, reseau, seuil=SEUIL_SCORE, min_observations=MIN_OBSERVATIONS,
+                 adaptation=SEUIL_ADAPTATION, memoire=MEMOIRE):
+        """
+        - reseau : instance de ReseauUrbain
+        - seuil : score au-delà duquel une mesure est signalée
+        - min_observations : observations nécessaires avant de juger une route
+        - adaptation : mesures atypiques consécutives d’une route avant de les intégrer
+        - memoire : effectif maximal d’une route (horizon de l’oubli exponentiel)
+        """
+        if memoire < max(min_observations, 2):
+            raise ValueError("La mémoire doit couvrir au moins min_observations observations")
+        self.reseau = reseau
+        self.seuil = seuil
+        self.min_observations = min_observations
+        self.adaptation = adaptation
+        self.memoire = memoire
+        self.nb_trajets = 0         # Trajets analysés
+        self.nb_anomalies = 0       # Trajets ayant au moins une anomalie
+        self.version = None
+        self._initialiser()
+
+    def _initialiser(self):
+        """
+        Numérote les routes du réseau et remet les statistiques à zéro.
+        Appelée à la création, puis à chaque modification du réseau
+        (les valeurs théoriques ayant pu changer, les rapports ne sont plus comparables).
+        """
+        # (station, station voisine) -> numéro de route, dans les deux sens : les noms
+        # du trajet mènent directement aux routes, sans passer par les indices
+        stations = self.reseau.stations
+        self.numero_route = {}
+        self.theoriques = {critere: [] for critere in self.CRITERES}   # Valeur théorique de chaque route
+        nb_routes = 0
+        for i, j, distance, temps in self.reseau.aretes():
+            self.numero_route[(stations[i].nom, stations[j].nom)] = nb_routes
+            self.numero_route[(stations[j].nom, stations[i].nom)] = nb_routes
+            self.theoriques["temps"].append(temps)
+            self.theoriques["distance"].append(distance)
+            nb_routes += 1
+
+        # Statistiques de Welford par critère : effectifs, moyennes, sommes des carrés des écarts
+        self.effectifs = {critere: [0] * nb_routes for critere in self.CRITERES}
+        self.moyennes = {critere: [0.0] * nb_routes for critere in self.CRITERES}
+        self.carres = {critere: [0.0] * nb_routes for critere in self.CRITERES}
+        # Mesures atypiques consécutives de chaque route
+        self.consecutifs = {critere: [0] * nb_routes for critere in self.CRITERES}
+        self.version = self.reseau.version
+
+    def statistiques(self, station_depart, station_arrivee, critere="temps"):
+        """
+        Statistiques d’une route : (effectif, moyenne, écart-type) du logarithme
+        du rapport mesuré / théorique ; (0, 0.0, 0.0) si la route n’a pas été observée.
+        L’effectif est plafonné à memoire.
+        """
+        if self.version != self.reseau.version:
+            self._initialiser()
+        index = self.reseau.index_par_nom
+        if station_depart not in index or station_arrivee not in index:
+            raise ValueError(f"Station inconnue : {station_depart} ou {station_arrivee}")
+        numero = self.numero_route.get((station_depart, station_arrivee))
+        if numero is None:
+            raise ValueError(f"Aucune route entre {station_depart} et {station_arrivee}")
+
+        n = self.effectifs[critere][numero]
+        ecart = math.sqrt(self.carres[critere][numero] / (n - 1)) if n > 1 else 0.0
+        return n, self.moyennes[critere][numero], ecart
+
+    # ANALYSE D'UN TRAJET
+    def analyser(self, trajet):
+        """
+        Analyse un trajet observé et met à jour les statistiques.
+        Retourne le dictionnaire de ses anomalies (mêmes catégories et messages
+        que AnalyseurTrajets.detection_anomalies), ou None s’il n’en a aucune.
+
+        Contrairement à l’analyse par lots, une mesure absente n’empêche pas
+        d’évaluer l’autre.
+        """
+        if self.version != self.reseau.version:
+            self._initialiser()
+        self.nb_trajets += 1
+
+        # Chemin rapide : trajet bien formé, sans boucle, sur des routes existantes
+        stations = trajet.nomsStations
+        temps_mesure = trajet.tpsMesure
+        distance_mesuree = trajet.distMesure
+        if stations and temps_mesure is not None and distance_mesuree is not None \
+                and temps_mesure > 0 and distance_mesuree >= 0:
+            if len(set(stations)) == len(stations) > 1:
+                numero_route = self.numero_route.get
+                routes = [numero_route(paire) for paire in zip(stations, stations[1:])]
+                if None not in routes:
+                    mesure = self._evaluer(routes, temps_mesure, distance_mesuree)
+                    return None if mesure is None else self._signaler([], [], mesure)
+
+        return self._diagnostiquer(trajet)
+
+    def _diagnostiquer(self, trajet):
+        """
+        Analyse complète d’un trajet qui présente au moins une anomalie
+        de format ou de logique (chemin lent, messages détaillés).
+        """
+        format_ = []
+        logique = []
+        mesure = []
+
+        # FORMAT — COHÉRENCE DES DONNÉES
+        stations = trajet.nomsStations
+        if not stations:
+            format_.append("[ALERTE] Aucune station renseignée dans le CSV")
+            return self._signaler(format_, logique, mesure)
+        if len(stations) == 1:
+            format_.append("[ALERTE] Une seule station renseignée (trajet invalide)")
+
+        index = self.reseau.index_par_nom
+        for station in stations:
+            if station not in index:
+                format_.append(f"[ALERTE] Station inconnue dans le réseau : {station}")
+
+        temps_mesure = trajet.tpsMesure
+        distance_mesuree = trajet.distMesure
+        if temps_mesure is None or distance_mesuree is None:
+            format_.append("[ALERTE] Valeurs mesurées manquantes (temps ou distance)")
+        if (temps_mesure is not None and temps_mesure < 0) or (distance_mesuree is not None and distance_mesuree < 0):
+            format_.append("[ALERTE] Valeurs mesurées négatives")
+            return self._signaler(format_, logique, mesure)
+        if distance_mesuree and temps_mesure == 0:
+            format_.append("[ALERTE] Distance positive avec temps nul")
+
+        # LOGIQUE — ROUTES EMPRUNTÉES
+        if len(stations) != len(set(stations)):
+            logique.append("[ATTENTION] Boucle détectée (station répétée)")
+
+        routes = [self.numero_route.get(paire) for paire in zip(stations, stations[1:])]
+        if None in routes:
+            for k, numero in enumerate(routes):
+                if numero is None:
+                    logique.append(f"[ALERTE] Route inexistante entre {stations[k]} et {stations[k + 1]}")
+            logique.append("[ALERTE] Trajet théoriquement impossible")
+            return self._signaler(format_, logique, mesure)
+
+        # MESURE — COMPARAISON AUX STATISTIQUES DES ROUTES
+        mesure = self._evaluer(routes, temps_mesure, distance_mesuree) or []
+
+        return self._signaler(format_, logique, mesure)
+
+    def _signaler(self, format_, logique, mesure):
+        """
+        Regroupe les anomalies d’un trajet, ou retourne None s’il n’en a aucune.
+        """
+        if not (format_ or logique or mesure):
+            return None
+        self.nb_anomalies += 1
+        return {"FORMAT": format_, "LOGIQUE": logique, "MESURE": mesure}
+
+    def _evaluer(self, routes, temps_mesure, distance_mesuree):
+        """
+        Score du temps et de la distance mesurés (None : non évalué) par rapport
+        aux routes empruntées, puis mise à jour des statistiques des routes
+        (voir _mettre_a_jour).
+        Les deux critères sont traités dans la même boucle (chemin critique du flux).
+        Retourne la liste des messages, ou None si les mesures sont normales.
+        """
+        messages = []
+        theoriques_t = self.theoriques["temps"]
+        theoriques_d = self.theoriques["distance"]
+        effectifs_t, effectifs_d = self.effectifs["temps"], self.effectifs["distance"]
+        moyennes_t, moyennes_d = self.moyennes["temps"], self.moyennes["distance"]
+        carres_t, carres_d = self.carres["temps"], self.carres["distance"]
+        min_observations = self.min_observations
+
+        # Valeurs théoriques, puis moyennes et variances attendues, pondérées
+        # par la part théorique de chaque route suffisamment observée
+        total_t = total_d = 0.0
+        connus_t = connus_d = 0.0
+        moyenne_t = moyenne_d = 0.0
+        variance_t = variance_d = 0.0
+        for numero in routes:
+            poids_t = theoriques_t[numero]
+            poids_d = theoriques_d[numero]
+            total_t += poids_t
+            total_d += poids_d
+            n = effectifs_t[numero]
+            if n >= min_observations:
+                connus_t += poids_t
+                moyenne_t += poids_t * moyennes_t[numero]
+                variance_t += poids_t * carres_t[numero] / (n - 1)
+            n = effectifs_d[numero]
+            if n >= min_observations:
+                connus_d += poids_d
+                moyenne_d += poids_d * moyennes_d[numero]
+                variance_d += poids_d * carres_d[numero] / (n - 1)
+
+        x_t = self._score(temps_mesure, total_t, connus_t, moyenne_t, variance_t, "Temps mesuré", messages)
+        atypique_t = bool(messages)
+        x_d = self._score(distance_mesuree, total_d, connus_d, moyenne_d, variance_d, "Distance mesurée", messages)
+        atypique_d = len(messages) > atypique_t
+
+        if x_t is not None:
+            self._mettre_a_jour(routes, x_t, atypique_t, effectifs_t, moyennes_t, carres_t,
+                                self.consecutifs["temps"])
+        if x_d is not None:
+            self._mettre_a_jour(routes, x_d, atypique_d, effectifs_d, moyennes_d, carres_d,
+                                self.consecutifs["distance"])
+
+        return messages or None
+
+    def _mettre_a_jour(self, routes, x, atypique, effectifs, moyennes, carres, consecutifs):
+        """
+        Mise à jour de Welford de chaque route empruntée, pour un critère.
+        Une mesure atypique n’est intégrée que si l’une des routes en cumule
+        adaptation d’affilée (changement durable plutôt qu’incident isolé).
+        Au-delà de memoire observations, l’effectif n’augmente plus : chaque
+        nouvelle mesure pèse 1 / memoire, les anciennes s’effacent peu à peu.
+        """
+        if atypique:
+            durable = False
+            for numero in routes:
+                c = consecutifs[numero] + 1
+                consecutifs[numero] = c
+                if c >= self.adaptation:
+                    durable = True
+            if not durable:
+                return
+        else:
+            for numero in routes:
+                consecutifs[numero] = 0
+
+        memoire = self.memoire
+        for numero in routes:
+            n = effectifs[numero]
+            moyenne = moyennes[numero]
+            delta = x - moyenne
+            if n < memoire:
+                n += 1
+                effectifs[numero] = n
+                moyenne += delta / n
+                carres[numero] += delta * (x - moyenne)
+            else:
+                moyenne += delta / n
+                carres[numero] = carres[numero] * (1 - 1 / n) + delta * (x - moyenne)
+            moyennes[numero] = moyenne
+
+    def _score(self, valeur, total, connus, moyenne, variance, libelle, messages):
+        """
+        Compare le logarithme du rapport mesuré / théorique à la norme des routes
+        et ajoute un message si la mesure est atypique.
+        Retourne ce logarithme, ou None si la mesure ne peut être évaluée
+        (mesure absente ou nulle, valeur théorique nulle).
+        """
+        if not valeur or total <= 0:
+            return None
+        x = math.log(valeur / total)
+
+        # Le trajet n’est jugé que si l’essentiel de son parcours est connu
+        if connus >= 0.5 * total:
+            ecart = math.sqrt(variance / connus)
+            z = (x - moyenne / connus) / (ecart if ecart > self.ECART_MIN else self.ECART_MIN)
+            if z > self.seuil:
+                messages.append(f"[ATTENTION] {libelle} atypique (trop élevé, score {z:.1f})")
+            elif z < -self.seuil:
+                messages.append(f"[NOTICE] {libelle} atypique (trop faible, score {z:.1f})")
+        return x
+
+    # FLUX DE TRAJETS
+    def flux(self, trajets):
+        """
+        Générateur : analyse les trajets au fil de l’itérable et produit
+        (id du trajet, anomalies) pour chaque trajet anormal, immédiatement.
+        """
+        for trajet in trajets:
+            anomalies = self.analyser(trajet)
+            if anomalies is not None:
+                yield getattr(trajet, "idTraj", "INCONNU"), anomalies
+
+    def suivre_csv(self, base_path=BASE_PATH, intervalle=0.5, arret=None):
+        """
+        Générateur : suit le fichier des trajets au fil de son écriture
+        (voir suivre_csv_trajets) et produit les trajets anormaux dès leur lecture.
+        """
+        trajets = (TrajetObserve(*ligne) for ligne in suivre_csv_trajets(base_path, intervalle, arret))
+        return self.flux(trajets)
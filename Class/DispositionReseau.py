@@ -0,0 +1,172 @@
+import math
+
+from Class.MatricesNumpy import np
+
+
+class DispositionReseau:
+    """
+    Placement des stations d’un réseau urbain pour son affichage.
+
+    Trois méthodes :
+    - "geographique" : coordonnées des stations (longitude en abscisse, corrigée
+      par le cosinus de la latitude moyenne), si toutes les stations en ont ;
+    - "spectrale" : vecteurs propres de la marche aléatoire sur le graphe
+      (méthode de Koren), obtenus par itérations de la puissance ; chaque
+      itération ne parcourt que les routes (np.bincount), ce qui reste
+      rapide pour des dizaines de milliers de stations ;
+    - "circulaire" : stations régulièrement réparties sur un cercle.
+    Par défaut, les coordonnées sont utilisées si elles existent, sinon la
+    disposition spectrale (au-delà de deux stations).
+
+    Les positions sont normalisées dans le carré [-1, 1]² et conservées
+    jusqu’à la prochaine modification du réseau, comme les segments des routes.
+    NumPy est nécessaire (comme pour matplotlib).
+    """
+
+    METHODES = ("geographique", "spectrale", "circulaire")
+
+    # Itérations maximales et tolérance de convergence de la méthode de la puissance
+    ITERATIONS = 300
+    TOLERANCE = 1e-7
+
+    def __init__(self, reseau, methode=None, graine=0):
+        """
+        - reseau : instance de ReseauUrbain
+        - methode : "geographique", "spectrale", "circulaire" ou None (choix automatique)
+        - graine : graine des vecteurs initiaux de la disposition spectrale
+        """
+        if np is None:
+            raise ImportError("NumPy est nécessaire pour disposer le réseau")
+        if methode is not None and methode not in self.METHODES:
+            raise ValueError(f"Méthode de disposition inconnue : {methode}")
+        self.reseau = reseau
+        self.methode = methode
+        self.graine = graine
+
+        self.version = None
+        self.methode_utilisee = None    # Méthode effectivement appliquée
+        self._x = None
+        self._y = None
+        self._extremites = None         # (départs, arrivées) des routes, i < j
+
+    # POSITIONS
+    def positions(self):
+        """
+        Retourne (x, y) : tableaux des coordonnées des stations, par index.
+        """
+        if self.version != self.reseau.version:
+            self._calculer()
+        return self._x, self._y
+
+    def segments(self):
+        """
+        Retourne le tableau (nombre de routes, 2, 2) des extrémités de chaque route,
+        prêt pour une LineCollection.
+        """
+        x, y = self.positions()
+        departs, arrivees = self._extremites
+        return np.stack((
+            np.column_stack((x[departs], y[departs])),
+            np.column_stack((x[arrivees], y[arrivees])),
+        ), axis=1)
+
+    def _calculer(self):
+        """
+        Calcule les positions pour l’état courant du réseau.
+        """
+        aretes = [(i, j) for i, j, _, _ in self.reseau.aretes()]
+        self._extremites = (
+            np.array([i for i, _ in aretes], dtype=np.intp),
+            np.array([j for _, j in aretes], dtype=np.intp),
+        )
+
+        stations = self.reseau.stations
+        methode = self.methode
+        if methode is None:
+            if stations and all(s.a_coordonnees() for s in stations):
+                methode = "geographique"
+            elif len(stations) > 2 and aretes:
+                methode = "spectrale"
+            else:
+                methode = "circulaire"
+
+        if methode == "geographique":
+            x, y = self._geographique()
+        elif methode == "spectrale":
+            x, y = self._spectrale()
+        else:
+            x, y = self._circulaire()
+
+        self._x, self._y = self._normaliser(x, y)
+        self.methode_utilisee = methode
+        self.version = self.reseau.version
+
+    # MÉTHODES DE DISPOSITION
+    def _geographique(self):
+        """
+        Projection équirectangulaire des coordonnées des stations.
+        """
+        stations = self.reseau.stations
+        if not all(s.a_coordonnees() for s in stations):
+            raise ValueError("Disposition géographique impossible : stations sans coordonnées")
+        latitudes = np.array([s.latitude for s in stations], dtype=np.float64)
+        longitudes = np.array([s.longitude for s in stations], dtype=np.float64)
+        return longitudes * math.cos(math.radians(latitudes.mean())), latitudes
+
+    def _circulaire(self):
+        """
+        Stations régulièrement réparties sur le cercle unité.
+        """
+        n = len(self.reseau.stations)
+        angles = 2 * math.pi * np.arange(n) / max(n, 1)
+        return np.cos(angles), np.sin(angles)
+
+    def _spectrale(self):
+        """
+        Deux vecteurs propres non triviaux de la marche aléatoire paresseuse
+        (I + D⁻¹A) / 2, chacun D-orthogonalisé contre les précédents
+        (le premier étant le vecteur constant).
+        """
+        n = len(self.reseau.stations)
+        departs, arrivees = self._extremites
+        # Routes dans les deux sens
+        sources = np.concatenate((departs, arrivees))
+        cibles = np.concatenate((arrivees, departs))
+        degres = np.bincount(sources, minlength=n).astype(np.float64)
+        degres[degres == 0] = 1.0
+
+        aleatoire = np.random.default_rng(self.graine)
+        vecteurs = [np.full(n, 1 / math.sqrt(n))]
+        for _ in range(2):
+            u = aleatoire.standard_normal(n)
+            u /= np.linalg.norm(u)
+            for _ in range(self.ITERATIONS):
+                precedent = u
+                for v in vecteurs:
+                    dv = degres * v
+                    u = u - (u @ dv) / (v @ dv) * v
+                u = 0.5 * (u + np.bincount(sources, weights=u[cibles], minlength=n) / degres)
+                norme = np.linalg.norm(u)
+                if norme == 0:
+                    break
+                u /= norme
+                if u @ precedent > 1 - self.TOLERANCE:
+                    break
+            vecteurs.append(u)
+        return vecteurs[1], vecteurs[2]
+
+    @staticmethod
+    def _normaliser(x, y):
+        """
+        Centre les positions et les ramène dans [-1, 1]², avec la même échelle
+        sur les deux axes (les proportions sont conservées).
+        """
+        if len(x) == 0:
+            return x, y
+        x = x - (x.min() + x.max()) / 2
+        y = y - (y.min() + y.max()) / 2
+        echelle = max(np.abs(x).max(), np.abs(y).max())
+        if echelle > 0:
+            x = x / echelle
+            y = y / echelle
+        return x, y
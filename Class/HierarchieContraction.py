@@ -0,0 +1,334 @@
+import hashlib
+import heapq
+import math
+import os
+import pickle
+
+from Class.MoteurItineraire import MoteurItineraire
+
+
+class HierarchieContraction:
+    """
+    Hiérarchie de contraction (Contraction Hierarchies) d’un réseau urbain.
+
+    Prétraitement (hors ligne), pour chaque critère (temps et distance) :
+    - les stations sont contractées une à une, dans l’ordre d’importance croissante
+      (différence d’arêtes + nombre de voisins déjà contractés) ;
+    - contracter une station v ajoute un raccourci u - w entre deux de ses voisins
+      lorsque le chemin u - v - w est le seul plus court chemin (recherche de témoin) ;
+    - chaque station conserve ses arêtes vers les stations de rang supérieur.
+
+    Requête : deux recherches de Dijkstra « montantes » (depuis le départ et depuis
+    l’arrivée) qui ne visitent qu’une petite partie du réseau ; les raccourcis
+    du chemin obtenu sont ensuite dépliés en stations réelles.
+
+    La hiérarchie correspond à une version du réseau : après une modification
+    (route ajoutée, fermée ou modifiée), les requêtes sont servies par le moteur
+    d’itinéraires jusqu’à ce que construire soit rappelée.
+    """
+
+    # Version du format de fichier : à incrémenter si la structure change
+    VERSION_FORMAT = 1
+
+    CRITERES = ("temps", "distance")
+
+    def __init__(self, reseau, limite_temoin=50):
+        """
+        - reseau : instance de ReseauUrbain
+        - limite_temoin : nombre maximal de stations fixées par une recherche de témoin
+          (une limite basse accélère le prétraitement au prix de raccourcis superflus)
+        """
+        self.reseau = reseau
+        self.moteur = MoteurItineraire(reseau)
+        self.limite_temoin = limite_temoin
+        self.rang = {}              # critère -> rang de contraction de chaque station
+        self.montant = {}           # critère -> par station : {voisin de rang supérieur: (poids, milieu)}
+        self.nb_raccourcis = {}     # critère -> nombre de raccourcis ajoutés
+        self.empreinte = None       # Empreinte du réseau prétraité
+        self.version = None         # Version du réseau prétraité
+
+    # PRÉTRAITEMENT
+    def construire(self, criteres=CRITERES):
+        """
+        Construit la hiérarchie pour chacun des critères demandés.
+        """
+        for critere in criteres:
+            self._contracter(critere)
+        self.empreinte = self.empreinte_reseau(self.reseau)
+        self.version = self.reseau.version
+        return self
+
+    def a_jour(self):
+        """
+        Indique si la hiérarchie correspond à l’état courant du réseau.
+        """
+        return self.version == self.reseau.version
+
+    def _recherche_temoin(self, graphe, source, exclu, limite, cibles):
+        """
+        Dijkstra local depuis source, sans passer par la station exclue,
+        arrêté au-delà du coût limite, après limite_temoin stations fixées,
+        ou dès que toutes les cibles sont fixées.
+        """
+        dist = {source: 0}
+        tas = [(0, source)]
+        fixes = 0
+        restantes = set(cibles)
+
+        while tas and fixes < self.limite_temoin:
+            d, u = heapq.heappop(tas)
+            if d > dist[u]:
+                continue
+            if d > limite:
+                break
+            fixes += 1
+            restantes.discard(u)
+            if not restantes:
+                break
+
+            for v, (poids, _) in graphe[u].items():
+                nouveau = d + poids
+                if v != exclu and nouveau < dist.get(v, math.inf):
+                    dist[v] = nouveau
+                    heapq.heappush(tas, (nouveau, v))
+
+        return dist
+
+    def _raccourcis(self, graphe, v):
+        """
+        Retourne les raccourcis (u, w, coût) nécessaires si la station v est contractée.
+        """
+        voisins = list(graphe[v].items())
+        raccourcis = []
+
+        for a, (u, (poids_u, _)) in enumerate(voisins):
+            cibles = {w: poids_u + poids_w for w, (poids_w, _) in voisins[a + 1:]}
+            if not cibles:
+                continue
+
+            dist = self._recherche_temoin(graphe, u, v, max(cibles.values()), cibles)
+            for w, cout in cibles.items():
+                if dist.get(w, math.inf) > cout:
+                    raccourcis.append((u, w, cout))
+
+        return raccourcis
+
+    def _contracter(self, critere):
+        """
+        Contracte toutes les stations pour un critère donné.
+        """
+        n = len(self.reseau.stations)
+        adjacence = self.reseau.adjacence(critere)
+
+        # Graphe restant (stations non contractées) : {voisin: (poids, milieu)}
+        graphe = [{w: (poids, None) for w, poids in adjacence[v].items()} for v in range(n)]
+        voisins_contractes = [0] * n
+        montant = [{} for _ in range(n)]
+        rang = [0] * n
+        nb_raccourcis = 0
+
+        def priorite(v, raccourcis):
+            return len(raccourcis) - len(graphe[v]) + voisins_contractes[v]
+
+        tas = [(priorite(v, self._raccourcis(graphe, v)), v) for v in range(n)]
+        heapq.heapify(tas)
+
+        prochain_rang = 0
+        while tas:
+            _, v = heapq.heappop(tas)
+
+            # Mise à jour paresseuse : la priorité a pu changer depuis l’insertion
+            raccourcis = self._raccourcis(graphe, v)
+            nouvelle = priorite(v, raccourcis)
+            if tas and nouvelle > tas[0][0]:
+                heapq.heappush(tas, (nouvelle, v))
+                continue
+
+            for u, w, cout in raccourcis:
+                existant = graphe[u].get(w)
+                if existant is None or cout < existant[0]:
+                    graphe[u][w] = (cout, v)
+                    graphe[w][u] = (cout, v)
+                    nb_raccourcis += 1
+
+            # Les arêtes restantes mènent toutes à des stations de rang supérieur
+            for u, arete in graphe[v].items():
+                montant[v][u] = arete
+                del graphe[u][v]
+                voisins_contractes[u] += 1
+            graphe[v] = {}
+
+            rang[v] = prochain_rang
+            prochain_rang += 1
+
+        self.rang[critere] = rang
+        self.montant[critere] = montant
+        self.nb_raccourcis[critere] = nb_raccourcis
+
+    # REQUÊTES
+    def _deplier(self, critere, a, b):
+        """
+        Remplace l’arête (éventuellement raccourci) a - b par la suite d’indices réels.
+        """
+        rang = self.rang[critere]
+        montant = self.montant[critere]
+
+        chemin = [a]
+        pile = [(a, b)]
+        while pile:
+            x, y = pile.pop()
+            _, milieu = montant[x][y] if rang[x] < rang[y] else montant[y][x]
+            if milieu is None:
+                chemin.append(y)
+            else:
+                # Traitement de x - milieu avant milieu - y
+                pile.append((milieu, y))
+                pile.append((x, milieu))
+        return chemin
+
+    def chemin(self, depart, arrivee, critere="temps"):
+        """
+        Retourne (chemin, coût) entre deux stations, ou (None, inf) si l’arrivée est inatteignable.
+        Si le réseau a changé depuis la construction, le calcul est confié au moteur.
+        """
+        if critere not in self.montant:
+            raise ValueError(f"Hiérarchie non construite pour le critère : {critere}")
+        if not self.a_jour():
+            return self.moteur.dijkstra(depart, arrivee, critere)
+
+        depart_i = self.moteur._index(depart)
+        arrivee_i = self.moteur._index(arrivee)
+        if depart_i == arrivee_i:
+            return [depart], 0
+
+        montant = self.montant[critere]
+
+        # Indice 0 : recherche depuis le départ, 1 : recherche depuis l’arrivée
+        dist = ({depart_i: 0}, {arrivee_i: 0})
+        precedent = ({depart_i: None}, {arrivee_i: None})
+        tas = ([(0, depart_i)], [(0, arrivee_i)])
+
+        meilleur = math.inf
+        rencontre = None
+
+        while tas[0] or tas[1]:
+            for sens in (0, 1):
+                if not tas[sens]:
+                    continue
+                d, u = heapq.heappop(tas[sens])
+                if d > dist[sens][u]:
+                    continue
+
+                # Cette recherche ne peut plus améliorer le meilleur chemin
+                if d >= meilleur:
+                    tas[sens].clear()
+                    continue
+
+                autre = dist[1 - sens].get(u)
+                if autre is not None and d + autre < meilleur:
+                    meilleur = d + autre
+                    rencontre = u
+
+                for w, (poids, _) in montant[u].items():
+                    nouveau = d + poids
+                    if nouveau < dist[sens].get(w, math.inf):
+                        dist[sens][w] = nouveau
+                        precedent[sens][w] = u
+                        heapq.heappush(tas[sens], (nouveau, w))
+
+        if rencontre is None:
+            return None, math.inf
+
+        # Suite d’arêtes montantes : départ -> rencontre <- arrivée
+        sommets = []
+        cur = rencontre
+        while cur is not None:
+            sommets.append(cur)
+            cur = precedent[0][cur]
+        sommets.reverse()
+        cur = precedent[1][rencontre]
+        while cur is not None:
+            sommets.append(cur)
+            cur = precedent[1][cur]
+
+        indices = [sommets[0]]
+        for a, b in zip(sommets, sommets[1:]):
+            indices.extend(self._deplier(critere, a, b)[1:])
+
+        return [self.reseau.stations[i].nom for i in indices], meilleur
+
+    def dijkstra(self, depart, arrivee, poids="temps"):
+        """
+        Même contrat que MoteurItineraire.dijkstra : les critères prétraités
+        sont servis par la hiérarchie, les autres poids par le moteur.
+        """
+        if isinstance(poids, str) and poids in self.montant:
+            return self.chemin(depart, arrivee, poids)
+        return self.moteur.dijkstra(depart, arrivee, poids)
+
+    # PERSISTANCE SUR DISQUE
+    @staticmethod
+    def empreinte_reseau(reseau):
+        """
+        Empreinte SHA-256 des stations et des routes (poids compris) d’un réseau.
+        """
+        empreinte = hashlib.sha256()
+        for station in reseau.stations:
+            empreinte.update(station.nom.encode("utf-8") + b"\0")
+        for arete in reseau.aretes():
+            empreinte.update(repr(arete).encode("ascii"))
+        return empreinte.hexdigest()
+
+    def sauvegarder(self, chemin_fichier):
+        """
+        Sauvegarde l’index (rangs et arêtes montantes) dans un fichier.
+        """
+        dossier = os.path.dirname(chemin_fichier)
+        if dossier:
+            os.makedirs(dossier, exist_ok=True)
+
+        contenu = {
+            "version": self.VERSION_FORMAT,
+            "empreinte": self.empreinte,
+            "limite_temoin": self.limite_temoin,
+            "rang": self.rang,
+            "montant": self.montant,
+            "nb_raccourcis": self.nb_raccourcis,
+        }
+
+        temporaire = chemin_fichier + ".tmp"
+        with open(temporaire, "wb") as fichier:
+            pickle.dump(contenu, fichier, protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(temporaire, chemin_fichier)
+
+    @classmethod
+    def charger(cls, reseau, chemin_fichier):
+        """
+        Recharge un index sauvegardé. Retourne None si le fichier est absent,
+        d’un autre format, ou construit pour un autre réseau.
+        (Les numéros de version ne survivent pas au processus : c’est l’empreinte,
+        identique, qui rattache l’index à la version courante du réseau.)
+        """
+        if not os.path.exists(chemin_fichier):
+            return None
+
+        try:
+            with open(chemin_fichier, "rb") as fichier:
+                contenu = pickle.load(fichier)
+        except (OSError, pickle.UnpicklingError, EOFError):
+            return None
+
+        if (
+            not isinstance(contenu, dict)
+            or contenu.get("version") != cls.VERSION_FORMAT
+            or contenu.get("empreinte") != cls.empreinte_reseau(reseau)
+        ):
+            return None
+
+        hierarchie = cls(reseau, contenu["limite_temoin"])
+        hierarchie.rang = contenu["rang"]
+        hierarchie.montant = contenu["montant"]
+        hierarchie.nb_raccourcis = contenu["nb_raccourcis"]
+        hierarchie.empreinte = contenu["empreinte"]
+        hierarchie.version = reseau.version
+        return hierarchie
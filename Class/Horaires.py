@@ -0,0 +1,193 @@
+import heapq
+from array import array
+
+from csv_files.ReadCSV import BASE_PATH, iter_csv_stations, iter_csv_horaires
+
+
+class Horaires:
+    """
+    Couche horaire d’un réseau urbain : les courses réellement effectuées
+    (un train d’une ligne qui dessert une suite d’arrêts à des heures précises).
+
+    Stockage en tableaux plats, comme StockageTrajets :
+    - les arrêts de toutes les courses sont concaténés (offsets[k] : début de la course k),
+      avec leurs heures d’arrivée et de départ (minutes depuis minuit) ;
+    - les connexions élémentaires (un tronçon entre deux arrêts successifs d’une course)
+      sont rangées dans des tableaux parallèles triés par heure de départ,
+      ce qui permet de les parcourir dans l’ordre chronologique (Connection Scan).
+    """
+
+    def __init__(self, reseau, temps_correspondance=0):
+        """
+        - reseau : instance de ReseauUrbain (les arrêts sont des stations du réseau)
+        - temps_correspondance : temps minimal (minutes) pour changer de course dans une station
+        """
+        self.reseau = reseau
+        self.temps_correspondance = temps_correspondance
+
+        # Courses et arrêts
+        self.ids_courses = []               # Identifiant de chaque course
+        self.lignes = []                    # Ligne de chaque course
+        self.arrets = array("i")            # Station (index du réseau) de chaque arrêt
+        self.heures_arrivee = array("d")    # Heure d’arrivée à chaque arrêt
+        self.heures_depart = array("d")     # Heure de départ de chaque arrêt
+        self.offsets = array("q", [0])      # Début des arrêts de chaque course
+
+        # Connexions triées par heure de départ (reconstruites à la demande)
+        self.connexion_course = array("i")
+        self.connexion_depart = array("i")          # Station de départ
+        self.connexion_arrivee = array("i")         # Station d’arrivée
+        self.connexion_heure_depart = array("d")
+        self.connexion_heure_arrivee = array("d")
+        self._connexions_a_jour = True
+
+    def __len__(self):
+        """
+        Nombre de courses.
+        """
+        return len(self.ids_courses)
+
+    # AJOUT D'UNE COURSE
+    def ajouter_course(self, id_course, ligne, passages):
+        """
+        Ajoute une course au tableau horaire.
+
+        :param passages: liste de (nom de station, heure d’arrivée, heure de départ),
+                         dans l’ordre du parcours, heures en minutes depuis minuit
+        """
+        if len(passages) < 2:
+            raise ValueError(f"La course {id_course} doit desservir au moins deux arrêts")
+
+        index = self.reseau.index_par_nom
+        precedente = None
+        for nom_station, arrivee, depart in passages:
+            if nom_station not in index:
+                raise ValueError(f"Station inconnue dans la course {id_course} : {nom_station}")
+            if depart < arrivee or (precedente is not None and arrivee < precedente):
+                raise ValueError(f"Heures décroissantes dans la course {id_course} à {nom_station}")
+            precedente = depart
+
+        self.ids_courses.append(id_course)
+        self.lignes.append(ligne)
+        for nom_station, arrivee, depart in passages:
+            self.arrets.append(index[nom_station])
+            self.heures_arrivee.append(arrivee)
+            self.heures_depart.append(depart)
+        self.offsets.append(len(self.arrets))
+
+        self._connexions_a_jour = False
+
+    @classmethod
+    def depuis_csv(cls, reseau, base_path=BASE_PATH, temps_correspondance=0):
+        """
+        Construit le tableau horaire à partir du fichier horaires_xl.csv
+        (une ligne par arrêt ; les arrêts d’une course sont consécutifs).
+        Les stations y sont désignées par leur identifiant de stations_xl.csv.
+        """
+        id_to_nom = {str(station_id): nom for station_id, nom in iter_csv_stations(base_path)}
+
+        horaires = cls(reseau, temps_correspondance)
+        course = None
+        for numero, id_course, ligne, station_id, arrivee, depart in iter_csv_horaires(base_path, avec_numeros=True):
+            if station_id not in id_to_nom:
+                raise ValueError(
+                    f"horaires_xl.csv, ligne {numero} : Station inconnue dans la course {id_course} : {station_id}"
+                )
+            if course is None or course[0] != id_course:
+                if course is not None:
+                    horaires.ajouter_course(*course)
+                course = (id_course, ligne, [])
+            course[2].append((id_to_nom[station_id], arrivee, depart))
+        if course is not None:
+            horaires.ajouter_course(*course)
+
+        return horaires
+
+    # CONNEXIONS ÉLÉMENTAIRES
+    def connexions(self):
+        """
+        Retourne les tableaux parallèles des connexions, triées par heure de départ :
+        (course, station de départ, station d’arrivée, heure de départ, heure d’arrivée).
+        """
+        if not self._connexions_a_jour:
+            self._indexer()
+        return (
+            self.connexion_course,
+            self.connexion_depart,
+            self.connexion_arrivee,
+            self.connexion_heure_depart,
+            self.connexion_heure_arrivee,
+        )
+
+    def _indexer(self):
+        """
+        Reconstruit les tableaux de connexions à partir des courses.
+        """
+        connexions = []
+        for course in range(len(self.ids_courses)):
+            for position in range(self.offsets[course], self.offsets[course + 1] - 1):
+                connexions.append((
+                    self.heures_depart[position],
+                    self.heures_arrivee[position + 1],
+                    course,
+                    self.arrets[position],
+                    self.arrets[position + 1],
+                ))
+        # À heure de départ égale, l’ordre des arrêts d’une même course est conservé
+        connexions.sort(key=lambda connexion: (connexion[0], connexion[1]))
+        connexions = self._ordonner_instantanees(connexions)
+
+        self.connexion_heure_depart = array("d", (c[0] for c in connexions))
+        self.connexion_heure_arrivee = array("d", (c[1] for c in connexions))
+        self.connexion_course = array("i", (c[2] for c in connexions))
+        self.connexion_depart = array("i", (c[3] for c in connexions))
+        self.connexion_arrivee = array("i", (c[4] for c in connexions))
+        self._connexions_a_jour = True
+
+    @staticmethod
+    def _ordonner_instantanees(connexions):
+        """
+        Réordonne les connexions de durée nulle partant à la même heure
+        (triées par heure de départ puis d’arrivée, elles sont consécutives) :
+        une connexion qui arrive à une station passe avant celles qui en partent,
+        pour qu’un seul parcours chronologique puisse les enchaîner.
+        Tri topologique (Kahn) dans chaque groupe ; l’ordre initial départage
+        les ex aequo, et une éventuelle boucle garde son ordre initial.
+        """
+        resultat = []
+        debut = 0
+        total = len(connexions)
+        while debut < total:
+            heure = connexions[debut][0]
+            fin = debut
+            while fin < total and connexions[fin][0] == heure and connexions[fin][1] == heure:
+                fin += 1
+            if fin - debut < 2:
+                resultat.append(connexions[debut])
+                debut += 1
+                continue
+
+            groupe = connexions[debut:fin]
+            # Arc a -> b lorsque a arrive à la station de départ de b
+            partants = {}
+            for position, connexion in enumerate(groupe):
+                partants.setdefault(connexion[3], []).append(position)
+            entrants = [0] * len(groupe)
+            for connexion in groupe:
+                for position in partants.get(connexion[4], ()):
+                    entrants[position] += 1
+
+            prets = [position for position in range(len(groupe)) if entrants[position] == 0]
+            heapq.heapify(prets)
+            places = [False] * len(groupe)
+            while prets:
+                position = heapq.heappop(prets)
+                places[position] = True
+                resultat.append(groupe[position])
+                for suivante in partants.get(groupe[position][4], ()):
+                    entrants[suivante] -= 1
+                    if entrants[suivante] == 0:
+                        heapq.heappush(prets, suivante)
+            resultat.extend(groupe[position] for position in range(len(groupe)) if not places[position])
+            debut = fin
+        return resultat
@@ -0,0 +1,82 @@
+class IndexConnexite:
+    """
+    Index des composantes connexes d’un réseau urbain.
+
+    Les composantes sont calculées une seule fois par version du réseau
+    (union-find sur la liste des routes), ce qui permet ensuite de savoir
+    en O(1) si deux stations sont reliées par au moins un chemin.
+    """
+
+    def __init__(self, reseau):
+        """
+        Construit l’index à partir d'un réseau urbain.
+        - reseau : instance de ReseauUrbain
+        """
+        self.reseau = reseau
+        self.version = None                 # Version du réseau indexée
+        self.composante_par_index = []      # Index de station -> identifiant de composante
+        self.nb_composantes = 0
+        self.mettre_a_jour()
+
+    # CONSTRUCTION DE L'INDEX
+    def mettre_a_jour(self):
+        """
+        Recalcule les composantes si le réseau a été modifié depuis la dernière construction.
+        """
+        if self.version == self.reseau.version:
+            return
+
+        n = len(self.reseau.stations)
+        parent = list(range(n))
+
+        def racine(x):
+            # Recherche de la racine avec compression de chemin
+            while parent[x] != x:
+                parent[x] = parent[parent[x]]
+                x = parent[x]
+            return x
+
+        # Union des extrémités de chaque route
+        for i, j, _, _ in self.reseau.aretes():
+            ri = racine(i)
+            rj = racine(j)
+            if ri != rj:
+                parent[max(ri, rj)] = min(ri, rj)
+
+        # Numérotation des composantes dans l’ordre des stations (0, 1, 2, ...)
+        identifiants = {}
+        self.composante_par_index = []
+        for i in range(n):
+            r = racine(i)
+            if r not in identifiants:
+                identifiants[r] = len(identifiants)
+            self.composante_par_index.append(identifiants[r])
+
+        self.nb_composantes = len(identifiants)
+        self.version = self.reseau.version
+
+    # REQUÊTES
+    def composante(self, nom_station):
+        """
+        Retourne l’identifiant de composante d’une station, ou None si elle est inconnue.
+        """
+        index = self.reseau.index_par_nom.get(nom_station)
+        if index is None:
+            return None
+        return self.composante_par_index[index]
+
+    def atteignable(self, depart, arrivee):
+        """
+        Indique si la station d’arrivée est atteignable depuis la station de départ.
+        """
+        composante = self.composante(depart)
+        return composante is not None and composante == self.composante(arrivee)
+
+    def composantes(self):
+        """
+        Retourne un dictionnaire identifiant de composante -> liste des noms de stations.
+        """
+        resultat = {c: [] for c in range(self.nb_composantes)}
+        for index, composante in enumerate(self.composante_par_index):
+            resultat[composante].append(self.reseau.stations[index].nom)
+        return resultat
@@ -6,28 +6,44 @@ from Class.Noeud import Noeud
 class ListeChainee:
 
     # Classe représentant une liste chaînée de Noeud.
-    # Contient une tete avec le premier Noeud de la liste et des fonction pour interagir avec la liste.
+    # Contient une tete avec le premier Noeud de la liste, un pointeur vers le dernier Noeud (queue)
+    # et la longueur en cache : l'ajout en fin et le calcul de la longueur se font en O(1).
+    # Tous les parcours sont itératifs (pas de limite de récursion sur les longs trajets).
 
     def __init__(self, tete=None):
         #Initialise une liste avec une tête et un reste.
-        #Tete: classe Noeud
-        self.tete = tete
+        #Tete: classe Noeud (par défaut, une liste vide)
+        self.tete = None
+        self.set_tete(Noeud.vide() if tete is None else tete)
 
     def get_tete(self):
         #Retourne la valeur de la tête de la liste.
         return self.tete
 
     def set_tete(self, tete):
-        #set l'attribut tete.
+        #set l'attribut tete, puis recalcule la queue et la longueur (un seul parcours).
+        if tete is self.tete:
+            return
         self.tete = tete
-
-    #La liste chainee est composée de noeud avec une entité ListeChainee devant.
-    #par simplicité, les fonctions pour parcourir et intéragir avec la liste sont dans Noeud. Les fonctions suivantes permet de utiliser ceux du premier Noeud.
+        self.queue = None
+        self.longueur = 0
+        noeud = tete
+        while not noeud.est_vide():
+            self.queue = noeud
+            self.longueur += 1
+            noeud = noeud.suivant
 
     def get_longueur(self):
-        #Calcule la longeur de la liste Chainée.
+        #Retourne la longueur de la liste Chainée (valeur en cache).
         #Retourne: - Nombre entier représentant la taille de la liste.
-        return self.tete.get_longueur()
+        return self.longueur
+
+    def __len__(self):
+        return self.longueur
+
+    def __iter__(self):
+        #Parcourt itérativement les éléments de la liste.
+        return iter(self.tete)
 
     def affichage(self):
         #Génère une représentation en string des éléments de la liste.
@@ -37,19 +53,27 @@ class ListeChainee:
     def ListeToString(self):
         #Génère une représentation en chaîne des éléments de la liste séparé par des ';' pour le traitement.
         #Retourne: - Une chaîne contenant les éléments séparés par des ';'.
-        return self.tete.affichage()
+        return self.tete.ListeToString()
 
     def ajoute_fin(self, nouvel_element):
-        #Ajoute un nouvel élément au bout de la liste.
+        #Ajoute un nouvel élément au bout de la liste, en O(1) grâce à la queue.
+        #La liste est modifiée sur place.
 
         #Paramètres: - nouvel_element : élément à ajouter.
-        #Retourne: - Une nouvelle liste avec l'élément ajouté.
-
-        return self.tete.ajoute_fin(nouvel_element)
+        #Retourne: - La tête de la liste (compatible avec set_tete(liste.ajoute_fin(...))).
+
+        if self.queue is None:
+            self.tete = Noeud(nouvel_element, self.tete)
+            self.queue = self.tete
+        else:
+            self.queue.suivant = Noeud(nouvel_element, self.queue.suivant)
+            self.queue = self.queue.suivant
+        self.longueur += 1
+        return self.tete
 
     def parcourir(self):
-        #retourne la liste chainé en liste Python.
-        return self.tete.ListeToString().split(sep=";")
+        #retourne la liste chainé en liste Python (sans passer par une chaîne de caractères).
+        return list(self)
 
 #Class de test
 class TestListeChainee(unittest.TestCase):
@@ -0,0 +1,140 @@
+import math
+
+try:
+    import numpy as np
+except ImportError:  # NumPy est optionnel : seul ce backend en dépend
+    np = None
+
+
+class MatricesNumpy:
+    """
+    Backend matriciel NumPy d’un réseau urbain.
+
+    Les matrices des temps et des distances sont des tableaux float64 contigus
+    dans lesquels une liaison absente vaut +inf (au lieu de -1).
+    Les calculs de masse (coût de segments, coût de trajets entiers,
+    préparation des heatmaps) deviennent des opérations vectorisées.
+    """
+
+    def __init__(self, reseau):
+        """
+        Construit les matrices à partir des listes d’adjacence du réseau.
+        - reseau : instance de ReseauUrbain
+        """
+        if np is None:
+            raise ImportError("Le backend matriciel nécessite NumPy")
+
+        self.reseau = reseau
+        self.version = reseau.version
+
+        n = len(reseau.stations)
+        self.distances = np.full((n, n), math.inf, dtype=np.float64)
+        self.temps = np.full((n, n), math.inf, dtype=np.float64)
+
+        aretes = list(reseau.aretes())
+        if aretes:
+            i, j, distances, temps = (np.array(colonne) for colonne in zip(*aretes))
+            i = i.astype(np.intp)
+            j = j.astype(np.intp)
+
+            # Liaisons bidirectionnelles : remplissage symétrique
+            self.distances[i, j] = distances
+            self.distances[j, i] = distances
+            self.temps[i, j] = temps
+            self.temps[j, i] = temps
+
+    def matrice(self, critere):
+        """
+        Retourne la matrice correspondant au critère ("temps" ou "distance").
+        """
+        if critere == "temps":
+            return self.temps
+        if critere == "distance":
+            return self.distances
+        raise ValueError(f"Critère inconnu : {critere}")
+
+    # VOISINAGE
+    def masque_voisins(self, index):
+        """
+        Retourne le masque booléen des stations reliées directement à la station index.
+        """
+        return np.isfinite(self.temps[index])
+
+    def voisins(self, index):
+        """
+        Retourne le tableau des indices des voisins directs de la station index.
+        """
+        return np.flatnonzero(self.masque_voisins(index))
+
+    # COÛTS DE SEGMENTS ET DE TRAJETS
+    def cout_segments(self, departs, arrivees):
+        """
+        Retourne les distances et les temps de plusieurs segments en une seule lecture.
+        Les segments inexistants valent +inf.
+        """
+        departs = np.asarray(departs, dtype=np.intp)
+        arrivees = np.asarray(arrivees, dtype=np.intp)
+        return self.distances[departs, arrivees], self.temps[departs, arrivees]
+
+    @staticmethod
+    def segments_trajets(indices, longueurs):
+        """
+        Découpe un lot de trajets concaténés en segments (station, station suivante).
+
+        :param indices: indices de stations de tous les trajets, concaténés
+        :param longueurs: nombre de stations de chaque trajet
+        :return: (trajets, departs, arrivees) : numéro de trajet et extrémités de chaque segment
+        """
+        indices = np.asarray(indices, dtype=np.intp)
+        longueurs = np.asarray(longueurs, dtype=np.intp)
+
+        if len(indices) < 2:
+            vide = np.empty(0, dtype=np.intp)
+            return vide, vide.copy(), vide.copy()
+
+        # Numéro de trajet de chaque position, puis des segments (position, position + 1)
+        trajet_par_position = np.repeat(np.arange(len(longueurs)), longueurs)
+        meme_trajet = trajet_par_position[:-1] == trajet_par_position[1:]
+
+        return (
+            trajet_par_position[:-1][meme_trajet],
+            indices[:-1][meme_trajet],
+            indices[1:][meme_trajet],
+        )
+
+    def cout_trajets(self, indices, longueurs):
+        """
+        Calcule en bloc les coûts théoriques d’un lot de trajets.
+
+        :param indices: indices de stations de tous les trajets, concaténés
+        :param longueurs: nombre de stations de chaque trajet
+        :return: (distances, temps, segments_inexistants) où les deux premiers
+                 tableaux contiennent un total par trajet (segments inexistants exclus)
+                 et le dernier est un tableau (m, 3) de lignes (trajet, départ, arrivée)
+        """
+        nb_trajets = len(longueurs)
+        trajets, departs, arrivees = self.segments_trajets(indices, longueurs)
+
+        distances, temps = self.cout_segments(departs, arrivees)
+        manquants = ~np.isfinite(distances) | ~np.isfinite(temps)
+
+        distances_totales = np.bincount(
+            trajets, weights=np.where(manquants, 0.0, distances), minlength=nb_trajets
+        )
+        temps_totaux = np.bincount(
+            trajets, weights=np.where(manquants, 0.0, temps), minlength=nb_trajets
+        )
+        segments_inexistants = np.column_stack(
+            (trajets[manquants], departs[manquants], arrivees[manquants])
+        )
+
+        return distances_totales, temps_totaux, segments_inexistants
+
+    # PRÉPARATION DES HEATMAPS
+    def pour_affichage(self, critere):
+        """
+        Retourne une copie de la matrice où les liaisons absentes valent NaN
+        (affichées en blanc sur une heatmap).
+        """
+        matrice = self.matrice(critere)
+        return np.where(np.isfinite(matrice), matrice, np.nan)
@@ -0,0 +1,129 @@
+import heapq
+import math
+
+from Class.MoteurItineraire import MoteurItineraire
+
+
+class MoteurDependantTemps:
+    """
+    Calcul d’itinéraires lorsque les temps de parcours dépendent de l’heure de départ.
+
+    - arrivee_au_plus_tot : Dijkstra dont l’étiquette d’une station est son heure
+      d’arrivée ; grâce à la propriété FIFO des profils, il reste exact.
+    - profil_arrivee : une seule recherche pour toute une plage d’heures de départ,
+      chaque étiquette étant le vecteur des heures d’arrivée (une par départ).
+    """
+
+    def __init__(self, reseau, profils):
+        """
+        - reseau : instance de ReseauUrbain
+        - profils : instance de ProfilsTemps associée au réseau
+        """
+        self.reseau = reseau
+        self.profils = profils
+        self.moteur = MoteurItineraire(reseau)
+        self.noeuds_fixes = 0   # Nombre de stations traitées par la dernière recherche
+
+    # ARRIVÉE AU PLUS TÔT
+    def arrivee_au_plus_tot(self, depart, arrivee, heure_depart):
+        """
+        Itinéraire arrivant le plus tôt possible pour un départ à heure_depart
+        (minutes depuis minuit).
+
+        :return: (chemin, heure d’arrivée), ou (None, inf) si l’arrivée est inatteignable
+        """
+        depart_i = self.moteur._index(depart)
+        arrivee_i = self.moteur._index(arrivee)
+        adjacence = self.reseau.adjacence_temps
+
+        heures = {depart_i: heure_depart}
+        precedent = {depart_i: None}
+        fixes = set()
+        tas = [(heure_depart, depart_i)]
+
+        while tas:
+            h, u = heapq.heappop(tas)
+            if u in fixes:
+                continue
+            fixes.add(u)
+            if u == arrivee_i:
+                break
+
+            for v in adjacence[u]:
+                nouvelle = self.profils.arrivee(u, v, h)
+                if v not in fixes and nouvelle < heures.get(v, math.inf):
+                    heures[v] = nouvelle
+                    precedent[v] = u
+                    heapq.heappush(tas, (nouvelle, v))
+
+        self.noeuds_fixes = len(fixes)
+
+        if arrivee_i not in fixes:
+            return None, math.inf
+
+        return self.moteur.reconstruire_chemin(precedent, arrivee_i), heures[arrivee_i]
+
+    # PROFIL D'ARRIVÉE SUR UNE PLAGE DE DÉPARTS
+    def profil_arrivee(self, depart, arrivee, debut, fin, pas=5):
+        """
+        Heures d’arrivée au plus tôt pour des départs échelonnés de debut à fin
+        (inclus) tous les pas minutes, calculées en une seule recherche.
+
+        :return: liste de (heure de départ, heure d’arrivée), inf si inatteignable ;
+                 entre deux départs, l’arrivée peut être interpolée linéairement
+        """
+        if pas <= 0:
+            raise ValueError("Le pas doit être strictement positif")
+        if fin < debut:
+            raise ValueError("La fin de la plage précède son début")
+
+        depart_i = self.moteur._index(depart)
+        arrivee_i = self.moteur._index(arrivee)
+        adjacence = self.reseau.adjacence_temps
+
+        departs = []
+        heure = debut
+        while heure <= fin:
+            departs.append(heure)
+            heure += pas
+
+        # Étiquette de chaque station : vecteur des heures d’arrivée (une par départ)
+        etiquettes = {depart_i: list(departs)}
+        a_traiter = {depart_i}
+        tas = [(departs[0], depart_i)]
+        traitements = 0
+
+        while tas:
+            cle, u = heapq.heappop(tas)
+            if u not in a_traiter:
+                continue
+
+            # Aucune composante ne peut plus améliorer l’arrivée (FIFO, temps positifs)
+            cible = etiquettes.get(arrivee_i)
+            if cible is not None and cle >= max(cible):
+                break
+
+            a_traiter.discard(u)
+            traitements += 1
+            etiquette = etiquettes[u]
+
+            for v in adjacence[u]:
+                actuelle = etiquettes.get(v)
+                nouvelle = [self.profils.arrivee(u, v, h) for h in etiquette]
+                if actuelle is None:
+                    etiquettes[v] = nouvelle
+                    ameliorees = nouvelle
+                else:
+                    ameliorees = []
+                    for k, h in enumerate(nouvelle):
+                        if h < actuelle[k]:
+                            actuelle[k] = h
+                            ameliorees.append(h)
+                if ameliorees:
+                    a_traiter.add(v)
+                    heapq.heappush(tas, (min(ameliorees), v))
+
+        self.noeuds_fixes = traitements
+
+        resultat = etiquettes.get(arrivee_i, [math.inf] * len(departs))
+        return list(zip(departs, resultat))
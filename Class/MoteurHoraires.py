@@ -0,0 +1,199 @@
+import bisect
+import math
+
+
+class MoteurHoraires:
+    """
+    Calcul d’itinéraires sur le tableau horaire (Connection Scan Algorithm).
+
+    Les connexions sont parcourues une seule fois, dans l’ordre des heures
+    de départ : une connexion est utilisable si le voyageur est déjà dans
+    la course, ou s’il est en station à temps pour y monter. Le parcours
+    s’arrête dès que les départs restants sont postérieurs à la meilleure
+    arrivée connue.
+
+    Pour minimiser le nombre de correspondances, le parcours est répété
+    par tours (comme RAPTOR) : au tour k, on ne peut monter que dans une
+    station atteinte avec au plus k - 1 courses.
+    """
+
+    def __init__(self, horaires):
+        """
+        - horaires : instance de Horaires
+        """
+        self.horaires = horaires
+        self.reseau = horaires.reseau
+        self.connexions_parcourues = 0  # Nombre de connexions examinées par la dernière requête
+
+    def _index(self, nom_station):
+        """
+        Retourne l’index d’une station, ou lève une erreur si elle est inconnue.
+        """
+        if nom_station not in self.reseau.index_par_nom:
+            raise ValueError(f"Station inconnue : {nom_station}")
+        return self.reseau.index_par_nom[nom_station]
+
+    # PARCOURS DES CONNEXIONS
+    def _scanner(self, depart_i, cible_i, heure, accessibles, meilleures, arrivee_par, montee_par):
+        """
+        Un parcours chronologique des connexions à partir de heure.
+
+        - accessibles : heure à partir de laquelle on peut monter dans une course à chaque station ;
+          si None, elle se déduit au fil du parcours des meilleures heures d’arrivée
+        - meilleures : meilleures heures d’arrivée, mises à jour sur place
+        - arrivee_par / montee_par : dernière connexion et connexion de montée
+          de l’étape qui mène à chaque station, mises à jour sur place
+        Retourne les stations améliorées.
+        """
+        course, depart, arrivee, heure_depart, heure_arrivee = self.horaires.connexions()
+        correspondance = self.horaires.temps_correspondance
+        embarque = {}       # Course -> connexion de montée
+        ameliorees = set()
+
+        c = bisect.bisect_left(heure_depart, heure)
+        fin = len(heure_depart)
+        premiere = c
+        while c < fin:
+            hd = heure_depart[c]
+            if hd >= meilleures[cible_i]:
+                break
+
+            k = course[c]
+            montee = embarque.get(k)
+            if montee is None:
+                u = depart[c]
+                if accessibles is not None:
+                    pret = accessibles[u]
+                elif u == depart_i:
+                    pret = meilleures[u]
+                else:
+                    pret = meilleures[u] + correspondance
+                if pret > hd:
+                    c += 1
+                    continue
+                embarque[k] = montee = c
+
+            v = arrivee[c]
+            ha = heure_arrivee[c]
+            if ha < meilleures[v]:
+                meilleures[v] = ha
+                arrivee_par[v] = c
+                montee_par[v] = montee
+                ameliorees.add(v)
+            c += 1
+
+        self.connexions_parcourues += c - premiere
+        return ameliorees
+
+    def _accessibles(self, depart_i, heures):
+        """
+        Heures de montée possibles : le temps de correspondance ne s’applique
+        pas à la station de départ.
+        """
+        correspondance = self.horaires.temps_correspondance
+        accessibles = [h + correspondance for h in heures]
+        accessibles[depart_i] = heures[depart_i]
+        return accessibles
+
+    def _etapes(self, depart_i, cible_i, tours):
+        """
+        Reconstruit les étapes menant à cible_i :
+        liste de (ligne, course, station de montée, heure de départ, station de descente, heure d’arrivée).
+
+        - tours : tableaux (arrivee_par, montee_par) de chaque tour ; chaque étape
+          remonte d’un tour (la station de montée avait été atteinte au tour précédent)
+        """
+        horaires = self.horaires
+        course, depart, arrivee, heure_depart, heure_arrivee = horaires.connexions()
+        stations = self.reseau.stations
+
+        etapes = []
+        station = cible_i
+        tour = len(tours) - 1
+        while station != depart_i:
+            arrivee_par, montee_par = tours[tour]
+            tour = max(tour - 1, 0)
+            fin = arrivee_par[station]
+            debut = montee_par[station]
+            k = course[debut]
+            etapes.append((
+                horaires.lignes[k],
+                horaires.ids_courses[k],
+                stations[depart[debut]].nom,
+                heure_depart[debut],
+                stations[arrivee[fin]].nom,
+                heure_arrivee[fin],
+            ))
+            station = depart[debut]
+        etapes.reverse()
+        return etapes
+
+    # ARRIVÉE AU PLUS TÔT
+    def arrivee_au_plus_tot(self, depart, arrivee, heure):
+        """
+        Itinéraire arrivant le plus tôt pour un départ à partir de heure (minutes depuis minuit).
+
+        :return: (étapes, heure d’arrivée), ou (None, inf) si aucune course ne convient
+        """
+        depart_i = self._index(depart)
+        arrivee_i = self._index(arrivee)
+        self.connexions_parcourues = 0
+        if depart_i == arrivee_i:
+            return [], heure
+
+        n = len(self.reseau.stations)
+        meilleures = [math.inf] * n
+        meilleures[depart_i] = heure
+        arrivee_par = [-1] * n
+        montee_par = [-1] * n
+
+        # Une seule passe : les stations atteintes deviennent accessibles au fil du parcours
+        self._scanner(depart_i, arrivee_i, heure, None, meilleures, arrivee_par, montee_par)
+
+        if meilleures[arrivee_i] == math.inf:
+            return None, math.inf
+        return self._etapes(depart_i, arrivee_i, [(arrivee_par, montee_par)]), meilleures[arrivee_i]
+
+    # MINIMUM DE CORRESPONDANCES
+    def moins_de_correspondances(self, depart, arrivee, heure, max_courses=5):
+        """
+        Compromis entre nombre de courses et heure d’arrivée : pour k = 1, 2, ...,
+        max_courses, meilleure arrivée avec au plus k courses, lorsqu’elle améliore
+        celle obtenue avec moins de courses.
+
+        :return: liste de (nombre de correspondances, heure d’arrivée, étapes),
+                 vide si aucune course ne convient ; le premier élément minimise
+                 les correspondances, le dernier l’heure d’arrivée
+        """
+        depart_i = self._index(depart)
+        arrivee_i = self._index(arrivee)
+        self.connexions_parcourues = 0
+        if depart_i == arrivee_i:
+            return [(0, heure, [])]
+
+        n = len(self.reseau.stations)
+        meilleures = [math.inf] * n
+        meilleures[depart_i] = heure
+        arrivee_par = [-1] * n
+        montee_par = [-1] * n
+
+        resultats = []
+        tours = []
+        for _ in range(max_courses):
+            # Tour suivant : on ne monte que là où l’on était au tour précédent
+            accessibles = self._accessibles(depart_i, meilleures)
+            meilleures = list(meilleures)
+            arrivee_par = list(arrivee_par)
+            montee_par = list(montee_par)
+
+            ameliorees = self._scanner(depart_i, arrivee_i, heure, accessibles, meilleures, arrivee_par, montee_par)
+            if not ameliorees:
+                break
+            tours.append((arrivee_par, montee_par))
+
+            if arrivee_i in ameliorees:
+                etapes = self._etapes(depart_i, arrivee_i, tours)
+                resultats.append((len(etapes) - 1, meilleures[arrivee_i], etapes))
+
+        return resultats
+
@@ -0,0 +1,275 @@
+import heapq
+import math
+
+
+class MoteurItineraire:
+    """
+    Moteur de calcul d’itinéraires sur un réseau urbain.
+
+    L’algorithme de Dijkstra utilise un tas binaire (suppression paresseuse
+    des entrées obsolètes) sur les listes d’adjacence du réseau :
+    une requête coûte O((V + E) log V) et s’arrête dès que l’arrivée est fixée.
+    """
+
+    def __init__(self, reseau):
+        """
+        Initialise le moteur à partir d'un réseau urbain.
+        - reseau : instance de ReseauUrbain
+        """
+        self.reseau = reseau
+        self.noeuds_fixes = 0           # Nombre de sommets fixés par la dernière recherche
+        self._vitesse_maximale = None   # Cache (version du réseau, vitesse en km/min)
+
+    # RÉSOLUTION DES POIDS
+    def _adjacence(self, poids):
+        """
+        Retourne des listes d’adjacence (index -> poids) à partir de :
+        - un critère ("temps" ou "distance")
+        - une matrice dense où -1 signifie absence de liaison
+        - des listes d’adjacence déjà construites
+        """
+        if isinstance(poids, str):
+            return self.reseau.adjacence(poids)
+
+        if poids and isinstance(poids[0], dict):
+            return poids
+
+        return [
+            {j: valeur for j, valeur in enumerate(ligne) if valeur != -1}
+            for ligne in poids
+        ]
+
+    def _index(self, nom_station):
+        """
+        Retourne l’index d’une station, ou lève une erreur si elle est inconnue.
+        """
+        if nom_station not in self.reseau.index_par_nom:
+            raise ValueError(f"Station inconnue : {nom_station}")
+        return self.reseau.index_par_nom[nom_station]
+
+    # ARBRE DES PLUS COURTS CHEMINS
+    def arbre(self, depart_i, adjacence, arrivee_i=None):
+        """
+        Calcule les plus courts chemins depuis l’index depart_i.
+
+        Si arrivee_i est fourni, la recherche s’arrête dès que l’arrivée est fixée.
+        Retourne deux dictionnaires : index -> coût, index -> prédécesseur.
+        """
+        dist = {depart_i: 0}
+        precedent = {depart_i: None}
+        fixes = set()
+        tas = [(0, depart_i)]
+
+        while tas:
+            d, u = heapq.heappop(tas)
+
+            # Entrée obsolète : le sommet a déjà été fixé avec un meilleur coût
+            if u in fixes:
+                continue
+            fixes.add(u)
+
+            if u == arrivee_i:
+                break
+
+            # Relaxation des arêtes sortantes
+            for v, poids in adjacence[u].items():
+                nouveau = d + poids
+                if v not in fixes and nouveau < dist.get(v, math.inf):
+                    dist[v] = nouveau
+                    precedent[v] = u
+                    heapq.heappush(tas, (nouveau, v))
+
+        self.noeuds_fixes = len(fixes)
+        return dist, precedent
+
+    # RECONSTRUCTION D'UN CHEMIN
+    def reconstruire_chemin(self, precedent, arrivee_i):
+        """
+        Reconstruit la liste des noms de stations menant à arrivee_i.
+        """
+        chemin = []
+        cur = arrivee_i
+        while cur is not None:
+            chemin.append(self.reseau.stations[cur].nom)
+            cur = precedent[cur]
+        chemin.reverse()
+        return chemin
+
+    # DIJKSTRA
+    def dijkstra(self, depart, arrivee, poids="temps"):
+        """
+        Calcule le plus court chemin entre deux stations.
+
+        :param poids: "temps", "distance", une matrice dense ou des listes d’adjacence
+        :return: (chemin, coût), ou (None, inf) si l’arrivée est inatteignable
+        """
+        depart_i = self._index(depart)
+        arrivee_i = self._index(arrivee)
+
+        dist, precedent = self.arbre(depart_i, self._adjacence(poids), arrivee_i)
+
+        # Si l'arrivée est inatteignable
+        if arrivee_i not in dist:
+            return None, math.inf
+
+        return self.reconstruire_chemin(precedent, arrivee_i), dist[arrivee_i]
+
+    # A* (HEURISTIQUE GÉOGRAPHIQUE)
+    def vitesse_maximale(self):
+        """
+        Vitesse maximale (km/min) observée sur les routes du réseau : distance / temps.
+        Sert à convertir une distance à vol d’oiseau en borne inférieure de temps.
+        """
+        if self._vitesse_maximale is None or self._vitesse_maximale[0] != self.reseau.version:
+            vitesse = 0.0
+            for _, _, distance, temps in self.reseau.aretes():
+                if temps > 0:
+                    vitesse = max(vitesse, distance / temps)
+            self._vitesse_maximale = (self.reseau.version, vitesse)
+        return self._vitesse_maximale[1]
+
+    def _heuristique(self, critere, arrivee_i):
+        """
+        Retourne une fonction index -> borne inférieure du coût restant jusqu’à l’arrivée.
+
+        L’estimation est la distance à vol d’oiseau (haversine), divisée par la vitesse
+        maximale du réseau pour le critère temps. Elle est admissible et cohérente
+        tant que chaque route est au moins aussi longue que la distance à vol d’oiseau
+        entre ses extrémités.
+        """
+        stations = self.reseau.stations
+        cible = stations[arrivee_i]
+
+        if critere == "distance":
+            facteur = 1.0
+        else:
+            vitesse = self.vitesse_maximale()
+            if vitesse <= 0:
+                return lambda index: 0
+            facteur = 1.0 / vitesse
+
+        return lambda index: stations[index].distance_vol_oiseau(cible) * facteur
+
+    def a_etoile(self, depart, arrivee, poids="temps"):
+        """
+        Recherche A* entre deux stations, guidée par la distance à vol d’oiseau.
+        Nécessite des coordonnées pour toutes les stations et un critère ("temps" ou "distance").
+
+        :return: (chemin, coût), ou (None, inf) si l’arrivée est inatteignable
+        """
+        if poids not in ("temps", "distance"):
+            raise ValueError("A* nécessite le critère 'temps' ou 'distance'")
+        if not self.reseau.coordonnees_completes():
+            raise ValueError("A* nécessite des coordonnées pour toutes les stations")
+
+        depart_i = self._index(depart)
+        arrivee_i = self._index(arrivee)
+        adjacence = self.reseau.adjacence(poids)
+        h = self._heuristique(poids, arrivee_i)
+
+        dist = {depart_i: 0}
+        precedent = {depart_i: None}
+        fixes = set()
+        tas = [(h(depart_i), depart_i)]
+
+        while tas:
+            _, u = heapq.heappop(tas)
+
+            if u in fixes:
+                continue
+            fixes.add(u)
+
+            if u == arrivee_i:
+                break
+
+            for v, w in adjacence[u].items():
+                nouveau = dist[u] + w
+                if v not in fixes and nouveau < dist.get(v, math.inf):
+                    dist[v] = nouveau
+                    precedent[v] = u
+                    heapq.heappush(tas, (nouveau + h(v), v))
+
+        self.noeuds_fixes = len(fixes)
+
+        if arrivee_i not in fixes:
+            return None, math.inf
+
+        return self.reconstruire_chemin(precedent, arrivee_i), dist[arrivee_i]
+
+    # DIJKSTRA BIDIRECTIONNEL
+    def dijkstra_bidirectionnel(self, depart, arrivee, poids="temps"):
+        """
+        Dijkstra lancé simultanément depuis le départ et depuis l’arrivée
+        (le réseau est non orienté), arrêté dès que les deux recherches
+        ne peuvent plus améliorer le meilleur chemin trouvé.
+
+        :return: (chemin, coût), ou (None, inf) si l’arrivée est inatteignable
+        """
+        depart_i = self._index(depart)
+        arrivee_i = self._index(arrivee)
+        adjacence = self._adjacence(poids)
+
+        if depart_i == arrivee_i:
+            self.noeuds_fixes = 1
+            return [depart], 0
+
+        # Indice 0 : recherche avant (depuis le départ), 1 : recherche arrière
+        dist = ({depart_i: 0}, {arrivee_i: 0})
+        precedent = ({depart_i: None}, {arrivee_i: None})
+        fixes = (set(), set())
+        tas = ([(0, depart_i)], [(0, arrivee_i)])
+
+        meilleur = math.inf
+        rencontre = None
+
+        while tas[0] and tas[1]:
+            # Critère d’arrêt : aucun chemin passant par des sommets non fixés
+            # ne peut être plus court que le meilleur chemin déjà trouvé
+            if tas[0][0][0] + tas[1][0][0] >= meilleur:
+                break
+
+            # On avance la recherche dont la file est la moins chargée
+            sens = 0 if len(tas[0]) <= len(tas[1]) else 1
+            d, u = heapq.heappop(tas[sens])
+            if u in fixes[sens]:
+                continue
+            fixes[sens].add(u)
+
+            autre = 1 - sens
+            for v, w in adjacence[u].items():
+                nouveau = d + w
+                if v not in fixes[sens] and nouveau < dist[sens].get(v, math.inf):
+                    dist[sens][v] = nouveau
+                    precedent[sens][v] = u
+                    heapq.heappush(tas[sens], (nouveau, v))
+
+                # Mise à jour du meilleur chemin via l’arête (u, v)
+                if v in dist[autre] and nouveau + dist[autre][v] < meilleur:
+                    meilleur = nouveau + dist[autre][v]
+                    rencontre = (u, v) if sens == 0 else (v, u)
+
+        self.noeuds_fixes = len(fixes[0]) + len(fixes[1])
+
+        if rencontre is None:
+            return None, math.inf
+
+        # Chemin = départ -> u (recherche avant) puis v -> arrivée (recherche arrière)
+        u, v = rencontre
+        chemin = self.reconstruire_chemin(precedent[0], u)
+        cur = v
+        while cur is not None:
+            chemin.append(self.reseau.stations[cur].nom)
+            cur = precedent[1][cur]
+
+        return chemin, meilleur
+
+    # REQUÊTE POINT À POINT
+    def plus_court_chemin(self, depart, arrivee, poids="temps"):
+        """
+        Requête point à point : A* si toutes les stations ont des coordonnées
+        et que le poids est un critère, sinon Dijkstra bidirectionnel.
+        Même contrat (chemin, coût) que dijkstra.
+        """
+        if poids in ("temps", "distance") and self.reseau.coordonnees_completes():
+            return self.a_etoile(depart, arrivee, poids)
+        return self.dijkstra_bidirectionnel(depart, arrivee, poids)
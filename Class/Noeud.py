@@ -13,45 +13,50 @@ class Noeud:
         return Noeud(0, None)
 
     def est_vide(self):
-        #Vérifie si le Noeud est vide.
+        #Vérifie si le Noeud est vide (noeud de fin de liste, sans suivant).
         #Retourne: - True si le noeud est vide, False sinon.
-        return self.valeur == 0
+        return self.suivant is None
+
+    def __iter__(self):
+        #Parcourt itérativement les valeurs de la liste à partir de ce noeud.
+        noeud = self
+        while not noeud.est_vide():
+            yield noeud.valeur
+            noeud = noeud.suivant
 
     def get_longueur(self):
         #Calcule la longeur de la liste Chainée.
         #Retourne: - Nombre entier représentant la taille de la liste.
-        if self.est_vide():
-            return 0
-        return self.suivant.get_longueur()+1
+        longueur = 0
+        for _ in self:
+            longueur += 1
+        return longueur
 
     def affichage(self):
         #Génère une représentation en chaîne des éléments de la liste.
         #Retourne: - Une chaîne contenant les éléments séparés par des espaces.
-        if self.est_vide():
-            return ""
-        if self.suivant.suivant==None:
-            return str(self.valeur)
-        return str(self.valeur) + " " + self.suivant.affichage()
+        return " ".join(str(valeur) for valeur in self)
 
     def ajoute_fin(self, nouvel_element):
         #Ajoute un nouvel élément au bout de la liste.
         #Paramètres: - nouvel_element : élément à ajouter.
-        #Retourne: - Une nouvelle liste avec l'élément ajouté.
-        if self.est_vide():
-            return Noeud(nouvel_element, Noeud.vide())
-        if self.suivant.suivant==None or self.suivant==None:
-            nouveau_suivant = Noeud(nouvel_element, Noeud.vide())
-            return Noeud(self.valeur, nouveau_suivant)
-        return Noeud(self.valeur, self.suivant.ajoute_fin(nouvel_element))
+        #Retourne: - Une nouvelle liste avec l'élément ajouté (la liste d'origine n'est pas modifiée).
+        #Pour des ajouts répétés en O(1), utiliser ListeChainee.ajoute_fin.
+        tete = Noeud.vide()
+        queue = None
+        for valeur in list(self) + [nouvel_element]:
+            nouveau = Noeud(valeur, Noeud.vide())
+            if queue is None:
+                tete = nouveau
+            else:
+                queue.suivant = nouveau
+            queue = nouveau
+        return tete
 
     def ListeToString(self):
         # Génère une représentation en chaîne des éléments de la liste séparé par des ';' pour le traitement.
         # Retourne: - Une chaîne contenant les éléments séparés par des ';'.
-        if self.est_vide():
-            return ""
-        if self.suivant.suivant==None:
-            return str(self.valeur)
-        return str(self.valeur) + ";" + self.suivant.ListeToString()
+        return ";".join(str(valeur) for valeur in self)
 
 #main de test
 if __name__ == "__main__":
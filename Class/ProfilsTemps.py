@@ -0,0 +1,220 @@
+import bisect
+from array import array
+
+from csv_files.ReadCSV import BASE_PATH, iter_csv_stations, iter_csv_roads, lire_heure
+
+
+class ProfilsTemps:
+    """
+    Profils horaires des temps de parcours des routes d’un réseau urbain.
+
+    Un profil associe à chaque heure de départ (en minutes depuis minuit,
+    répétée chaque jour) un temps de parcours, sous l’une des deux formes :
+    - "lineaire" : points (heure, temps) reliés par interpolation linéaire
+    - "paliers" : temps constant entre deux heures successives
+
+    Tous les profils sont rangés dans quelques tableaux compacts (même principe
+    que StockageTrajets) : les points du profil k occupent les positions
+    offsets[k] à offsets[k + 1] des tableaux heures et valeurs.
+    Une route sans profil garde son temps fixe du réseau.
+
+    Propriété FIFO (partir plus tard ne fait jamais arriver plus tôt) :
+    - un profil linéaire dont le temps décroît plus vite que l’heure n’avance
+      est refusé ;
+    - pour un profil en paliers, le voyageur peut attendre le début d’un palier
+      plus rapide : l’arrivée calculée est la meilleure des deux options.
+    """
+
+    # Durée d’une journée en minutes : les profils sont périodiques
+    PERIODE = 1440
+
+    MODES = ("lineaire", "paliers")
+
+    def __init__(self, reseau):
+        """
+        Initialise un stockage de profils vide pour un réseau urbain.
+        - reseau : instance de ReseauUrbain
+        """
+        self.reseau = reseau
+        self.profil_par_route = {}      # (i, j) avec i < j -> numéro de profil
+        self.modes = bytearray()        # Numéro de profil -> position dans MODES
+        self.offsets = array("q", [0])  # Début des points de chaque profil
+        self.heures = array("d")        # Heure de chaque point (minutes depuis minuit)
+        self.valeurs = array("d")       # Temps de parcours de chaque point
+        self.attentes = array("d")      # Paliers : meilleure arrivée en attendant un palier suivant
+
+    def __len__(self):
+        """
+        Nombre de routes possédant un profil horaire.
+        """
+        return len(self.profil_par_route)
+
+    # DÉFINITION D'UN PROFIL
+    def definir_profil(self, station_depart, station_arrivee, points, mode="lineaire"):
+        """
+        Associe un profil horaire à une route existante (dans les deux sens).
+
+        :param points: liste de (heure en minutes depuis minuit, temps de parcours en minutes)
+        :param mode: "lineaire" ou "paliers"
+        """
+        index = self.reseau.index_par_nom
+        if station_depart not in index or station_arrivee not in index:
+            raise ValueError(f"Station inconnue : {station_depart} ou {station_arrivee}")
+
+        i = index[station_depart]
+        j = index[station_arrivee]
+        if j not in self.reseau.adjacence_temps[i]:
+            raise ValueError(f"Aucune route entre {station_depart} et {station_arrivee}")
+
+        self._verifier(points, mode, f"{station_depart} - {station_arrivee}")
+
+        # Un profil redéfini est ajouté à la fin : les anciens points restent inutilisés
+        self.profil_par_route[(min(i, j), max(i, j))] = len(self.modes)
+        self.modes.append(self.MODES.index(mode))
+        for heure, temps in points:
+            self.heures.append(heure)
+            self.valeurs.append(temps)
+        self.attentes.extend(self._attentes(points) if mode == "paliers" else [0.0] * len(points))
+        self.offsets.append(len(self.heures))
+
+    def _verifier(self, points, mode, route):
+        """
+        Vérifie qu’un profil est bien formé et respecte la propriété FIFO.
+        """
+        if mode not in self.MODES:
+            raise ValueError(f"Mode de profil inconnu : {mode}")
+        if not points:
+            raise ValueError(f"Profil vide pour la route {route}")
+
+        heures = [heure for heure, _ in points]
+        if heures[0] < 0 or heures[-1] >= self.PERIODE:
+            raise ValueError(f"Heures hors de la journée pour la route {route}")
+        if any(a >= b for a, b in zip(heures, heures[1:])):
+            raise ValueError(f"Heures non strictement croissantes pour la route {route}")
+        if any(temps < 0 for _, temps in points):
+            raise ValueError(f"Temps de parcours négatif pour la route {route}")
+
+        if mode == "lineaire":
+            # Segments successifs, y compris celui qui relie le dernier point au premier du lendemain
+            suivants = points[1:] + [(points[0][0] + self.PERIODE, points[0][1])]
+            for (h1, t1), (h2, t2) in zip(points, suivants):
+                if h2 > h1 and (t2 - t1) / (h2 - h1) < -1:
+                    raise ValueError(f"Profil non FIFO pour la route {route}")
+
+    def _attentes(self, points):
+        """
+        Pour chaque palier k : meilleure heure d’arrivée (relative au début de la
+        journée du palier) obtenue en attendant le début d’un palier suivant.
+        """
+        m = len(points)
+        # Paliers déroulés sur deux journées, parcourus de la fin vers le début
+        meilleure = float("inf")
+        attentes = [0.0] * m
+        for position in range(2 * m - 1, 0, -1):
+            heure, temps = points[position % m]
+            heure += self.PERIODE * (position // m)
+            meilleure = min(meilleure, heure + temps)
+            if position - 1 < m:
+                attentes[position - 1] = meilleure
+        return attentes
+
+    # LECTURE DES PROFILS
+    @staticmethod
+    def lire_heure(texte):
+        """
+        Convertit "HH:MM" ou un nombre de minutes en minutes depuis minuit.
+        """
+        return lire_heure(texte)
+
+    @classmethod
+    def lire_profil(cls, texte):
+        """
+        Lit un profil au format texte du CSV, par exemple :
+        - "0=4;7:30=9;9:30=5" (linéaire)
+        - "paliers:0=4;7:00=9;10:00=5"
+        Retourne (mode, points).
+        """
+        mode = "lineaire"
+        if texte.split(":", 1)[0].strip() in cls.MODES:
+            mode, texte = texte.split(":", 1)
+            mode = mode.strip()
+
+        points = []
+        for morceau in texte.split(";"):
+            if not morceau.strip():
+                continue
+            if "=" not in morceau:
+                raise ValueError(f"Point de profil invalide : {morceau!r}")
+            heure, temps = morceau.split("=", 1)
+            points.append((cls.lire_heure(heure), float(temps)))
+        return mode, points
+
+    @classmethod
+    def depuis_csv(cls, reseau, base_path=BASE_PATH):
+        """
+        Construit les profils à partir de la colonne optionnelle "profil_temps"
+        du fichier des routes. Le réseau doit déjà être chargé depuis les mêmes fichiers.
+        """
+        id_to_nom = {str(station_id): nom for station_id, nom in iter_csv_stations(base_path)}
+
+        profils = cls(reseau)
+        for depart_id, arrivee_id, _, _, texte in iter_csv_roads(base_path, avec_profils=True):
+            if texte is None:
+                continue
+            mode, points = cls.lire_profil(texte)
+            profils.definir_profil(id_to_nom[depart_id], id_to_nom[arrivee_id], points, mode)
+        return profils
+
+    # ÉVALUATION
+    def arrivee(self, i, j, heure):
+        """
+        Heure d’arrivée en j pour un départ de i à l’heure donnée
+        (en minutes, éventuellement au-delà de minuit).
+        """
+        numero = self.profil_par_route.get((i, j) if i < j else (j, i))
+        if numero is None:
+            return heure + self.reseau.adjacence_temps[i][j]
+
+        debut = self.offsets[numero]
+        fin = self.offsets[numero + 1]
+        heures = self.heures
+        valeurs = self.valeurs
+
+        # Position dans la journée et point du profil qui la précède
+        jour = heure - heure % self.PERIODE
+        dans_jour = heure - jour
+        k = bisect.bisect_right(heures, dans_jour, debut, fin) - 1
+        if k < debut:
+            # Avant le premier point : suite du dernier point de la veille
+            k = fin - 1
+            jour -= self.PERIODE
+            dans_jour += self.PERIODE
+
+        if self.MODES[self.modes[numero]] == "paliers":
+            return jour + min(dans_jour + valeurs[k], self.attentes[k])
+
+        if k + 1 < fin:
+            h_suivante, t_suivant = heures[k + 1], valeurs[k + 1]
+        else:
+            h_suivante, t_suivant = heures[debut] + self.PERIODE, valeurs[debut]
+
+        if h_suivante == heures[k]:
+            temps = valeurs[k]
+        else:
+            part = (dans_jour - heures[k]) / (h_suivante - heures[k])
+            temps = valeurs[k] + part * (t_suivant - valeurs[k])
+        return heure + temps
+
+    def temps_parcours(self, station_depart, station_arrivee, heure):
+        """
+        Temps de parcours (attente éventuelle comprise) d’une route pour un départ à l’heure donnée.
+        """
+        index = self.reseau.index_par_nom
+        if station_depart not in index or station_arrivee not in index:
+            raise ValueError(f"Station inconnue : {station_depart} ou {station_arrivee}")
+
+        i = index[station_depart]
+        j = index[station_arrivee]
+        if j not in self.reseau.adjacence_temps[i]:
+            raise ValueError(f"Aucune route entre {station_depart} et {station_arrivee}")
+        return self.arrivee(i, j, heure) - heure
@@ -0,0 +1,129 @@
+import heapq
+from collections import OrderedDict
+
+
+class RechercheMulticritere:
+    """
+    Recherche multicritère (temps et distance) entre deux stations.
+
+    Algorithme à étiquettes (label-setting) : chaque étiquette est un couple
+    (temps, distance) associé à un chemin partiel. Une étiquette dominée
+    (pire ou égale sur les deux critères qu’une autre) est éliminée.
+    Une seule recherche donne ainsi tout le front de Pareto des compromis
+    temps / distance, au lieu de deux Dijkstra indépendants.
+    """
+
+    def __init__(self, reseau, max_etiquettes=20, taille_cache=256):
+        """
+        - reseau : instance de ReseauUrbain
+        - max_etiquettes : nombre maximal d’étiquettes conservées par station
+          (borne le coût de la recherche ; au-delà, le front peut être incomplet)
+        - taille_cache : nombre de fronts conservés en cache (paires origine-destination)
+        """
+        self.reseau = reseau
+        self.max_etiquettes = max_etiquettes
+        self.taille_cache = taille_cache
+        self.cache = OrderedDict()      # (départ, arrivée) -> front de Pareto
+        self.version_cache = reseau.version
+
+    @staticmethod
+    def _domine(a, b):
+        """
+        Indique si l’étiquette a domine (ou égale) l’étiquette b.
+        """
+        return a[0] <= b[0] and a[1] <= b[1]
+
+    def front_pareto(self, depart, arrivee):
+        """
+        Retourne le front de Pareto des chemins entre deux stations :
+        liste de (chemin, temps, distance), triée par temps croissant.
+        Liste vide si l’arrivée est inatteignable.
+        """
+        index = self.reseau.index_par_nom
+        if depart not in index or arrivee not in index:
+            raise ValueError(f"Station inconnue : {depart} ou {arrivee}")
+
+        # Le cache est vidé dès que le réseau a été modifié
+        if self.version_cache != self.reseau.version:
+            self.cache.clear()
+            self.version_cache = self.reseau.version
+
+        cle = (depart, arrivee)
+        if cle in self.cache:
+            self.cache.move_to_end(cle)
+            return self.cache[cle]
+
+        front = self._rechercher(index[depart], index[arrivee])
+
+        self.cache[cle] = front
+        if len(self.cache) > self.taille_cache:
+            self.cache.popitem(last=False)
+        return front
+
+    def _rechercher(self, depart_i, arrivee_i):
+        """
+        Recherche à étiquettes proprement dite.
+        """
+        temps = self.reseau.adjacence_temps
+        distances = self.reseau.adjacence_distances
+
+        # Étiquettes : (temps, distance, station, numéro de l’étiquette précédente)
+        etiquettes = [(0, 0, depart_i, -1)]
+        # Par station : couples (temps, distance) des étiquettes définitives
+        definitives = {}
+        tas = [(0, 0, 0)]   # (temps, distance, numéro d’étiquette)
+        resultats = []
+
+        while tas:
+            t, d, numero = heapq.heappop(tas)
+            station = etiquettes[numero][2]
+
+            # Élimination des étiquettes dominées par une étiquette définitive
+            # de la même station, ou par une solution déjà trouvée à l’arrivée
+            fixees = definitives.setdefault(station, [])
+            if any(self._domine(e, (t, d)) for e in fixees):
+                continue
+            if station != arrivee_i and any(self._domine(e, (t, d)) for e in definitives.get(arrivee_i, ())):
+                continue
+            if len(fixees) >= self.max_etiquettes:
+                continue
+            fixees.append((t, d))
+
+            if station == arrivee_i:
+                resultats.append(numero)
+                continue
+
+            for voisin, temps_arete in temps[station].items():
+                nouveau = (t + temps_arete, d + distances[station][voisin])
+                if any(self._domine(e, nouveau) for e in definitives.get(voisin, ())):
+                    continue
+                etiquettes.append((nouveau[0], nouveau[1], voisin, numero))
+                heapq.heappush(tas, (nouveau[0], nouveau[1], len(etiquettes) - 1))
+
+        front = []
+        for numero in resultats:
+            t, d, _, _ = etiquettes[numero]
+            chemin = []
+            while numero != -1:
+                chemin.append(self.reseau.stations[etiquettes[numero][2]].nom)
+                numero = etiquettes[numero][3]
+            chemin.reverse()
+            front.append((chemin, t, d))
+        return front
+
+    # COMPATIBILITÉ AVEC LE CONTRAT (chemin, coût)
+    def dijkstra(self, depart, arrivee, poids="temps"):
+        """
+        Extrait du front de Pareto le meilleur chemin pour un critère :
+        même contrat (chemin, coût) que MoteurItineraire.dijkstra.
+        """
+        if poids not in ("temps", "distance"):
+            raise ValueError(f"Critère inconnu : {poids}")
+
+        front = self.front_pareto(depart, arrivee)
+        if not front:
+            return None, float("inf")
+
+        position = 1 if poids == "temps" else 2
+        meilleur = min(front, key=lambda solution: (solution[position], solution[3 - position]))
+        return meilleur[0], meilleur[position]
@@ -1,14 +1,48 @@
+import gc
+import math
+import mmap
+import os
+import struct
+import sys
+from array import array
+from collections import deque
+
 from Class.Station import Station
-from csv_files.ReadCSV import load_csv_stations, load_csv_roads
+from Class.ConstructeurReseau import ConstructeurReseau
+from Class.AretesNumpy import AretesNumpy
+from Class.MatricesNumpy import MatricesNumpy
+from csv_files.ReadCSV import BASE_PATH, iter_csv_stations, iter_csv_roads, empreinte_fichiers
 
 
 class ReseauUrbain:
     """
     Classe représentant un réseau urbain modélisé sous forme de graphe.
-    Les stations sont les sommets et les routes sont représentées
-    par des matrices d’adjacence (temps et distances).
+    Les stations sont les sommets et les routes sont stockées sous forme
+    de listes d’adjacence creuses (temps et distances).
+
+    Les matrices d’adjacence (temps et distances) restent disponibles,
+    mais ne sont plus que des vues construites à la demande à partir
+    des listes d’adjacence.
+
+    Chaque ajout, modification ou fermeture de route est inscrit dans un journal
+    borné, ce qui permet aux caches (tables de plus courts chemins, ...) de se
+    réparer incrémentalement au lieu d’être recalculés.
     """
 
+    # Nombre maximal de modifications conservées dans le journal
+    TAILLE_JOURNAL = 10000
+
+    # Instantané binaire : version du format (à incrémenter si la structure change),
+    # fichiers CSV dont il dépend et emplacement par défaut
+    VERSION_FORMAT_BINAIRE = 1
+    FICHIERS_SOURCES = ("stations_xl.csv", "routes_xl.csv")
+    FICHIER_BINAIRE = BASE_PATH + "cache/reseau.bin"
+
+    # En-tête : signature, version du format, ordre des octets (1 : petit-boutiste),
+    # nombre de stations, nombre d’entrées CSR, taille de la table des noms, empreinte des sources
+    _ENTETE = struct.Struct("<4sIIQQQ64s")
+    _SIGNATURE = b"RSUB"
+
     def __init__(self, nom):
         """
         Initialise un réseau urbain vide.
@@ -18,14 +52,23 @@ class ReseauUrbain:
         self.nom = nom
         self.stations = []              # Liste des objets Station
         self.index_par_nom = {}         # Dictionnaire nom -> index
-        self.matrice_distances = []     # Matrice d’adjacence des distances
-        self.matrice_temps = []         # Matrice d’adjacence des temps
+        self.adjacence_distances = []   # Par station : dictionnaire index voisin -> distance
+        self.adjacence_temps = []       # Par station : dictionnaire index voisin -> temps
+        self.version = 0                # Incrémentée à chaque modification du réseau
+        self._vues_matrices = None      # Cache (version, distances, temps) des matrices
+        self._matrices_numpy = None     # Cache du backend NumPy (optionnel)
+        self._aretes_numpy = None       # Cache du backend NumPy creux (optionnel)
+        # Journal des routes modifiées : (version, i, j, ancien, nouveau),
+        # où ancien / nouveau valent (distance, temps), ou None si la route n’existe pas
+        self.journal = deque(maxlen=self.TAILLE_JOURNAL)
+        self.version_debut_journal = 0  # Le journal est complet depuis cette version
 
     # AJOUT D'UNE STATION
-    def ajouter_station(self, nom_station):
+    def ajouter_station(self, nom_station, latitude=None, longitude=None):
         """
         Ajoute une station au réseau si elle n'existe pas déjà.
-        Met à jour les matrices d’adjacence en conséquence.
+        Coût constant : seule une liste d’adjacence vide est créée.
+        Les coordonnées (en degrés) sont optionnelles.
         """
         # Évite les doublons
         if nom_station in self.index_par_nom:
@@ -35,21 +78,17 @@ class ReseauUrbain:
         index = len(self.stations)
 
         # Création de l’objet Station
-        station = Station(index, nom_station)
+        station = Station(index, nom_station, latitude, longitude)
 
         # Ajout à la liste des stations
         self.stations.append(station)
         self.index_par_nom[nom_station] = index
 
-        # Extension des lignes existantes des matrices
-        for ligne in self.matrice_distances:
-            ligne.append(-1)
-        for ligne in self.matrice_temps:
-            ligne.append(-1)
+        # Nouvelle station sans aucune liaison
+        self.adjacence_distances.append({})
+        self.adjacence_temps.append({})
 
-        # Ajout d’une nouvelle ligne pour la station
-        self.matrice_distances.append([-1] * (index + 1))
-        self.matrice_temps.append([-1] * (index + 1))
+        self.version += 1
 
     # AJOUT D'UNE ROUTE ENTRE DEUX STATIONS
     def ajouter_route(self, station_depart, station_arrivee, distance, temps):
@@ -65,52 +104,406 @@ class ReseauUrbain:
         i = self.index_par_nom[station_depart]
         j = self.index_par_nom[station_arrivee]
 
-        # Mise à jour des matrices (liaison bidirectionnelle)
-        self.matrice_distances[i][j] = distance
-        self.matrice_distances[j][i] = distance
+        self._changer_route(i, j, (distance, temps))
+
+    # MODIFICATION D'UNE ROUTE EXISTANTE
+    def modifier_route(self, station_depart, station_arrivee, distance=None, temps=None):
+        """
+        Modifie la distance et / ou le temps d’une route existante
+        (ex : ralentissement sur un tronçon). Un paramètre à None est inchangé.
+        """
+        i, j = self._route_existante(station_depart, station_arrivee)
+
+        if distance is None:
+            distance = self.adjacence_distances[i][j]
+        if temps is None:
+            temps = self.adjacence_temps[i][j]
+
+        self._changer_route(i, j, (distance, temps))
+
+    # FERMETURE D'UNE ROUTE
+    def fermer_route(self, station_depart, station_arrivee):
+        """
+        Supprime une route existante (ex : tronçon fermé pour travaux ou incident).
+        """
+        i, j = self._route_existante(station_depart, station_arrivee)
+        self._changer_route(i, j, None)
+
+    def _route_existante(self, station_depart, station_arrivee):
+        """
+        Retourne les indices des extrémités d’une route, ou lève une erreur si elle n’existe pas.
+        """
+        if station_depart not in self.index_par_nom or station_arrivee not in self.index_par_nom:
+            raise ValueError(f"Station inconnue : {station_depart} ou {station_arrivee}")
+
+        i = self.index_par_nom[station_depart]
+        j = self.index_par_nom[station_arrivee]
+        if j not in self.adjacence_temps[i]:
+            raise ValueError(f"Aucune route entre {station_depart} et {station_arrivee}")
+        return i, j
+
+    def _changer_route(self, i, j, nouveau):
+        """
+        Applique une modification de route (nouveau = (distance, temps), ou None
+        pour une fermeture) dans les deux sens, puis l’inscrit dans le journal.
+        """
+        if j in self.adjacence_temps[i]:
+            ancien = (self.adjacence_distances[i][j], self.adjacence_temps[i][j])
+        else:
+            ancien = None
+
+        if nouveau is None:
+            # Fermeture de la liaison dans les deux sens
+            self.adjacence_distances[i].pop(j, None)
+            self.adjacence_distances[j].pop(i, None)
+            self.adjacence_temps[i].pop(j, None)
+            self.adjacence_temps[j].pop(i, None)
+        else:
+            # Mise à jour des listes d’adjacence (liaison bidirectionnelle)
+            distance, temps = nouveau
+            self.adjacence_distances[i][j] = distance
+            self.adjacence_distances[j][i] = distance
+
+            self.adjacence_temps[i][j] = temps
+            self.adjacence_temps[j][i] = temps
+
+        self.version += 1
 
-        self.matrice_temps[i][j] = temps
-        self.matrice_temps[j][i] = temps
+        # L’entrée la plus ancienne va être évincée : le journal n’est plus complet avant elle
+        if len(self.journal) == self.journal.maxlen:
+            self.version_debut_journal = self.journal[0][0]
+        self.journal.append((self.version, i, j, ancien, nouveau))
+
+    # JOURNAL DES MODIFICATIONS
+    def modifications_depuis(self, version):
+        """
+        Retourne la liste des modifications de routes postérieures à une version,
+        ou None si le journal ne remonte pas assez loin (recalcul complet nécessaire).
+        """
+        if version < self.version_debut_journal:
+            return None
+        return [entree for entree in self.journal if entree[0] > version]
 
     # RÉCUPÉRATION DES VOISINS D'UNE STATION
     def voisins(self, nom_station):
         """
         Retourne la liste des stations directement accessibles
-        depuis une station donnée.
+        depuis une station donnée, dans l’ordre des indices.
         """
         if nom_station not in self.index_par_nom:
             raise ValueError("Station inconnue")
 
         index = self.index_par_nom[nom_station]
 
-        return [
-            self.stations[j].nom
-            for j in range(len(self.stations))
-            if self.matrice_temps[index][j] != -1
-        ]
+        return [self.stations[j].nom for j in sorted(self.adjacence_temps[index])]
+
+    # COORDONNÉES DES STATIONS
+    def coordonnees_completes(self):
+        """
+        Indique si toutes les stations du réseau possèdent des coordonnées.
+        """
+        return bool(self.stations) and all(station.a_coordonnees() for station in self.stations)
+
+    # LISTES D'ADJACENCE PAR CRITÈRE
+    def adjacence(self, critere):
+        """
+        Retourne les listes d’adjacence correspondant au critère demandé.
+
+        :param critere: "temps" ou "distance"
+        """
+        if critere == "temps":
+            return self.adjacence_temps
+        if critere == "distance":
+            return self.adjacence_distances
+        raise ValueError(f"Critère inconnu : {critere}")
+
+    # PARCOURS DES ROUTES
+    def aretes(self):
+        """
+        Génère chaque route une seule fois sous la forme
+        (index_depart, index_arrivee, distance, temps), avec index_depart < index_arrivee.
+        """
+        for i, voisins in enumerate(self.adjacence_temps):
+            distances = self.adjacence_distances[i]
+            for j, temps in voisins.items():
+                if i < j:
+                    yield i, j, distances[j], temps
+
+    # VUES MATRICIELLES (CONSTRUITES À LA DEMANDE)
+    def _matrices(self):
+        """
+        Construit (ou récupère en cache) les matrices denses de distances et de temps.
+        Les liaisons absentes valent -1. Le cache est invalidé à chaque modification.
+        """
+        if self._vues_matrices is None or self._vues_matrices[0] != self.version:
+            n = len(self.stations)
+            distances = [[-1] * n for _ in range(n)]
+            temps = [[-1] * n for _ in range(n)]
+            for i in range(n):
+                for j, valeur in self.adjacence_distances[i].items():
+                    distances[i][j] = valeur
+                for j, valeur in self.adjacence_temps[i].items():
+                    temps[i][j] = valeur
+            self._vues_matrices = (self.version, distances, temps)
+        return self._vues_matrices[1], self._vues_matrices[2]
+
+    @property
+    def matrice_distances(self):
+        """
+        Matrice d’adjacence des distances (vue en lecture seule, -1 si pas de liaison).
+        """
+        return self._matrices()[0]
+
+    @property
+    def matrice_temps(self):
+        """
+        Matrice d’adjacence des temps (vue en lecture seule, -1 si pas de liaison).
+        """
+        return self._matrices()[1]
+
+    # BACKEND NUMPY (OPTIONNEL)
+    def matrices_numpy(self):
+        """
+        Retourne le backend NumPy du réseau (matrices float64, +inf si pas de liaison).
+        Il est reconstruit uniquement si le réseau a été modifié.
+        Nécessite NumPy.
+        """
+        if self._matrices_numpy is None or self._matrices_numpy.version != self.version:
+            self._matrices_numpy = MatricesNumpy(self)
+        return self._matrices_numpy
+
+    def aretes_numpy(self):
+        """
+        Retourne le backend NumPy creux du réseau (routes triées, mémoire en O(routes)),
+        pour lire en bloc les poids de segments sans matrice n × n.
+        Il est reconstruit uniquement si le réseau a été modifié.
+        Nécessite NumPy.
+        """
+        if self._aretes_numpy is None or self._aretes_numpy.version != self.version:
+            self._aretes_numpy = AretesNumpy(self)
+        return self._aretes_numpy
+
+    # CONSTRUCTION EN BLOC
+    @classmethod
+    def depuis_listes(cls, stations, routes, nom="reseau"):
+        """
+        Construit un réseau d’un bloc (voir ConstructeurReseau pour les validations).
+
+        :param stations: itérable de (id, nom) ou de (id, nom, latitude, longitude)
+        :param routes: itérable de (id de départ, id d’arrivée, distance, temps)
+        """
+        constructeur = ConstructeurReseau()
+        for numero, station in enumerate(stations, start=1):
+            try:
+                constructeur.ajouter_station(*station)
+            except ValueError as erreur:
+                raise ValueError(f"Station n°{numero} : {erreur}") from None
+        for numero, route in enumerate(routes, start=1):
+            try:
+                constructeur.ajouter_route(*route)
+            except ValueError as erreur:
+                raise ValueError(f"Route n°{numero} : {erreur}") from None
+        return constructeur.remplir(cls(nom))
+
+    def _installer(self, stations, adjacence_distances, adjacence_temps):
+        """
+        Installe d’un bloc des stations et leurs listes d’adjacence dans un réseau vide.
+        Le réseau ne change que d’une version et son journal repart vide :
+        les caches qui en dépendent sont recalculés entièrement.
+        """
+        if self.stations:
+            raise ValueError("L’installation en bloc nécessite un réseau vide")
+
+        self.stations = stations
+        self.index_par_nom = {station.nom: i for i, station in enumerate(stations)}
+        self.adjacence_distances = adjacence_distances
+        self.adjacence_temps = adjacence_temps
+
+        self.version += 1
+        self.journal.clear()
+        self.version_debut_journal = self.version
 
     # CHARGEMENT DU RÉSEAU DEPUIS DES FICHIERS CSV
-    def charger_depuis_csv(self):
+    def charger_depuis_csv(self, base_path=BASE_PATH):
         """
         Construit le réseau à partir de fichiers CSV :
         - un fichier pour les stations
         - un fichier pour les routes
+        Les lignes sont lues en flux et validées par un ConstructeurReseau :
+        une donnée invalide lève une ValueError qui cite le fichier et la ligne.
         """
-        # Chargement des stations
-        stations = load_csv_stations()
+        constructeur = ConstructeurReseau()
 
-        # Dictionnaire temporaire id -> nom
-        id_to_nom = {}
-        for station_id, nom_station in stations:
-            id_to_nom[str(station_id)] = nom_station
-            self.ajouter_station(nom_station)
+        # Chargement des stations
+        for ligne, station_id, nom_station, latitude, longitude in iter_csv_stations(
+            base_path, avec_coordonnees=True, avec_numeros=True
+        ):
+            try:
+                constructeur.ajouter_station(station_id, nom_station, latitude, longitude)
+            except ValueError as erreur:
+                raise ValueError(f"stations_xl.csv, ligne {ligne} : {erreur}") from None
 
         # Chargement des routes
-        routes = load_csv_roads()
-        for depart_id, arrivee_id, distance, temps in routes:
-            depart_nom = id_to_nom[depart_id]
-            arrivee_nom = id_to_nom[arrivee_id]
-            self.ajouter_route(depart_nom, arrivee_nom, distance, temps)
+        for ligne, depart_id, arrivee_id, distance, temps in iter_csv_roads(base_path, avec_numeros=True):
+            try:
+                constructeur.ajouter_route(depart_id, arrivee_id, distance, temps)
+            except ValueError as erreur:
+                raise ValueError(f"routes_xl.csv, ligne {ligne} : {erreur}") from None
+
+        constructeur.remplir(self)
+
+    # INSTANTANÉ BINAIRE DU RÉSEAU
+    def sauvegarder_binaire(self, chemin_fichier=FICHIER_BINAIRE, empreinte=""):
+        """
+        Sauvegarde le réseau dans un instantané binaire, relu sans analyse de texte :
+        - en-tête (voir _ENTETE), associé à l’empreinte des fichiers sources ;
+        - table des noms (UTF-8, séparés par un octet nul), coordonnées (NaN si absentes) ;
+        - routes au format CSR dans les deux sens : débuts des voisins de chaque station (int64),
+          voisins (int32), distances et temps (float64 : valeurs relues à l’identique).
+        Chaque section commence sur un multiple de 8 octets.
+        """
+        n = len(self.stations)
+        noms = "\0".join(station.nom for station in self.stations).encode("utf-8")
+        latitudes = array("d", (math.nan if s.latitude is None else s.latitude for s in self.stations))
+        longitudes = array("d", (math.nan if s.longitude is None else s.longitude for s in self.stations))
+
+        debuts = array("q", [0])
+        voisins = array("i")
+        distances = array("d")
+        temps = array("d")
+        for i in range(n):
+            for j in sorted(self.adjacence_temps[i]):
+                voisins.append(j)
+                distances.append(self.adjacence_distances[i][j])
+                temps.append(self.adjacence_temps[i][j])
+            debuts.append(len(voisins))
+
+        entete = self._ENTETE.pack(
+            self._SIGNATURE, self.VERSION_FORMAT_BINAIRE, sys.byteorder == "little",
+            n, len(voisins), len(noms), empreinte.encode("ascii")
+        )
+
+        dossier = os.path.dirname(chemin_fichier)
+        if dossier:
+            os.makedirs(dossier, exist_ok=True)
+
+        # Écriture dans un fichier temporaire puis renommage atomique
+        temporaire = chemin_fichier + ".tmp"
+        with open(temporaire, "wb") as fichier:
+            for section in (entete, noms, latitudes, longitudes, debuts, voisins, distances, temps):
+                donnees = section if isinstance(section, bytes) else section.tobytes()
+                fichier.write(donnees)
+                fichier.write(bytes(-len(donnees) % 8))
+        os.replace(temporaire, chemin_fichier)
+
+    def charger_binaire(self, chemin_fichier=FICHIER_BINAIRE, empreinte=None):
+        """
+        Construit le réseau (vide) à partir d’un instantané binaire.
+        Le fichier est projeté en mémoire (mmap) et ses colonnes binaires sont
+        converties d’un bloc (sans analyse de texte ni appel à ajouter_station /
+        ajouter_route) ; les stations et les dictionnaires d’adjacence sont ensuite
+        construits en mémoire : le chargement reste une copie complète du réseau,
+        proportionnelle à sa taille.
+
+        Retourne False, sans modifier le réseau, si le fichier est absent, illisible,
+        d’un autre format ou, lorsque empreinte est donnée, issu d’autres fichiers sources.
+        """
+        if self.stations:
+            raise ValueError("Le chargement d’un instantané nécessite un réseau vide")
+        if not os.path.exists(chemin_fichier) or os.path.getsize(chemin_fichier) < self._ENTETE.size:
+            return False
+
+        try:
+            with open(chemin_fichier, "rb") as fichier, \
+                    mmap.mmap(fichier.fileno(), 0, access=mmap.ACCESS_READ) as projection:
+                contenu = self._lire_binaire(projection, empreinte)
+        except (OSError, ValueError, UnicodeDecodeError):
+            return False
+        if contenu is None:
+            return False
+
+        noms, latitudes, longitudes, debuts, voisins, distances, temps = contenu
+
+        # Des centaines de milliers d’objets sont créés d’un coup : le ramasse-miettes
+        # cyclique, inutile ici (aucun cycle), est suspendu pendant la construction
+        gc_actif = gc.isenabled()
+        gc.disable()
+        try:
+            stations = [
+                Station(i, nom, None if math.isnan(lat) else lat, None if math.isnan(lon) else lon)
+                for i, (nom, lat, lon) in enumerate(zip(noms, latitudes, longitudes))
+            ]
+            adjacence_distances = []
+            adjacence_temps = []
+            for a, b in zip(debuts, debuts[1:]):
+                cles = voisins[a:b]
+                adjacence_distances.append(dict(zip(cles, distances[a:b])))
+                adjacence_temps.append(dict(zip(cles, temps[a:b])))
+        finally:
+            if gc_actif:
+                gc.enable()
+
+        self._installer(stations, adjacence_distances, adjacence_temps)
+        return True
+
+    @classmethod
+    def _lire_binaire(cls, projection, empreinte):
+        """
+        Lit les sections d’un instantané projeté en mémoire.
+        Retourne (noms, latitudes, longitudes, débuts, voisins, distances, temps)
+        sous forme de listes, ou None si l’instantané ne convient pas.
+        """
+        signature, version, petit_boutiste, n, m, taille_noms, empreinte_fichier = \
+            cls._ENTETE.unpack_from(projection, 0)
+        if (
+            signature != cls._SIGNATURE
+            or version != cls.VERSION_FORMAT_BINAIRE
+            or bool(petit_boutiste) != (sys.byteorder == "little")
+            or (empreinte is not None and empreinte_fichier.rstrip(b"\0") != empreinte.encode("ascii"))
+        ):
+            return None
+
+        with memoryview(projection) as vue:
+            position = cls._ENTETE.size + (-cls._ENTETE.size % 8)
+
+            def section(format_, nombre, taille):
+                # Colonne suivante, interprétée sur la projection puis copiée
+                # dans une liste Python (tolist), et alignement sur 8 octets
+                nonlocal position
+                fin = position + nombre * taille
+                if fin > len(vue):
+                    raise ValueError("Instantané tronqué")
+                with vue[position:fin] as tranche, tranche.cast(format_) as colonne:
+                    valeurs = colonne.tolist()
+                position = fin + (-fin % 8)
+                return valeurs
+
+            noms = bytes(vue[position:position + taille_noms]).decode("utf-8").split("\0") if n else []
+            position += taille_noms + (-taille_noms % 8)
+            latitudes = section("d", n, 8)
+            longitudes = section("d", n, 8)
+            debuts = section("q", n + 1, 8)
+            voisins = section("i", m, 4)
+            distances = section("d", m, 8)
+            temps = section("d", m, 8)
+
+        if len(noms) != n or debuts[-1] != m:
+            return None
+        return noms, latitudes, longitudes, debuts, voisins, distances, temps
+
+    def charger(self, base_path=BASE_PATH, chemin_fichier=None):
+        """
+        Construit le réseau depuis l’instantané binaire s’il correspond aux fichiers CSV
+        actuels (empreinte de leur contenu), sinon depuis les CSV, puis sauvegarde l’instantané.
+        - chemin_fichier : instantané à utiliser ; par défaut cache/reseau.bin dans le dossier
+          des CSV, pour que deux jeux de données n’écrasent pas l’instantané l’un de l’autre
+        """
+        if chemin_fichier is None:
+            chemin_fichier = os.path.join(base_path, "cache", "reseau.bin")
+        empreinte = empreinte_fichiers(self.FICHIERS_SOURCES, base_path)
+        if not self.charger_binaire(chemin_fichier, empreinte):
+            self.charger_depuis_csv(base_path)
+            self.sauvegarder_binaire(chemin_fichier, empreinte)
 
     # AFFICHAGE DES MATRICES
     def affichage_matrices(self):
@@ -1,8 +1,33 @@
+import math
+
+
 class Station:
+    # __slots__ : pas de __dict__ par objet, ce qui réduit la mémoire des grands réseaux.
+    __slots__ = ("id", "nom", "latitude", "longitude")
+
+    # Rayon moyen de la Terre en kilomètres.
+    RAYON_TERRE_KM = 6371.0
+
     # Constructeur avec definition des attributs.
-    def __init__(self, id, nom):
+    # Les coordonnées (en degrés) sont optionnelles.
+    def __init__(self, id, nom, latitude=None, longitude=None):
         self.id = id
         self.nom = nom
+        self.latitude = latitude
+        self.longitude = longitude
+
+    #Indique si la station possède des coordonnées.
+    def a_coordonnees(self):
+        return self.latitude is not None and self.longitude is not None
+
+    #Distance à vol d'oiseau (formule de haversine) vers une autre station, en kilomètres.
+    def distance_vol_oiseau(self, autre):
+        phi1 = math.radians(self.latitude)
+        phi2 = math.radians(autre.latitude)
+        delta_phi = phi2 - phi1
+        delta_lambda = math.radians(autre.longitude - self.longitude)
+        a = math.sin(delta_phi / 2) ** 2 + math.cos(phi1) * math.cos(phi2) * math.sin(delta_lambda / 2) ** 2
+        return 2 * self.RAYON_TERRE_KM * math.asin(min(1.0, math.sqrt(a)))
 
     #Fonction d'affichage, retourne un string.
     def affichage(self):
@@ -0,0 +1,108 @@
+import math
+from array import array
+
+from Class.TrajetObserve import TrajetObserve
+from csv_files.ReadCSV import BASE_PATH, iter_csv_trajets
+
+
+class StockageTrajets:
+    """
+    Stockage en colonnes d’un grand nombre de trajets observés.
+
+    Au lieu d’un objet par trajet et d’une chaîne par arrêt :
+    - chaque nom de station n’est stocké qu’une fois (table des noms)
+    - les arrêts de tous les trajets sont des indices concaténés dans un array('i')
+    - offsets[k] : position du premier arrêt du trajet k (offsets[k + 1] : fin)
+    - les temps et distances mesurés sont deux array('d') parallèles (NaN si absent)
+
+    Le stockage se parcourt comme une liste de TrajetObserve : chaque trajet
+    est reconstruit à la demande, ce qui permet de le passer tel quel
+    à AnalyseurTrajets.
+    """
+
+    def __init__(self):
+        self.noms = []                  # Index local -> nom de station
+        self.index_par_nom = {}         # Nom de station -> index local
+        self.ids = []                   # Identifiant de chaque trajet
+        self.indices = array("i")       # Arrêts de tous les trajets (indices locaux)
+        self.offsets = array("q", [0])  # Début de chaque trajet dans indices
+        self.tps_mesures = array("d")   # Temps mesuré de chaque trajet
+        self.dist_mesures = array("d")  # Distance mesurée de chaque trajet
+
+    # CONSTRUCTION
+    def index_station(self, nom_station):
+        """
+        Retourne l’index local d’un nom de station, en l’ajoutant à la table si besoin.
+        """
+        index = self.index_par_nom.get(nom_station)
+        if index is None:
+            index = len(self.noms)
+            self.noms.append(nom_station)
+            self.index_par_nom[nom_station] = index
+        return index
+
+    def ajouter(self, id_trajet, noms_stations, tps_mesure, dist_mesure):
+        """
+        Ajoute un trajet au stockage. Une mesure absente (None) est stockée en NaN.
+        """
+        self.ids.append(id_trajet)
+        self.indices.extend(self.index_station(nom) for nom in noms_stations)
+        self.offsets.append(len(self.indices))
+        self.tps_mesures.append(math.nan if tps_mesure is None else tps_mesure)
+        self.dist_mesures.append(math.nan if dist_mesure is None else dist_mesure)
+
+    @classmethod
+    def depuis_lignes(cls, lignes):
+        """
+        Construit un stockage à partir de lignes (id, stations, temps, distance).
+        """
+        stockage = cls()
+        for id_trajet, noms_stations, tps_mesure, dist_mesure in lignes:
+            stockage.ajouter(id_trajet, noms_stations, tps_mesure, dist_mesure)
+        return stockage
+
+    @classmethod
+    def depuis_csv(cls, base_path=BASE_PATH):
+        """
+        Construit un stockage en lisant le fichier des trajets en flux.
+        """
+        return cls.depuis_lignes(iter_csv_trajets(base_path))
+
+    # ACCÈS EN COLONNES
+    def indices_trajet(self, k):
+        """
+        Retourne les indices locaux des arrêts du trajet k (sans copie).
+        """
+        return memoryview(self.indices)[self.offsets[k]:self.offsets[k + 1]]
+
+    def correspondance_reseau(self, reseau):
+        """
+        Retourne un array('i') index local -> index dans le réseau (-1 si station inconnue).
+        """
+        return array("i", (reseau.index_par_nom.get(nom, -1) for nom in self.noms))
+
+    # INTERFACE TrajetObserve
+    def __len__(self):
+        return len(self.ids)
+
+    def __getitem__(self, k):
+        """
+        Reconstruit le trajet k sous la forme d’un TrajetObserve.
+        """
+        if k < 0:
+            k += len(self)
+        if not 0 <= k < len(self):
+            raise IndexError("Indice de trajet hors limites")
+
+        tps = self.tps_mesures[k]
+        dist = self.dist_mesures[k]
+        return TrajetObserve(
+            self.ids[k],
+            [self.noms[i] for i in self.indices_trajet(k)],
+            None if math.isnan(tps) else tps,
+            None if math.isnan(dist) else dist
+        )
+
+    def __iter__(self):
+        for k in range(len(self)):
+            yield self[k]
@@ -0,0 +1,348 @@
+import heapq
+import math
+import os
+import pickle
+from array import array
+
+from Class.MoteurItineraire import MoteurItineraire
+from Class.MatricesNumpy import np
+from csv_files.ReadCSV import BASE_PATH, empreinte_fichiers
+
+
+class TablesPlusCourtsChemins:
+    """
+    Tables des plus courts chemins entre toutes les paires de stations.
+
+    Pour chaque critère (temps et distance), on conserve par station source :
+    - le coût vers chaque station (inf si inatteignable)
+    - le prédécesseur de chaque station sur le plus court chemin (-1 si aucun)
+
+    Une fois les tables calculées, une requête coûte O(longueur du chemin).
+    Les tables sont sauvegardées sur disque, associées à une empreinte des
+    fichiers CSV du réseau, et réutilisées tant que ces fichiers ne changent pas.
+
+    Quand une route est ajoutée, modifiée ou fermée, les tables sont réparées
+    à partir du journal du réseau (méthode de Ramalingam et Reps) : seules les
+    stations dont le plus court chemin change sont recalculées.
+    """
+
+    # Version du format de fichier : à incrémenter si la structure change
+    VERSION_FORMAT = 1
+
+    CRITERES = ("temps", "distance")
+
+    # Fichiers CSV dont dépend le réseau
+    FICHIERS_SOURCES = ("stations_xl.csv", "routes_xl.csv")
+
+    # Emplacement par défaut du cache
+    FICHIER_CACHE = BASE_PATH + "cache/plus_courts_chemins.pkl"
+
+    def __init__(self, reseau):
+        """
+        Initialise des tables vides pour un réseau urbain.
+        - reseau : instance de ReseauUrbain
+        """
+        self.reseau = reseau
+        self.moteur = MoteurItineraire(reseau)
+        self.couts = {}         # critère -> liste (par source) de array('d')
+        self.precedents = {}    # critère -> liste (par source) de array('i')
+        self.version = None     # Version du réseau correspondant aux tables
+        self.stations_reparees = 0  # Nombre de couples (source, station) recalculés par la dernière mise à jour
+
+    # CALCUL DES TABLES
+    def calculer(self, methode="dijkstra"):
+        """
+        Calcule les tables pour tous les critères.
+
+        :param methode: "dijkstra" (Dijkstra répété depuis chaque station)
+                        ou "floyd_warshall" (version vectorisée, nécessite NumPy)
+        """
+        for critere in self.CRITERES:
+            if methode == "dijkstra":
+                self._calculer_dijkstra(critere)
+            elif methode == "floyd_warshall":
+                self._calculer_floyd_warshall(critere)
+            else:
+                raise ValueError(f"Méthode inconnue : {methode}")
+        self.version = self.reseau.version
+        return self
+
+    def _calculer_dijkstra(self, critere):
+        """
+        Lance un Dijkstra complet depuis chaque station.
+        """
+        n = len(self.reseau.stations)
+        adjacence = self.reseau.adjacence(critere)
+
+        couts = []
+        precedents = []
+        for source in range(n):
+            dist, precedent = self.moteur.arbre(source, adjacence)
+
+            ligne_couts = array("d", [math.inf]) * n
+            ligne_precedents = array("i", [-1]) * n
+            for v, d in dist.items():
+                ligne_couts[v] = d
+                p = precedent[v]
+                ligne_precedents[v] = -1 if p is None else p
+
+            couts.append(ligne_couts)
+            precedents.append(ligne_precedents)
+
+        self.couts[critere] = couts
+        self.precedents[critere] = precedents
+
+    def _calculer_floyd_warshall(self, critere):
+        """
+        Algorithme de Floyd–Warshall vectorisé : chaque étape k met à jour
+        toute la matrice en une seule opération NumPy.
+        """
+        if np is None:
+            raise ImportError("La méthode floyd_warshall nécessite NumPy")
+
+        n = len(self.reseau.stations)
+        dist = self.reseau.matrices_numpy().matrice(critere).copy()
+        np.fill_diagonal(dist, 0.0)
+
+        # precedent[i, j] : prédécesseur de j sur le chemin depuis i
+        precedent = np.where(np.isfinite(dist), np.arange(n)[:, None], -1).astype(np.int32)
+        np.fill_diagonal(precedent, -1)
+
+        for k in range(n):
+            candidat = dist[:, k, None] + dist[None, k, :]
+            meilleur = candidat < dist
+            dist = np.where(meilleur, candidat, dist)
+            precedent = np.where(meilleur, precedent[k][None, :], precedent)
+
+        self.couts[critere] = [array("d", ligne.tobytes()) for ligne in dist]
+        self.precedents[critere] = [array("i", ligne.tobytes()) for ligne in precedent]
+
+    # MISE À JOUR INCRÉMENTALE
+    def mettre_a_jour(self):
+        """
+        Répercute sur les tables les modifications de routes survenues depuis
+        leur calcul. Recalcul complet si des stations ont été ajoutées
+        ou si le journal du réseau ne remonte pas assez loin.
+        """
+        if self.version == self.reseau.version:
+            return
+
+        n = len(self.reseau.stations)
+        modifications = None
+        if self.version is not None:
+            modifications = self.reseau.modifications_depuis(self.version)
+
+        if modifications is None or any(len(lignes) != n for lignes in self.couts.values()):
+            self.calculer()
+            return
+
+        # Changement net de chaque route : premier état connu -> état actuel
+        changements = {}
+        for _, i, j, ancien, nouveau in modifications:
+            cle = (min(i, j), max(i, j))
+            premier = changements[cle][0] if cle in changements else ancien
+            changements[cle] = (premier, nouveau)
+
+        self.stations_reparees = 0
+        # Les couples (ancien, nouveau) sont au format (distance, temps)
+        for colonne, critere in enumerate(("distance", "temps")):
+            if critere not in self.couts:
+                continue
+            routes = []
+            for (i, j), (ancien, nouveau) in changements.items():
+                poids_ancien = None if ancien is None else ancien[colonne]
+                poids_nouveau = None if nouveau is None else nouveau[colonne]
+                if poids_ancien != poids_nouveau:
+                    routes.append((i, j, poids_ancien, poids_nouveau))
+            if routes:
+                self._reparer(critere, routes)
+
+        self.version = self.reseau.version
+
+    def _reparer(self, critere, routes):
+        """
+        Répare l’arbre de chaque source après un lot de changements de routes
+        (i, j, ancien poids, nouveau poids), où None signifie route absente.
+
+        1. Hausses et fermetures : seuls les sous-arbres situés sous une route
+           de l’arbre dont le poids a augmenté sont invalidés puis recalculés.
+        2. Baisses et ouvertures : propagation depuis l’extrémité améliorée.
+        """
+        adjacence = self.reseau.adjacence(critere)
+        hausses = [(i, j) for i, j, ancien, nouveau in routes
+                   if ancien is not None and (nouveau is None or nouveau > ancien)]
+        baisses = [(i, j, nouveau) for i, j, ancien, nouveau in routes
+                   if nouveau is not None and (ancien is None or nouveau < ancien)]
+
+        for couts, precedents in zip(self.couts[critere], self.precedents[critere]):
+            racines = []
+            for i, j in hausses:
+                if precedents[j] == i:
+                    racines.append(j)
+                elif precedents[i] == j:
+                    racines.append(i)
+            if racines:
+                self._reparer_hausses(adjacence, couts, precedents, racines)
+
+            for i, j, poids in baisses:
+                for u, v in ((i, j), (j, i)):
+                    if couts[u] + poids < couts[v]:
+                        couts[v] = couts[u] + poids
+                        precedents[v] = u
+                        self._propager(adjacence, couts, precedents, [(couts[v], v)])
+
+    def _reparer_hausses(self, adjacence, couts, precedents, racines):
+        """
+        Recalcule les sous-arbres des plus courts chemins issus des racines données,
+        dont la route vers le prédécesseur a été allongée ou fermée.
+        """
+        # Stations touchées : descendants des racines dans l’arbre
+        touchees = set(racines)
+        pile = list(racines)
+        while pile:
+            x = pile.pop()
+            for y in adjacence[x]:
+                if precedents[y] == x and y not in touchees:
+                    touchees.add(y)
+                    pile.append(y)
+
+        for x in touchees:
+            couts[x] = math.inf
+            precedents[x] = -1
+
+        # Meilleure entrée dans les sous-arbres depuis une station non touchée
+        tas = []
+        for x in touchees:
+            for y, poids in adjacence[x].items():
+                if y not in touchees and couts[y] + poids < couts[x]:
+                    couts[x] = couts[y] + poids
+                    precedents[x] = y
+            if couts[x] < math.inf:
+                tas.append((couts[x], x))
+        heapq.heapify(tas)
+
+        self._propager(adjacence, couts, precedents, tas)
+
+    def _propager(self, adjacence, couts, precedents, tas):
+        """
+        Dijkstra limité aux stations dont le coût diminue, à partir du tas fourni.
+        """
+        while tas:
+            d, u = heapq.heappop(tas)
+            if d > couts[u]:
+                continue
+            self.stations_reparees += 1
+
+            for v, poids in adjacence[u].items():
+                nouveau = d + poids
+                if nouveau < couts[v]:
+                    couts[v] = nouveau
+                    precedents[v] = u
+                    heapq.heappush(tas, (nouveau, v))
+
+    # REQUÊTES
+    def chemin(self, depart, arrivee, critere="temps"):
+        """
+        Retourne (chemin, coût) entre deux stations par simple lecture des tables,
+        ou (None, inf) si l’arrivée est inatteignable.
+        Les tables sont d’abord réparées si le réseau a été modifié.
+        """
+        self.mettre_a_jour()
+
+        depart_i = self.moteur._index(depart)
+        arrivee_i = self.moteur._index(arrivee)
+
+        cout = self.couts[critere][depart_i][arrivee_i]
+        if cout == math.inf:
+            return None, math.inf
+
+        precedents = self.precedents[critere][depart_i]
+        chemin = []
+        cur = arrivee_i
+        while cur != -1:
+            chemin.append(self.reseau.stations[cur].nom)
+            cur = precedents[cur]
+        chemin.reverse()
+
+        return chemin, cout
+
+    def dijkstra(self, depart, arrivee, poids="temps"):
+        """
+        Même contrat que MoteurItineraire.dijkstra : les critères précalculés
+        sont servis par les tables, les autres poids par le moteur.
+        """
+        if isinstance(poids, str) and poids in self.couts:
+            return self.chemin(depart, arrivee, poids)
+        return self.moteur.dijkstra(depart, arrivee, poids)
+
+    # PERSISTANCE SUR DISQUE
+    def sauvegarder(self, chemin_fichier, empreinte):
+        """
+        Sauvegarde les tables, associées à l’empreinte des fichiers sources.
+        """
+        dossier = os.path.dirname(chemin_fichier)
+        if dossier:
+            os.makedirs(dossier, exist_ok=True)
+
+        contenu = {
+            "version": self.VERSION_FORMAT,
+            "empreinte": empreinte,
+            "stations": [s.nom for s in self.reseau.stations],
+            "couts": self.couts,
+            "precedents": self.precedents,
+        }
+
+        # Écriture dans un fichier temporaire puis renommage atomique
+        temporaire = chemin_fichier + ".tmp"
+        with open(temporaire, "wb") as fichier:
+            pickle.dump(contenu, fichier, protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(temporaire, chemin_fichier)
+
+    @classmethod
+    def charger(cls, reseau, chemin_fichier, empreinte):
+        """
+        Recharge des tables sauvegardées.
+        Retourne None si le fichier est absent, d’un autre format,
+        ou calculé pour d’autres fichiers sources ou d’autres stations.
+        """
+        if not os.path.exists(chemin_fichier):
+            return None
+
+        try:
+            with open(chemin_fichier, "rb") as fichier:
+                contenu = pickle.load(fichier)
+        except (OSError, pickle.UnpicklingError, EOFError):
+            return None
+
+        if (
+            not isinstance(contenu, dict)
+            or contenu.get("version") != cls.VERSION_FORMAT
+            or contenu.get("empreinte") != empreinte
+            or contenu.get("stations") != [s.nom for s in reseau.stations]
+        ):
+            return None
+
+        tables = cls(reseau)
+        tables.couts = contenu["couts"]
+        tables.precedents = contenu["precedents"]
+        tables.version = reseau.version
+        return tables
+
+    @classmethod
+    def obtenir(cls, reseau, chemin_fichier=None, base_path=BASE_PATH, methode="dijkstra"):
+        """
+        Retourne les tables du réseau : depuis le cache si les fichiers CSV
+        n’ont pas changé, sinon en les recalculant puis en les sauvegardant.
+        - chemin_fichier : fichier cache ; par défaut cache/plus_courts_chemins.pkl dans
+          le dossier des CSV, pour que deux jeux de données n’écrasent pas leurs tables
+        """
+        if chemin_fichier is None:
+            chemin_fichier = os.path.join(base_path, "cache", "plus_courts_chemins.pkl")
+        empreinte = empreinte_fichiers(cls.FICHIERS_SOURCES, base_path)
+
+        tables = cls.charger(reseau, chemin_fichier, empreinte)
+        if tables is None:
+            tables = cls(reseau).calculer(methode)
+            tables.sauvegarder(chemin_fichier, empreinte)
+
+        return tables
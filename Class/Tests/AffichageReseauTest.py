@@ -0,0 +1,130 @@
+import os
+import shutil
+import subprocess
+import sys
+import tempfile
+import unittest
+
+from Class.ReseauUrbain import ReseauUrbain
+from Class.AffichageReseau import AffichageReseau
+from Class.ConstructeurReseau import ConstructeurReseau
+
+
+class AffichageReseauTest(unittest.TestCase):
+    """
+    Tests unitaires de l’affichage sans fenêtre (AffichageReseau en mode sans affichage).
+
+    Ces tests vérifient :
+    - que l’import du module ne charge pas matplotlib.pyplot
+    - l’enregistrement des heatmaps et des chemins en PNG et en SVG
+    - la réutilisation d’une figure unique d’un schéma à l’autre
+    - l’ordre des stations et l’agrégation par blocs des heatmaps
+    - la prise en compte d’un réseau modifié ou rechargé après la création de l’affichage
+    """
+
+    def setUp(self):
+        self.reseau = ReseauUrbain("test")
+        for nom in ("A", "B", "C", "D"):
+            self.reseau.ajouter_station(nom)
+        self.reseau.ajouter_route("A", "B", 1.0, 2)
+        self.reseau.ajouter_route("B", "C", 2.0, 3)
+        self.reseau.ajouter_route("C", "D", 1.5, 1)
+        self.reseau.ajouter_route("A", "D", 5.0, 9)
+        self.dossier = tempfile.mkdtemp()
+        self.affichage = AffichageReseau(self.reseau, sans_affichage=True)
+
+    def tearDown(self):
+        shutil.rmtree(self.dossier)
+
+    def test_import_paresseux(self):
+        """Vérifie que pyplot n’est pas importé avec le module."""
+        code = "import sys, Class.AffichageReseau; print('matplotlib.pyplot' in sys.modules)"
+        sortie = subprocess.run(
+            [sys.executable, "-c", code], capture_output=True, text=True, check=True,
+            cwd=os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+        )
+        self.assertEqual(sortie.stdout.strip(), "False")
+
+    def test_export_heatmaps(self):
+        """Vérifie l’écriture des heatmaps, au format PNG puis SVG, sur la même figure."""
+        fichiers = self.affichage.exporter_heatmaps(self.dossier)
+        figure = self.affichage.figure
+        fichiers += self.affichage.exporter_heatmaps(self.dossier, format_fichier="svg")
+
+        self.assertIs(self.affichage.figure, figure)
+        for fichier in fichiers:
+            self.assertGreater(os.path.getsize(fichier), 0)
+        with open(fichiers[0], "rb") as f:
+            self.assertEqual(f.read(8), b"\x89PNG\r\n\x1a\n")
+        with open(fichiers[-1], encoding="utf-8") as f:
+            self.assertIn("<svg", f.read())
+
+    def test_export_chemins(self):
+        """Vérifie l’export en lot et le remplacement des seuls chemins sur la figure."""
+        paires = [("A", "C"), ("B", "D"), ("D", "B")]
+        fichiers = self.affichage.exporter_plus_courts_chemins(paires, self.dossier)
+
+        self.assertEqual(len(fichiers), 3)
+        self.assertTrue(all(os.path.exists(f) for f in fichiers))
+        ax = self.affichage.figure.axes[0]
+        # Fond conservé (un nuage de stations), un seul chemin B -> C -> D tracé
+        self.assertEqual(len(ax.collections), 1)
+        self.assertEqual(len(ax.lines), 1)
+        self.assertEqual(len(ax.lines[0].get_xdata()), 3)
+        self.assertIn("coût ≈ 4 min", ax.get_title())
+
+    def test_ordre_stations(self):
+        """Vérifie les ordres d’affichage des stations."""
+        self.reseau.ajouter_station("E")
+        self.assertEqual(list(self.affichage.ordre_stations("bfs")), [0, 1, 3, 2, 4])
+        self.assertEqual(list(self.affichage.ordre_stations("composantes")), [0, 1, 2, 3, 4])
+        self.assertEqual(list(self.affichage.ordre_stations(["E", "D", "C", "B", "A"])), [4, 3, 2, 1, 0])
+        with self.assertRaises(ValueError):
+            self.affichage.ordre_stations(["A", "B"])
+        with self.assertRaises(ValueError):
+            self.affichage.ordre_stations("hasard")
+
+    def test_heatmap_par_blocs(self):
+        """Vérifie l’agrégation des heatmaps par blocs (minimum, moyenne) et le masquage des noms."""
+        self.affichage.TAILLE_MAX_IMAGE = 2
+        ax = self.affichage.heatmap_temps().axes[0]
+        # Blocs {A, B} et {C, D} : A-B = 2, C-D = 1, entre les blocs B-C = 3 et A-D = 9
+        self.assertEqual(self.affichage._image.get_array().tolist(), [[2, 3], [3, 1]])
+        self.assertEqual(len(ax.get_xticklabels(minor=True)), 0)
+        self.assertIn("blocs de 2 stations", ax.get_title())
+
+        self.affichage.heatmap_temps(agregation="mean")
+        self.assertEqual(self.affichage._image.get_array().tolist(), [[2, 6], [6, 1]])
+
+        # Même résultat depuis la matrice complète
+        self.affichage.heatmap(self.reseau.matrices_numpy().temps, "Temps", agregation="mean")
+        self.assertEqual(self.affichage._image.get_array().tolist(), [[2, 6], [6, 1]])
+
+    def test_reseau_modifie(self):
+        """Vérifie que les noms et l’index suivent le réseau (ajout de station, rechargement)."""
+        self.reseau.ajouter_station("E")
+        self.reseau.ajouter_route("D", "E", 1.0, 1)
+        ax = self.affichage.afficher_plus_court_chemin("A", "E").axes[0]
+        self.assertIn("E", [texte.get_text() for texte in ax.texts])
+
+        # Remplissage en bloc d’un réseau vide : son index des stations est remplacé
+        reseau = ReseauUrbain("vide")
+        affichage = AffichageReseau(reseau, sans_affichage=True)
+        constructeur = ConstructeurReseau()
+        constructeur.ajouter_station(0, "X")
+        constructeur.ajouter_station(1, "Y")
+        constructeur.ajouter_route(0, 1, 1.0, 5)
+        constructeur.remplir(reseau)
+        ax = affichage.afficher_plus_court_chemin("X", "Y").axes[0]
+        self.assertEqual(sorted(texte.get_text() for texte in ax.texts), ["X", "Y"])
+        ax = affichage.heatmap_temps().axes[0]
+        self.assertEqual([t.get_text() for t in ax.get_xticklabels(minor=True)], ["X", "Y"])
+
+    def test_export_refuse_en_interactif(self):
+        """Vérifie que l’export en lot est refusé en mode interactif."""
+        with self.assertRaises(ValueError):
+            AffichageReseau(self.reseau).exporter_plus_courts_chemins([("A", "B")], self.dossier)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -4,6 +4,9 @@ from Class.AnalyseurTrajets import AnalyseurTrajets
 from Class.TrajetObserve import TrajetObserve
 from Class.ReseauUrbain import ReseauUrbain
 from Class.ParcoursReseau import ParcoursReseau
+from Class.StockageTrajets import StockageTrajets
+from Class.MatricesNumpy import np
+from Class.Benchmarks.GenerateurReseau import GenerateurReseau
 
 
 class AnalyseurTrajetTest(unittest.TestCase):
@@ -313,6 +316,175 @@ class AnalyseurTrajetTest(unittest.TestCase):
 
         self.assertIn(("C", "A"), theorie.segments_inexistants)
 
+    def test_calcul_theorie_station_depart_inconnue(self):
+        """
+        Vérifie qu’une station de départ inconnue produit un segment
+        inexistant au lieu d’interrompre le calcul.
+        """
+
+        trajet = TrajetObserve("TINC", ["D", "A", "B"], 0, 0)
+
+        analyseur = AnalyseurTrajets(self.reseau, [trajet])
+
+        theorie = analyseur.calcul_theorie_trajet(trajet)
+
+        self.assertEqual(theorie.segments_inexistants, [("D", "A")])
+        self.assertEqual(theorie.temps_theorique, 10)
+
+    def test_calcul_theorie_cache(self):
+        """
+        Vérifie le cache des calculs théoriques : succès et échecs comptés,
+        éviction du moins récemment utilisé, invalidation après modification du réseau.
+        """
+
+        analyseur = AnalyseurTrajets(self.reseau, [], taille_cache=2)
+        abc = TrajetObserve("T1", ["A", "B", "C"], 0, 0)
+
+        premier = analyseur.calcul_theorie_trajet(abc)
+        second = analyseur.calcul_theorie_trajet(TrajetObserve("T2", ["A", "B", "C"], 5, 5))
+        self.assertIs(premier, second)
+        self.assertEqual((analyseur.succes_cache, analyseur.echecs_cache), (1, 1))
+
+        # Stations inconnues : calcul sans cache
+        analyseur.calcul_theorie_trajet(TrajetObserve("T3", ["D", "A"], 0, 0))
+        self.assertEqual(len(analyseur.cache_theorie), 1)
+
+        # Au-delà de deux suites, la moins récemment utilisée est évincée
+        analyseur.calcul_theorie_trajet(TrajetObserve("T4", ["B", "C"], 0, 0))
+        analyseur.calcul_theorie_trajet(abc)
+        analyseur.calcul_theorie_trajet(TrajetObserve("T5", ["C", "B"], 0, 0))
+        self.assertEqual(len(analyseur.cache_theorie), 2)
+        self.assertIs(analyseur.calcul_theorie_trajet(abc), premier)
+        self.assertEqual(analyseur.echecs_cache, 3)
+
+        # Une nouvelle route vide le cache : le résultat est recalculé
+        self.reseau.ajouter_station("D")
+        self.reseau.ajouter_route("C", "D", 5, 5)
+        self.assertEqual(analyseur.calcul_theorie_trajet(abc).temps_theorique, 20)
+        self.assertEqual(analyseur.echecs_cache, 4)
+        self.assertEqual(len(analyseur.cache_theorie), 1)
+
+        # Taille nulle : aucun cache
+        sans_cache = AnalyseurTrajets(self.reseau, [], taille_cache=0)
+        sans_cache.calcul_theorie_trajet(abc)
+        self.assertEqual(len(sans_cache.cache_theorie), 0)
+
+    # ===============================
+    # TESTS DU REGROUPEMENT PAR COMPOSANTE
+    # ===============================
+
+    def test_regroupement_par_composante(self):
+        """
+        Vérifie que les trajets anormaux sont regroupés par îlot du réseau.
+        """
+
+        self.reseau.ajouter_station("X")
+        self.reseau.ajouter_station("Y")
+        self.reseau.ajouter_route("X", "Y", 10, 10)
+
+        trajets = [
+            TrajetObserve("R1", ["A", "B"], 100, 10),   # temps trop élevé
+            TrajetObserve("R2", ["X", "Y"], 10, 100),   # distance trop élevée
+            TrajetObserve("R3", ["B", "C"], 10, 10),    # trajet correct
+            TrajetObserve("R4", ["Q"], 10, 10),         # station inconnue
+        ]
+
+        analyseur = AnalyseurTrajets(self.reseau, trajets)
+        anomalies = analyseur.detection_anomalies()
+
+        groupes = analyseur.regrouper_par_composante(anomalies)
+
+        self.assertEqual(groupes, {0: ["R1"], 1: ["R2"], None: ["R4"]})
+
+    # ======================================================
+    # TESTS DES SCORES ROBUSTES (VECTORISÉS)
+    # ======================================================
+
+    @unittest.skipIf(np is None, "NumPy n'est pas installé")
+    def test_scores_robustes_theorie(self):
+        """
+        Vérifie que les valeurs théoriques vectorisées sont celles du calcul unitaire,
+        et que les trajets non évaluables ont des scores NaN.
+        """
+        trajets = [
+            TrajetObserve("T1", ["A", "B", "C"], 20, 20),
+            TrajetObserve("T2", ["A", "X"], 5, 5),          # station inconnue
+            TrajetObserve("T3", ["A", "C"], 5, 5),          # route inexistante
+            TrajetObserve("T4", ["B", "C"], None, 10),      # temps absent
+        ]
+        scores = AnalyseurTrajets(self.reseau, trajets).scores_robustes()
+
+        self.assertEqual(scores["ids"], ["T1", "T2", "T3", "T4"])
+        self.assertEqual(scores["temps_theorique"][0], 20)
+        self.assertEqual(scores["distance_theorique"][3], 10)
+        self.assertEqual(np.isnan(scores["z_temps"]).tolist(), [False, True, True, True])
+        self.assertEqual(np.isnan(scores["z_distance"]).tolist(), [False, True, True, False])
+
+    @unittest.skipIf(np is None, "NumPy n'est pas installé")
+    def test_scores_robustes_origine_destination(self):
+        """
+        Vérifie qu’un écart franc par rapport aux trajets de même origine-destination
+        est signalé, même s’il reste sous le seuil fixe de +30 %.
+        """
+        trajets = [TrajetObserve(f"N{k}", ["A", "B", "C"], 20 + 0.1 * k, 20) for k in range(-5, 6)]
+        trajets.append(TrajetObserve("LENT", ["A", "B", "C"], 25, 20))
+
+        analyseur = AnalyseurTrajets(self.reseau, StockageTrajets.depuis_lignes(
+            (t.idTraj, t.nomsStations, t.tpsMesure, t.distMesure) for t in trajets
+        ))
+        scores = analyseur.scores_robustes()
+
+        self.assertEqual(list(scores["anomalies"]), ["LENT"])
+        self.assertIn("[ATTENTION]", scores["anomalies"]["LENT"][0])
+        self.assertGreater(scores["z_temps"][-1], AnalyseurTrajets.SEUIL_SCORE)
+
+        # Le seuil fixe, lui, ne voit rien (25 / 20 = +25 %)
+        anomalies = AnalyseurTrajets(self.reseau, trajets).detection_anomalies()
+        self.assertEqual(anomalies["LENT"]["MESURE"], [])
+
+    @unittest.skipIf(np is None, "NumPy n'est pas installé")
+    def test_scores_robustes_moins_de_faux_positifs(self):
+        """
+        Sur des mesures simplement bruitées (±35 %), le seuil fixe signale de nombreux
+        trajets alors que les scores robustes n’en signalent aucun ; une valeur aberrante
+        injectée est en revanche détectée.
+        """
+        generateur = GenerateurReseau(100, degre_moyen=3, graine=1)
+        reseau = generateur.reseau()
+        lignes = generateur.trajets(2000, bruit=0.35)
+        id_aberrant, stations, temps, distance = lignes[0]
+        lignes[0] = (id_aberrant, stations, temps * 4, distance)
+
+        scores = AnalyseurTrajets(reseau, StockageTrajets.depuis_lignes(lignes)).scores_robustes()
+        self.assertEqual(list(scores["anomalies"]), [id_aberrant])
+
+        trajets = [TrajetObserve(*ligne) for ligne in lignes]
+        anomalies = AnalyseurTrajets(reseau, trajets).detection_anomalies()
+        self.assertGreater(sum(1 for a in anomalies.values() if a["MESURE"]), 100)
+
+    @unittest.skipIf(np is None, "NumPy n'est pas installé")
+    def test_scores_segments(self):
+        """Vérifie qu’un segment systématiquement plus lent ressort en tête."""
+        for nom in ["D", "E"]:
+            self.reseau.ajouter_station(nom)
+        self.reseau.ajouter_route("C", "D", 10, 10)
+        self.reseau.ajouter_route("D", "E", 10, 10)
+
+        trajets = []
+        for k in range(6):
+            bruit = 0.1 * (k - 3)
+            trajets.append(TrajetObserve(f"AB{k}", ["A", "B"], 10 + bruit, 10))
+            trajets.append(TrajetObserve(f"BC{k}", ["B", "C"], 10 - bruit, 10))
+            trajets.append(TrajetObserve(f"CD{k}", ["C", "D"], 10 + 2 * bruit, 10))
+            trajets.append(TrajetObserve(f"ED{k}", ["E", "D"], 20 + bruit, 10))
+
+        segments = AnalyseurTrajets(self.reseau, trajets).scores_robustes()["segments"]
+
+        self.assertEqual(len(segments), 4)
+        self.assertEqual(segments[0][:3], ("D", "E", 6))
+        self.assertAlmostEqual(segments[0][3], 2.0, places=1)
+        self.assertGreater(segments[0][4], AnalyseurTrajets.SEUIL_SCORE)
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -0,0 +1,73 @@
+import math
+import unittest
+
+from Class.ReseauUrbain import ReseauUrbain
+from Class.AnalyseurTrajets import AnalyseurTrajets
+from Class.TrajetObserve import TrajetObserve
+from Class.MatricesNumpy import np
+
+
+@unittest.skipIf(np is None, "NumPy n'est pas installé")
+class AretesNumpyTest(unittest.TestCase):
+    """
+    Tests unitaires du backend NumPy creux (classe AretesNumpy).
+
+    Ces tests vérifient :
+    - la lecture groupée des poids de segments (+inf pour une liaison absente)
+    - l’égalité des coûts de trajets avec le backend dense (MatricesNumpy)
+    - la reconstruction après modification du réseau
+    - que l’analyse des trajets ne construit pas les matrices n × n
+    """
+
+    def setUp(self):
+        # A ---10/5---> B ---20/8---> C      D (isolée)
+        self.reseau = ReseauUrbain("reseau_test")
+
+        for nom in ["A", "B", "C", "D"]:
+            self.reseau.ajouter_station(nom)
+
+        self.reseau.ajouter_route("A", "B", 10, 5)
+        self.reseau.ajouter_route("B", "C", 20, 8)
+
+        self.aretes = self.reseau.aretes_numpy()
+
+    def test_cout_segments(self):
+        """Vérifie les poids lus dans les deux sens et l’infini pour un segment absent."""
+        distances, temps = self.aretes.cout_segments([0, 1, 2, 0, 3, 0], [1, 0, 1, 2, 0, 0])
+        self.assertEqual(distances.tolist(), [10, 10, 20, math.inf, math.inf, math.inf])
+        self.assertEqual(temps.tolist(), [5, 5, 8, math.inf, math.inf, math.inf])
+
+    def test_identique_au_backend_dense(self):
+        """Vérifie que les coûts de trajets sont ceux de MatricesNumpy."""
+        indices = np.array([0, 1, 2, 2, 1, 0, 0, 3], dtype=np.int64)
+        longueurs = np.array([3, 3, 2], dtype=np.int64)
+
+        creux = self.aretes.cout_trajets(indices, longueurs)
+        dense = self.reseau.matrices_numpy().cout_trajets(indices, longueurs)
+        for a, b in zip(creux, dense):
+            self.assertEqual(a.tolist(), b.tolist())
+        self.assertEqual(creux[2].tolist(), [[2, 0, 3]])
+
+    def test_reseau_vide_et_modification(self):
+        """Vérifie le réseau sans route et la reconstruction après modification."""
+        vide = ReseauUrbain("vide")
+        vide.ajouter_station("X")
+        distances, _ = vide.aretes_numpy().cout_segments([0], [0])
+        self.assertEqual(distances.tolist(), [math.inf])
+
+        self.assertIs(self.reseau.aretes_numpy(), self.aretes)
+        self.reseau.ajouter_route("C", "D", 3, 2)
+        aretes = self.reseau.aretes_numpy()
+        self.assertIsNot(aretes, self.aretes)
+        self.assertEqual(aretes.cout_segments([3], [2])[1].tolist(), [2])
+
+    def test_analyse_sans_matrices_denses(self):
+        """Vérifie que l’analyse vectorisée n’utilise pas les matrices n × n."""
+        trajets = [TrajetObserve(1, ["A", "B", "C"], 13, 30), TrajetObserve(2, ["C", "B"], 8, 20)]
+        AnalyseurTrajets(self.reseau, trajets).calcul_theorie_tous_trajets(vectorise=True)
+        AnalyseurTrajets(self.reseau, trajets).scores_robustes()
+        self.assertIsNone(self.reseau._matrices_numpy)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,60 @@
+import unittest
+
+from Class.ReseauUrbain import ReseauUrbain
+from Class.AnalyseurTrajets import AnalyseurTrajets
+from Class.AuditTrajets import AuditTrajets
+from Class.TrajetObserve import TrajetObserve
+
+
+class AuditTrajetsTest(unittest.TestCase):
+    """
+    Tests unitaires de la classe AuditTrajets.
+
+    Ces tests vérifient que l’audit par lots, séquentiel ou réparti
+    sur plusieurs processus, produit exactement le même résultat
+    (contenu et ordre) qu’une analyse directe de tous les trajets.
+    """
+
+    def setUp(self):
+        # A ---10---> B ---10---> C
+        self.reseau = ReseauUrbain("reseau_test")
+
+        self.reseau.ajouter_station("A")
+        self.reseau.ajouter_station("B")
+        self.reseau.ajouter_station("C")
+
+        self.reseau.ajouter_route("A", "B", 10, 10)
+        self.reseau.ajouter_route("B", "C", 10, 10)
+
+        self.lignes = [
+            ("1", ["A", "B", "C"], 20.0, 20.0),
+            ("2", ["A", "B", "C"], 100.0, 20.0),
+            ("3", ["C", "A"], 20.0, 20.0),
+            ("4", ["A"], 10.0, 10.0),
+            ("5", ["A", "D"], None, 10.0),
+            ("6", ["B", "C"], 10.0, 5.0),
+            ("7", ["A", "B", "A"], 20.0, 20.0),
+        ]
+
+        trajets = [TrajetObserve(*ligne) for ligne in self.lignes]
+        self.attendu = AnalyseurTrajets(self.reseau, trajets).detection_anomalies()
+
+    def verifier(self, resultat):
+        self.assertEqual(resultat, self.attendu)
+        self.assertEqual(list(resultat), list(self.attendu))
+
+    def test_audit_sequentiel(self):
+        """Vérifie l’audit par lots dans le processus courant."""
+        audit = AuditTrajets(self.reseau, nb_processus=1, taille_lot=3)
+
+        self.verifier(audit.executer(iter(self.lignes)))
+
+    def test_audit_parallele(self):
+        """Vérifie l’audit réparti sur plusieurs processus."""
+        audit = AuditTrajets(self.reseau, nb_processus=2, taille_lot=2)
+
+        self.verifier(audit.executer(iter(self.lignes)))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,99 @@
+import itertools
+import unittest
+
+from Class.ReseauUrbain import ReseauUrbain
+from Class.CheminsAlternatifs import CheminsAlternatifs
+from Class.Benchmarks.GenerateurReseau import GenerateurReseau
+
+
+class CheminsAlternatifsTest(unittest.TestCase):
+    """
+    Tests unitaires de la classe CheminsAlternatifs (algorithme de Yen).
+
+    Ces tests vérifient :
+    - l’ordre et l’unicité des k plus courts chemins
+    - l’absence de boucle dans les chemins proposés
+    - l’exactitude par rapport à une énumération exhaustive sur un petit réseau
+    """
+
+    def setUp(self):
+        """
+        Réseau en forme de grille 2 x 3 (temps sur chaque route) :
+            A -1- B -1- C
+            |2    |1    |2
+            D -1- E -3- F
+        """
+        self.reseau = ReseauUrbain("reseau_test")
+        for nom in ["A", "B", "C", "D", "E", "F", "G"]:
+            self.reseau.ajouter_station(nom)
+
+        for depart, arrivee, temps in [
+            ("A", "B", 1), ("B", "C", 1), ("D", "E", 1), ("E", "F", 3),
+            ("A", "D", 2), ("B", "E", 1), ("C", "F", 2),
+        ]:
+            self.reseau.ajouter_route(depart, arrivee, temps, temps)
+
+        self.alternatifs = CheminsAlternatifs(self.reseau)
+
+    def enumerer(self, reseau, depart, arrivee, critere="temps"):
+        """
+        Énumère par force brute tous les chemins sans boucle (petit réseau uniquement).
+        """
+        adjacence = reseau.adjacence(critere)
+        cible = reseau.index_par_nom[arrivee]
+        resultats = []
+        pile = [[reseau.index_par_nom[depart]]]
+        while pile:
+            chemin = pile.pop()
+            if chemin[-1] == cible:
+                cout = sum(adjacence[a][b] for a, b in zip(chemin, chemin[1:]))
+                resultats.append(cout)
+                continue
+            for v in adjacence[chemin[-1]]:
+                if v not in chemin:
+                    pile.append(chemin + [v])
+        return sorted(resultats)
+
+    def test_k_plus_courts(self):
+        """Vérifie les premiers chemins sur la grille."""
+        chemins = self.alternatifs.k_plus_courts("A", "F", k=3)
+
+        self.assertEqual(chemins[0], (["A", "B", "C", "F"], 4))
+        self.assertEqual([cout for _, cout in chemins], [4, 5, 6])
+        self.assertEqual(len({tuple(chemin) for chemin, _ in chemins}), 3)
+
+    def test_tous_les_chemins(self):
+        """Vérifie qu’avec un k élevé on retrouve tous les chemins sans boucle."""
+        chemins = self.alternatifs.k_plus_courts("A", "F", k=50)
+
+        self.assertEqual([cout for _, cout in chemins], self.enumerer(self.reseau, "A", "F"))
+        for chemin, _ in chemins:
+            self.assertEqual(len(chemin), len(set(chemin)))
+
+    def test_reutilisation_arbre(self):
+        """Vérifie que le premier chemin est lu dans l’arbre, sans recherche A*."""
+        chemins = self.alternatifs.k_plus_courts("A", "F", k=1)
+
+        self.assertEqual(chemins, [(["A", "B", "C", "F"], 4)])
+        self.assertEqual(self.alternatifs.recherches, 0)
+
+    def test_inatteignable(self):
+        """Vérifie le cas d’une arrivée inatteignable."""
+        self.assertEqual(self.alternatifs.k_plus_courts("A", "G"), [])
+
+    def test_reseau_aleatoire(self):
+        """Compare les coûts avec une énumération exhaustive sur un réseau aléatoire."""
+        reseau = GenerateurReseau(12, degre_moyen=3, graine=7).reseau()
+        alternatifs = CheminsAlternatifs(reseau)
+
+        for depart, arrivee in itertools.islice(itertools.permutations(["S0", "S5", "S9", "S11"], 2), 6):
+            attendu = self.enumerer(reseau, depart, arrivee, "distance")[:10]
+            obtenu = [cout for _, cout in alternatifs.k_plus_courts(depart, arrivee, 10, "distance")]
+
+            self.assertEqual(len(obtenu), len(attendu))
+            for a, b in zip(obtenu, attendu):
+                self.assertAlmostEqual(a, b)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,127 @@
+import os
+import shutil
+import tempfile
+import unittest
+
+from Class.ReseauUrbain import ReseauUrbain
+from Class.ConstructeurReseau import ConstructeurReseau
+from Class.MatricesNumpy import np
+
+
+class ConstructeurReseauTest(unittest.TestCase):
+    """
+    Tests unitaires de la construction en bloc d’un réseau (ConstructeurReseau, depuis_listes).
+
+    Ces tests vérifient :
+    - l’équivalence avec une construction par ajouter_station / ajouter_route
+    - la validation des identifiants, des noms et des valeurs des routes (réels NumPy compris)
+    - le dédoublonnage des noms de stations
+    - les messages d’erreur citant la ligne fautive d’un fichier CSV
+    """
+
+    def setUp(self):
+        self.stations = [(0, "Gare"), (1, "Centre", 48.8, 2.3), (2, "Port")]
+        self.routes = [("0", "1", 1.5, 4), ("1", "2", 2.0, 6), (0, 1, 1.0, 3)]
+
+    def test_equivalence(self):
+        """Vérifie que la construction en bloc donne le même réseau que les ajouts un à un."""
+        reseau = ReseauUrbain.depuis_listes(self.stations, self.routes, nom="bloc")
+
+        attendu = ReseauUrbain("attendu")
+        attendu.ajouter_station("Gare")
+        attendu.ajouter_station("Centre", 48.8, 2.3)
+        attendu.ajouter_station("Port")
+        attendu.ajouter_route("Gare", "Centre", 1.5, 4)
+        attendu.ajouter_route("Centre", "Port", 2.0, 6)
+        attendu.ajouter_route("Gare", "Centre", 1.0, 3)
+
+        self.assertEqual(reseau.nom, "bloc")
+        self.assertEqual(reseau.index_par_nom, attendu.index_par_nom)
+        self.assertEqual(reseau.adjacence_distances, attendu.adjacence_distances)
+        self.assertEqual(reseau.adjacence_temps, attendu.adjacence_temps)
+        self.assertEqual(reseau.stations[1].latitude, 48.8)
+        self.assertEqual(reseau.matrice_temps, attendu.matrice_temps)
+
+        # Une seule version, journal vide : les caches repartent de zéro
+        self.assertIsNone(reseau.modifications_depuis(0))
+        version = reseau.version
+        reseau.ajouter_route("Gare", "Port", 5, 5)
+        self.assertEqual(len(reseau.modifications_depuis(version)), 1)
+
+    def test_validation(self):
+        """Vérifie les erreurs de validation (ValueError citant l’élément fautif)."""
+        with self.assertRaisesRegex(ValueError, r"Station n°2 : Identifiant de station en double : 0"):
+            ReseauUrbain.depuis_listes([(0, "A"), (0, "B")], [])
+        with self.assertRaisesRegex(ValueError, r"Nom vide"):
+            ReseauUrbain.depuis_listes([(0, " ")], [])
+        with self.assertRaisesRegex(ValueError, r"Route n°2 : Station inconnue dans une route : 7"):
+            ReseauUrbain.depuis_listes(self.stations, [(0, 1, 1, 1), (1, 7, 1, 1)])
+        with self.assertRaisesRegex(ValueError, r"Temps invalide"):
+            ReseauUrbain.depuis_listes(self.stations, [(0, 1, 1, -2)])
+        with self.assertRaisesRegex(ValueError, r"Distance invalide"):
+            ReseauUrbain.depuis_listes(self.stations, [(0, 1, float("nan"), 1)])
+        with self.assertRaisesRegex(ValueError, r"Temps invalide"):
+            ReseauUrbain.depuis_listes(self.stations, [(0, 1, 1, True)])
+
+    @unittest.skipIf(np is None, "NumPy n'est pas installé")
+    def test_valeurs_numpy(self):
+        """Vérifie que les réels NumPy sont acceptés comme distances et temps."""
+        reseau = ReseauUrbain.depuis_listes(self.stations, [(0, 1, np.float32(1.5), np.int64(4))])
+        self.assertEqual(reseau.adjacence_temps[0][1], 4)
+        self.assertEqual(reseau.adjacence_distances[1][0], 1.5)
+
+    def test_dedoublonnage(self):
+        """Vérifie qu’un nom répété sous un autre identifiant désigne la même station."""
+        constructeur = ConstructeurReseau()
+        constructeur.ajouter_station(0, "Gare")
+        constructeur.ajouter_station(1, "Centre")
+        constructeur.ajouter_station(2, "Gare")
+        constructeur.ajouter_route(2, 1, 1.0, 2.0)
+        reseau = constructeur.remplir(ReseauUrbain("test"))
+
+        self.assertEqual(len(reseau.stations), 2)
+        self.assertEqual(constructeur.doublons, 1)
+        self.assertEqual(reseau.voisins("Gare"), ["Centre"])
+
+        with self.assertRaises(ValueError):
+            constructeur.remplir(ReseauUrbain("autre"))
+
+    def test_reseau_non_vide(self):
+        """Vérifie qu’un réseau déjà rempli reçoit les éléments un à un."""
+        reseau = ReseauUrbain("test")
+        reseau.ajouter_station("Port")
+        constructeur = ConstructeurReseau()
+        constructeur.ajouter_station(0, "Gare")
+        constructeur.ajouter_station(1, "Port")
+        constructeur.ajouter_route(0, 1, 1.0, 2.0)
+        constructeur.remplir(reseau)
+
+        self.assertEqual(reseau.index_par_nom, {"Port": 0, "Gare": 1})
+        self.assertEqual(reseau.voisins("Port"), ["Gare"])
+
+    def test_erreurs_csv(self):
+        """Vérifie que les erreurs de chargement citent le fichier et la ligne fautive."""
+        dossier = tempfile.mkdtemp() + os.sep
+        try:
+            with open(dossier + "stations_xl.csv", "w", encoding="utf-8") as f:
+                f.write("id,nom\n0,Gare\n1,Centre\n")
+            with open(dossier + "routes_xl.csv", "w", encoding="utf-8") as f:
+                f.write("from,to,distance_km,temps_min\n0,1,1.5,4\n\n1,9,2,3\n")
+            with self.assertRaisesRegex(ValueError, r"routes_xl\.csv, ligne 4 : Station inconnue dans une route : 9"):
+                ReseauUrbain("test").charger_depuis_csv(dossier)
+
+            with open(dossier + "routes_xl.csv", "w", encoding="utf-8") as f:
+                f.write("from,to,distance_km,temps_min\n0,1,abc,4\n")
+            with self.assertRaisesRegex(ValueError, r"routes_xl\.csv, ligne 2 : ligne invalide"):
+                ReseauUrbain("test").charger_depuis_csv(dossier)
+
+            with open(dossier + "stations_xl.csv", "w", encoding="utf-8") as f:
+                f.write("id,nom\n0,Gare\n0,Centre\n")
+            with self.assertRaisesRegex(ValueError, r"stations_xl\.csv, ligne 3 : Identifiant de station en double"):
+                ReseauUrbain("test").charger_depuis_csv(dossier)
+        finally:
+            shutil.rmtree(dossier)
+
+
+if __name__ == "__main__":
+    unittest.main()
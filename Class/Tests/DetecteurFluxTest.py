@@ -0,0 +1,163 @@
+import math
+import os
+import random
+import shutil
+import tempfile
+import types
+import unittest
+
+from Class.ReseauUrbain import ReseauUrbain
+from Class.DetecteurFlux import DetecteurFlux
+from Class.TrajetObserve import TrajetObserve
+
+
+class DetecteurFluxTest(unittest.TestCase):
+    """
+    Tests unitaires de la classe DetecteurFlux (détection d’anomalies en flux).
+
+    Ces tests vérifient :
+    - les anomalies de format et de logique, comme l’analyse par lots
+    - les statistiques de Welford par route (moyenne, écart-type)
+    - le signalement d’une mesure atypique dès son arrivée
+    - l’adaptation de la norme à un changement durable (et non à un incident isolé)
+    - la remise à zéro après une modification du réseau
+    - le suivi d’un fichier de trajets
+    """
+
+    def setUp(self):
+        """
+        Réseau en ligne : A -4- B -6- C -10- D (temps = distance).
+        """
+        self.reseau = ReseauUrbain("reseau_test")
+        for nom in ["A", "B", "C", "D", "E"]:
+            self.reseau.ajouter_station(nom)
+        for depart, arrivee, temps in [("A", "B", 4), ("B", "C", 6), ("C", "D", 10)]:
+            self.reseau.ajouter_route(depart, arrivee, temps, temps)
+
+        self.detecteur = DetecteurFlux(self.reseau, min_observations=10)
+        self.aleatoire = random.Random(0)
+
+    def trajets_normaux(self, nombre):
+        """
+        Trajets sans anomalie : mesures à ±5 % de la théorie.
+        """
+        parcours = [(["A", "B", "C"], 10), (["B", "C", "D"], 16), (["A", "B", "C", "D"], 20)]
+        trajets = []
+        for k in range(nombre):
+            stations, theorie = parcours[k % len(parcours)]
+            facteur = self.aleatoire.uniform(0.95, 1.05)
+            trajets.append(TrajetObserve(str(k), stations, theorie * facteur, theorie * facteur))
+        return trajets
+
+    def test_format_logique(self):
+        """Vérifie les anomalies de format et de logique (mêmes messages que l’analyse par lots)."""
+        anomalies = self.detecteur.analyser(TrajetObserve("1", ["A", "X"], 5, None))
+        self.assertIn("[ALERTE] Station inconnue dans le réseau : X", anomalies["FORMAT"])
+        self.assertIn("[ALERTE] Valeurs mesurées manquantes (temps ou distance)", anomalies["FORMAT"])
+        self.assertIn("[ALERTE] Route inexistante entre A et X", anomalies["LOGIQUE"])
+
+        anomalies = self.detecteur.analyser(TrajetObserve("2", ["A", "B", "A"], 8, 8))
+        self.assertEqual(anomalies["LOGIQUE"], ["[ATTENTION] Boucle détectée (station répétée)"])
+
+        anomalies = self.detecteur.analyser(TrajetObserve("3", ["A", "C"], 10, 10))
+        self.assertIn("[ALERTE] Trajet théoriquement impossible", anomalies["LOGIQUE"])
+
+        self.assertIsNone(self.detecteur.analyser(TrajetObserve("4", ["A", "B"], 4, 4)))
+        self.assertEqual((self.detecteur.nb_trajets, self.detecteur.nb_anomalies), (4, 3))
+
+    def test_statistiques_welford(self):
+        """Vérifie les statistiques d’une route par rapport à un calcul direct."""
+        valeurs = []
+        for k in range(50):
+            temps = 4 * self.aleatoire.uniform(0.9, 1.1)
+            self.detecteur.analyser(TrajetObserve(str(k), ["A", "B"], temps, 4))
+            valeurs.append(temps)
+
+        logs = [math.log(v / 4) for v in valeurs]
+        moyenne = sum(logs) / len(logs)
+        ecart = (sum((x - moyenne) ** 2 for x in logs) / (len(logs) - 1)) ** 0.5
+
+        n, m, e = self.detecteur.statistiques("B", "A")
+        self.assertEqual(n, 50)
+        self.assertAlmostEqual(m, moyenne)
+        self.assertAlmostEqual(e, ecart)
+        self.assertEqual(self.detecteur.statistiques("C", "D"), (0, 0.0, 0.0))
+
+        with self.assertRaises(ValueError):
+            self.detecteur.statistiques("A", "D")
+
+    def test_mesure_atypique(self):
+        """Vérifie qu’une mesure atypique est signalée dès son arrivée, sans fausser la norme."""
+        self.assertEqual(list(self.detecteur.flux(self.trajets_normaux(300))), [])
+
+        # Un seul trajet trop lent, au milieu d’un flux normal
+        self.assertEqual(list(self.detecteur.flux(self.trajets_normaux(10))), [])
+        avant = self.detecteur.statistiques("A", "B")
+        resultats = list(self.detecteur.flux([TrajetObserve("lent", ["A", "B", "C"], 18, 10)]))
+        self.assertEqual([traj_id for traj_id, _ in resultats], ["lent"])
+        self.assertTrue(resultats[0][1]["MESURE"][0].startswith("[ATTENTION] Temps mesuré atypique"))
+
+        # Le trajet atypique n’a pas été intégré aux statistiques
+        self.assertEqual(self.detecteur.statistiques("A", "B"), avant)
+
+        trop_court = self.detecteur.analyser(TrajetObserve("court", ["B", "C", "D"], 16, 9))
+        self.assertTrue(trop_court["MESURE"][0].startswith("[NOTICE] Distance mesurée atypique"))
+
+    def test_changement_durable(self):
+        """Vérifie que la norme d’une route rejoint un temps de parcours durablement allongé."""
+        detecteur = DetecteurFlux(self.reseau, min_observations=10, adaptation=5, memoire=50)
+
+        def trajets(nombre, facteur):
+            return [
+                TrajetObserve(str(k), ["A", "B"], 4 * facteur * self.aleatoire.uniform(0.95, 1.05), 4)
+                for k in range(nombre)
+            ]
+
+        self.assertEqual(list(detecteur.flux(trajets(100, 1.0))), [])
+        self.assertEqual(detecteur.statistiques("A", "B")[0], 50)      # Effectif plafonné
+
+        # Incident isolé : moins de adaptation mesures atypiques, norme inchangée
+        moyenne = detecteur.statistiques("A", "B")[1]
+        self.assertEqual(len(list(detecteur.flux(trajets(4, 1.5)))), 4)
+        list(detecteur.flux(trajets(1, 1.0)))
+        self.assertLess(abs(detecteur.statistiques("A", "B")[1] - moyenne), 0.01)
+
+        # Changement durable : signalé au début, puis intégré à la norme
+        signales = [int(traj_id) for traj_id, _ in detecteur.flux(trajets(300, 1.5))]
+        self.assertGreaterEqual(len(signales), 5)
+        self.assertLess(max(signales), 200)
+        self.assertAlmostEqual(detecteur.statistiques("A", "B")[1], math.log(1.5), delta=0.05)
+
+    def test_flux_paresseux(self):
+        """Vérifie que chaque trajet est traité à son arrivée (générateur)."""
+        flux = self.detecteur.flux(iter(self.trajets_normaux(5)))
+        self.assertIsInstance(flux, types.GeneratorType)
+        self.assertEqual(self.detecteur.nb_trajets, 0)
+        list(flux)
+        self.assertEqual(self.detecteur.nb_trajets, 5)
+
+    def test_modification_reseau(self):
+        """Vérifie la remise à zéro des statistiques après une modification du réseau."""
+        list(self.detecteur.flux(self.trajets_normaux(30)))
+        self.assertGreater(self.detecteur.statistiques("A", "B")[0], 0)
+
+        self.reseau.ajouter_route("D", "E", 3, 3)
+        self.assertEqual(self.detecteur.statistiques("A", "B")[0], 0)
+        self.assertIsNone(self.detecteur.analyser(TrajetObserve("1", ["C", "D", "E"], 13, 13)))
+
+    def test_suivi_csv(self):
+        """Vérifie la détection sur un fichier de trajets suivi au fil de son écriture."""
+        dossier = tempfile.mkdtemp() + os.sep
+        try:
+            with open(dossier + "trajets_xl.csv", "w", encoding="utf-8") as f:
+                f.write("id_trajet,stations,temps_mesure,distance_mesuree\n")
+                f.write("1,A;B,4,4\n2,A;X,4,4\n")
+
+            ids = [traj_id for traj_id, _ in self.detecteur.suivre_csv(dossier, intervalle=0, arret=lambda: True)]
+            self.assertEqual(ids, ["2"])
+        finally:
+            shutil.rmtree(dossier)
+
+
+if __name__ == "__main__":
+    unittest.main()
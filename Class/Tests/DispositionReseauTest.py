@@ -0,0 +1,84 @@
+import unittest
+
+from Class.ReseauUrbain import ReseauUrbain
+from Class.DispositionReseau import DispositionReseau
+
+
+class DispositionReseauTest(unittest.TestCase):
+    """
+    Tests unitaires du placement des stations pour l’affichage (DispositionReseau).
+
+    Ces tests vérifient :
+    - le choix automatique de la méthode (géographique, spectrale, circulaire)
+    - la normalisation des positions dans le carré [-1, 1]²
+    - la disposition spectrale d’un réseau en ligne
+    - la mise en cache jusqu’à la modification du réseau
+    """
+
+    def setUp(self):
+        # Ligne A - B - C - D - E
+        self.reseau = ReseauUrbain("ligne")
+        self.noms = ["A", "B", "C", "D", "E"]
+        for nom in self.noms:
+            self.reseau.ajouter_station(nom)
+        for s1, s2 in zip(self.noms, self.noms[1:]):
+            self.reseau.ajouter_route(s1, s2, 1.0, 1)
+
+    def test_geographique(self):
+        """Vérifie l’utilisation des coordonnées lorsque toutes les stations en ont."""
+        reseau = ReseauUrbain("geo")
+        reseau.ajouter_station("Nord", 48.0, 2.0)
+        reseau.ajouter_station("Sud", 47.0, 2.0)
+        reseau.ajouter_station("Est", 47.5, 3.0)
+        disposition = DispositionReseau(reseau)
+        x, y = disposition.positions()
+
+        self.assertEqual(disposition.methode_utilisee, "geographique")
+        self.assertGreater(y[0], y[2])
+        self.assertGreater(y[2], y[1])
+        self.assertGreater(x[2], x[0])
+        self.assertAlmostEqual(max(abs(x).max(), abs(y).max()), 1.0)
+
+    def test_spectrale(self):
+        """Vérifie que la disposition spectrale d’une ligne conserve l’ordre des stations."""
+        disposition = DispositionReseau(self.reseau)
+        x, y = disposition.positions()
+
+        self.assertEqual(disposition.methode_utilisee, "spectrale")
+        self.assertLessEqual(max(abs(x).max(), abs(y).max()), 1.0 + 1e-9)
+        ordre = sorted(range(5), key=lambda i: x[i])
+        self.assertIn(ordre, ([0, 1, 2, 3, 4], [4, 3, 2, 1, 0]))
+
+    def test_circulaire(self):
+        """Vérifie le placement circulaire (petit réseau ou méthode imposée)."""
+        reseau = ReseauUrbain("duo")
+        reseau.ajouter_station("A")
+        reseau.ajouter_station("B")
+        disposition = DispositionReseau(reseau)
+        disposition.positions()
+        self.assertEqual(disposition.methode_utilisee, "circulaire")
+
+        # Stations à égale distance du centre du cercle (le cadre, lui, est recentré)
+        x, y = DispositionReseau(self.reseau, methode="circulaire").positions()
+        cx, cy = x.mean(), y.mean()
+        rayons = [(xi - cx) ** 2 + (yi - cy) ** 2 for xi, yi in zip(x, y)]
+        for rayon in rayons:
+            self.assertAlmostEqual(rayon, rayons[0])
+
+        with self.assertRaises(ValueError):
+            DispositionReseau(self.reseau, methode="aleatoire")
+
+    def test_cache_et_segments(self):
+        """Vérifie la mise en cache des positions et la forme des segments."""
+        disposition = DispositionReseau(self.reseau)
+        x, _ = disposition.positions()
+        self.assertIs(disposition.positions()[0], x)
+        self.assertEqual(disposition.segments().shape, (4, 2, 2))
+
+        self.reseau.ajouter_route("A", "E", 1.0, 1)
+        self.assertIsNot(disposition.positions()[0], x)
+        self.assertEqual(disposition.segments().shape, (5, 2, 2))
+
+
+if __name__ == "__main__":
+    unittest.main()
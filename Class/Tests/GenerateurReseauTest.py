@@ -0,0 +1,71 @@
+import json
+import os
+import shutil
+import tempfile
+import unittest
+
+from Class.Benchmarks.GenerateurReseau import GenerateurReseau
+from Class.Benchmarks.BenchmarkReseau import BenchmarkReseau
+from Class.IndexConnexite import IndexConnexite
+from Class.ReseauUrbain import ReseauUrbain
+
+
+class GenerateurReseauTest(unittest.TestCase):
+    """
+    Tests du générateur de réseaux synthétiques et du harnais de benchmarks.
+    """
+
+    def setUp(self):
+        self.dossier = tempfile.mkdtemp() + os.sep
+
+    def tearDown(self):
+        shutil.rmtree(self.dossier)
+
+    def test_reseau_connexe(self):
+        """Vérifie la taille, la densité et la connexité du réseau généré."""
+        generateur = GenerateurReseau(200, degre_moyen=4, graine=1)
+        reseau = generateur.reseau()
+
+        self.assertEqual(len(reseau.stations), 200)
+        self.assertEqual(len(generateur.liaisons), 400)
+        self.assertEqual(IndexConnexite(reseau).nb_composantes, 1)
+
+    def test_reproductible(self):
+        """Vérifie qu’une même graine donne le même réseau."""
+        self.assertEqual(
+            GenerateurReseau(50, graine=3).routes(),
+            GenerateurReseau(50, graine=3).routes()
+        )
+
+    def test_ecriture_csv(self):
+        """Vérifie que les CSV générés se rechargent dans un ReseauUrbain."""
+        generateur = GenerateurReseau(30, graine=2)
+        generateur.ecrire_csv(self.dossier, nb_trajets=5)
+
+        reseau = ReseauUrbain("relu")
+        reseau.charger_depuis_csv(self.dossier)
+
+        self.assertEqual(len(reseau.stations), 30)
+        self.assertEqual(len(list(reseau.aretes())), len(generateur.liaisons))
+
+    def test_benchmark_json(self):
+        """Vérifie l’exécution du harnais et la comparaison de deux fichiers JSON."""
+        benchmark = BenchmarkReseau(tailles=(20,), repetitions=1, nb_requetes=2, nb_trajets=10)
+        resultats = benchmark.executer()
+
+        fichier = self.dossier + "bench.json"
+        benchmark.sauvegarder_json(resultats, fichier)
+
+        with open(fichier, encoding="utf-8") as f:
+            contenu = json.load(f)
+
+        self.assertEqual(
+            [r["cas"] for r in contenu["resultats"]],
+            ["charger_depuis_csv", "bfs", "dfs", "dijkstra", "detection_anomalies",
+             "detection_flux", "csa_arrivee_au_plus_tot"]
+        )
+        self.assertEqual(BenchmarkReseau.comparer(fichier, fichier), [])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,108 @@
+import math
+import os
+import random
+import shutil
+import tempfile
+import unittest
+
+from Class.ReseauUrbain import ReseauUrbain
+from Class.MoteurItineraire import MoteurItineraire
+from Class.HierarchieContraction import HierarchieContraction
+from Class.Benchmarks.GenerateurReseau import GenerateurReseau
+
+
+class HierarchieContractionTest(unittest.TestCase):
+    """
+    Tests unitaires de la classe HierarchieContraction.
+
+    Ces tests vérifient :
+    - l’exactitude des requêtes par rapport à Dijkstra
+    - le dépliage des raccourcis en stations réelles
+    - la sauvegarde et le rechargement de l’index
+    - le repli sur le moteur après une modification du réseau
+    """
+
+    def setUp(self):
+        self.reseau = GenerateurReseau(200, degre_moyen=3, graine=5).reseau()
+        self.hierarchie = HierarchieContraction(self.reseau).construire()
+        self.moteur = MoteurItineraire(self.reseau)
+
+    def cout_chemin(self, chemin, critere):
+        adjacence = self.reseau.adjacence(critere)
+        indices = [self.reseau.index_par_nom[nom] for nom in chemin]
+        return sum(adjacence[i][j] for i, j in zip(indices, indices[1:]))
+
+    def test_requetes_exactes(self):
+        """Vérifie coûts et chemins sur des paires aléatoires, pour les deux critères."""
+        aleatoire = random.Random(1)
+
+        for _ in range(100):
+            depart = aleatoire.choice(self.reseau.stations).nom
+            arrivee = aleatoire.choice(self.reseau.stations).nom
+            for critere in ["temps", "distance"]:
+                attendu = self.moteur.dijkstra(depart, arrivee, critere)[1]
+                chemin, cout = self.hierarchie.dijkstra(depart, arrivee, critere)
+
+                self.assertAlmostEqual(cout, attendu)
+                self.assertEqual(chemin[0], depart)
+                self.assertEqual(chemin[-1], arrivee)
+                # Le chemin déplié n’emprunte que des routes réelles
+                self.assertAlmostEqual(self.cout_chemin(chemin, critere), cout)
+
+    def test_inatteignable(self):
+        """Vérifie une requête vers une station isolée et une requête triviale."""
+        self.reseau.ajouter_station("Isolee")
+        hierarchie = HierarchieContraction(self.reseau).construire(("temps",))
+
+        self.assertEqual(hierarchie.chemin("S0", "Isolee"), (None, math.inf))
+        self.assertEqual(hierarchie.chemin("S3", "S3"), (["S3"], 0))
+
+        with self.assertRaises(ValueError):
+            hierarchie.chemin("S0", "S1", "distance")
+
+    def test_reseau_modifie(self):
+        """Vérifie qu’une route modifiée après la construction est prise en compte."""
+        chemin, _ = self.hierarchie.chemin("S1", "S150", "temps")
+        self.assertTrue(self.hierarchie.a_jour())
+
+        # Raccourci direct, puis fermeture d’une route du chemin initial
+        self.reseau.ajouter_route("S1", "S150", 0.1, 0.1)
+        self.assertFalse(self.hierarchie.a_jour())
+        self.assertEqual(self.hierarchie.dijkstra("S1", "S150", "temps"), (["S1", "S150"], 0.1))
+
+        self.reseau.fermer_route("S1", "S150")
+        self.reseau.fermer_route(chemin[0], chemin[1])
+        self.assertEqual(
+            self.hierarchie.chemin("S1", "S150", "temps"),
+            self.moteur.dijkstra("S1", "S150", "temps")
+        )
+
+        self.hierarchie.construire()
+        self.assertTrue(self.hierarchie.a_jour())
+        self.assertAlmostEqual(
+            self.hierarchie.chemin("S1", "S150", "temps")[1],
+            self.moteur.dijkstra("S1", "S150", "temps")[1]
+        )
+
+    def test_sauvegarde(self):
+        """Vérifie le rechargement de l’index et la détection d’un réseau modifié."""
+        dossier = tempfile.mkdtemp()
+        try:
+            fichier = os.path.join(dossier, "ch.pkl")
+            self.hierarchie.sauvegarder(fichier)
+
+            relue = HierarchieContraction.charger(self.reseau, fichier)
+            self.assertIsNotNone(relue)
+            self.assertEqual(
+                relue.chemin("S1", "S150", "temps"),
+                self.hierarchie.chemin("S1", "S150", "temps")
+            )
+
+            self.reseau.ajouter_route("S1", "S150", 0.1, 0.1)
+            self.assertIsNone(HierarchieContraction.charger(self.reseau, fichier))
+        finally:
+            shutil.rmtree(dossier)
+
+
+if __name__ == "__main__":
+    unittest.main()
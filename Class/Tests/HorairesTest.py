@@ -0,0 +1,74 @@
+import os
+import shutil
+import tempfile
+import unittest
+
+from Class.ReseauUrbain import ReseauUrbain
+from Class.Horaires import Horaires
+
+
+class HorairesTest(unittest.TestCase):
+    """
+    Tests unitaires de la classe Horaires.
+
+    Ces tests vérifient :
+    - le stockage des courses et le tri chronologique des connexions
+    - la validation des courses (stations inconnues, heures décroissantes)
+    - le chargement depuis le fichier horaires_xl.csv
+    """
+
+    def setUp(self):
+        self.reseau = ReseauUrbain("reseau_test")
+        for nom in ["A", "B", "C"]:
+            self.reseau.ajouter_station(nom)
+        self.horaires = Horaires(self.reseau)
+
+    def test_connexions_triees(self):
+        """Vérifie que les connexions sont triées par heure de départ."""
+        self.horaires.ajouter_course("2", "L1", [("A", 500, 500), ("B", 505, 506), ("C", 510, 510)])
+        self.horaires.ajouter_course("1", "L1", [("C", 480, 480), ("B", 484, 485), ("A", 489, 489)])
+
+        course, depart, arrivee, heure_depart, heure_arrivee = self.horaires.connexions()
+
+        self.assertEqual(list(heure_depart), [480, 485, 500, 506])
+        self.assertEqual(list(heure_arrivee), [484, 489, 505, 510])
+        self.assertEqual(list(course), [1, 1, 0, 0])
+        self.assertEqual(list(depart), [2, 1, 0, 1])
+        self.assertEqual(list(arrivee), [1, 0, 1, 2])
+        self.assertEqual(len(self.horaires), 2)
+
+    def test_course_invalide(self):
+        """Vérifie le refus des courses mal formées."""
+        with self.assertRaises(ValueError):
+            self.horaires.ajouter_course("1", "L1", [("A", 500, 500)])
+        with self.assertRaises(ValueError):
+            self.horaires.ajouter_course("1", "L1", [("A", 500, 500), ("Z", 505, 505)])
+        with self.assertRaises(ValueError):
+            self.horaires.ajouter_course("1", "L1", [("A", 500, 500), ("B", 495, 496)])
+        self.assertEqual(len(self.horaires), 0)
+
+    def test_depuis_csv(self):
+        """Vérifie le chargement du fichier horaires_xl.csv."""
+        dossier = tempfile.mkdtemp() + os.sep
+        try:
+            with open(dossier + "stations_xl.csv", "w", encoding="utf-8") as f:
+                f.write("id,nom\n0,A\n1,B\n2,C\n")
+            with open(dossier + "horaires_xl.csv", "w", encoding="utf-8") as f:
+                f.write("id_course,ligne,station,arrivee,depart\n")
+                f.write("K1,L1,0,,08:00\nK1,L1,1,08:05,08:06\nK1,L1,2,08:10,\n")
+                f.write("K2,L2,2,,08:30\nK2,L2,0,08:41,\n")
+
+            horaires = Horaires.depuis_csv(self.reseau, dossier, temps_correspondance=2)
+        finally:
+            shutil.rmtree(dossier)
+
+        self.assertEqual(horaires.ids_courses, ["K1", "K2"])
+        self.assertEqual(horaires.lignes, ["L1", "L2"])
+        self.assertEqual(list(horaires.offsets), [0, 3, 5])
+        self.assertEqual(list(horaires.heures_arrivee), [480, 485, 490, 510, 521])
+        self.assertEqual(list(horaires.heures_depart), [480, 486, 490, 510, 521])
+        self.assertEqual(horaires.temps_correspondance, 2)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,63 @@
+import unittest
+
+from Class.ReseauUrbain import ReseauUrbain
+from Class.IndexConnexite import IndexConnexite
+
+
+class IndexConnexiteTest(unittest.TestCase):
+    """
+    Tests unitaires de la classe IndexConnexite.
+
+    Ces tests vérifient :
+    - l’identification des composantes connexes
+    - les requêtes d’accessibilité entre stations
+    - la mise à jour de l’index après modification du réseau
+    """
+
+    def setUp(self):
+        """
+        Réseau de test composé de deux îlots :
+            A - B - C      D - E
+        """
+        self.reseau = ReseauUrbain("reseau_test")
+
+        for nom in ["A", "B", "C", "D", "E"]:
+            self.reseau.ajouter_station(nom)
+
+        self.reseau.ajouter_route("A", "B", 1, 1)
+        self.reseau.ajouter_route("B", "C", 1, 1)
+        self.reseau.ajouter_route("D", "E", 1, 1)
+
+        self.index = IndexConnexite(self.reseau)
+
+    def test_composantes(self):
+        """Vérifie le découpage du réseau en composantes."""
+        self.assertEqual(self.index.nb_composantes, 2)
+        self.assertEqual(
+            self.index.composantes(),
+            {0: ["A", "B", "C"], 1: ["D", "E"]}
+        )
+
+    def test_atteignable(self):
+        """Vérifie l’accessibilité entre stations."""
+        self.assertTrue(self.index.atteignable("A", "C"))
+        self.assertTrue(self.index.atteignable("E", "D"))
+        self.assertFalse(self.index.atteignable("A", "D"))
+
+    def test_station_inconnue(self):
+        """Vérifie qu’une station inconnue n’est jamais atteignable."""
+        self.assertIsNone(self.index.composante("Z"))
+        self.assertFalse(self.index.atteignable("A", "Z"))
+        self.assertFalse(self.index.atteignable("Z", "A"))
+
+    def test_mise_a_jour(self):
+        """Vérifie que l’index suit l’ajout d’une route entre les îlots."""
+        self.reseau.ajouter_route("C", "D", 1, 1)
+        self.index.mettre_a_jour()
+
+        self.assertEqual(self.index.nb_composantes, 1)
+        self.assertTrue(self.index.atteignable("A", "E"))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,74 @@
+import unittest
+
+from Class.ListeChainee import ListeChainee
+from Class.Noeud import Noeud
+from Class.TrajetObserve import TrajetObserve
+
+
+class ListeChaineeTest(unittest.TestCase):
+    """
+    Tests unitaires de la liste chaînée (tête, queue, longueur en cache).
+
+    Ces tests vérifient :
+    - l’ajout en fin sur place et la mise à jour de la longueur
+    - le parcours itératif (__iter__, parcourir)
+    - l’absence de limite de récursion sur les longues listes
+    """
+
+    def test_liste_vide(self):
+        """Vérifie une liste vide créée sans argument."""
+        liste = ListeChainee()
+
+        self.assertEqual(len(liste), 0)
+        self.assertEqual(liste.parcourir(), [])
+        self.assertEqual(liste.affichage(), "")
+
+    def test_ajout_sur_place(self):
+        """Vérifie que l’ajout en fin modifie la liste et sa longueur."""
+        liste = ListeChainee()
+        liste.ajoute_fin("Erasme")
+        liste.ajoute_fin("CHU Hopitaux")
+
+        self.assertEqual(liste.get_longueur(), 2)
+        self.assertEqual(list(liste), ["Erasme", "CHU Hopitaux"])
+        self.assertEqual(liste.queue.valeur, "CHU Hopitaux")
+
+    def test_set_tete(self):
+        """Vérifie que la queue et la longueur sont recalculées par set_tete."""
+        liste = ListeChainee()
+        liste.set_tete(Noeud("A", Noeud("B", Noeud.vide())))
+        liste.ajoute_fin("C")
+
+        self.assertEqual(liste.parcourir(), ["A", "B", "C"])
+        self.assertEqual(liste.get_longueur(), 3)
+
+    def test_nom_avec_point_virgule(self):
+        """Vérifie que parcourir ne dépend plus du séparateur ';'."""
+        liste = ListeChainee()
+        liste.ajoute_fin("Gare; Sud")
+        liste.ajoute_fin("Centre")
+
+        self.assertEqual(liste.parcourir(), ["Gare; Sud", "Centre"])
+
+    def test_valeur_zero(self):
+        """Vérifie qu’un élément de valeur 0 n’est pas confondu avec la fin de liste."""
+        liste = ListeChainee()
+        liste.ajoute_fin(0)
+        liste.ajoute_fin(1)
+
+        self.assertEqual(liste.parcourir(), [0, 1])
+
+    def test_longue_liste(self):
+        """Vérifie la conversion d’un très long trajet sans RecursionError."""
+        stations = [f"S{i}" for i in range(20000)]
+        liste = TrajetObserve(1, stations, 0, 0).Conv_Liste_Chainee()
+
+        self.assertEqual(liste.get_longueur(), 20000)
+        self.assertEqual(liste.tete.get_longueur(), 20000)
+        self.assertEqual(liste.parcourir(), stations)
+        self.assertEqual(liste.ListeToString(), ";".join(stations))
+        self.assertEqual(liste.affichage(), " ".join(stations))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,104 @@
+import math
+import unittest
+
+from Class.ReseauUrbain import ReseauUrbain
+from Class.AnalyseurTrajets import AnalyseurTrajets
+from Class.TrajetObserve import TrajetObserve
+from Class.MatricesNumpy import np
+
+
+@unittest.skipIf(np is None, "NumPy n'est pas installé")
+class MatricesNumpyTest(unittest.TestCase):
+    """
+    Tests unitaires du backend NumPy (classe MatricesNumpy).
+
+    Ces tests vérifient :
+    - la construction des matrices float64 (+inf pour une liaison absente)
+    - les masques de voisinage
+    - le calcul vectorisé du coût de trajets entiers
+    """
+
+    def setUp(self):
+        # A ---10/5---> B ---20/8---> C      D (isolée)
+        self.reseau = ReseauUrbain("reseau_test")
+
+        for nom in ["A", "B", "C", "D"]:
+            self.reseau.ajouter_station(nom)
+
+        self.reseau.ajouter_route("A", "B", 10, 5)
+        self.reseau.ajouter_route("B", "C", 20, 8)
+
+        self.matrices = self.reseau.matrices_numpy()
+
+    def test_construction(self):
+        """Vérifie le contenu et le type des matrices."""
+        self.assertEqual(self.matrices.temps.dtype, np.float64)
+        self.assertTrue(self.matrices.temps.flags["C_CONTIGUOUS"])
+        self.assertEqual(self.matrices.distances[0, 1], 10)
+        self.assertEqual(self.matrices.distances[1, 0], 10)
+        self.assertEqual(self.matrices.temps[1, 2], 8)
+        self.assertEqual(self.matrices.temps[0, 2], math.inf)
+
+    def test_cache_par_version(self):
+        """Vérifie que le backend est reconstruit après une modification."""
+        self.assertIs(self.reseau.matrices_numpy(), self.matrices)
+
+        self.reseau.ajouter_route("C", "D", 1, 1)
+
+        self.assertIsNot(self.reseau.matrices_numpy(), self.matrices)
+        self.assertEqual(self.reseau.matrices_numpy().temps[2, 3], 1)
+
+    def test_voisins(self):
+        """Vérifie le masque et la liste des voisins."""
+        self.assertEqual(self.matrices.masque_voisins(1).tolist(), [True, False, True, False])
+        self.assertEqual(self.matrices.voisins(3).tolist(), [])
+
+    def test_cout_trajets(self):
+        """Vérifie le coût vectorisé d’un lot de trajets."""
+        # Trajets : A-B-C, C-A, D
+        distances, temps, manquants = self.matrices.cout_trajets(
+            [0, 1, 2, 2, 0, 3], [3, 2, 1]
+        )
+
+        self.assertEqual(distances.tolist(), [30, 0, 0])
+        self.assertEqual(temps.tolist(), [13, 0, 0])
+        self.assertEqual(manquants.tolist(), [[1, 2, 0]])
+
+    def test_pour_affichage(self):
+        """Vérifie que les liaisons absentes deviennent NaN pour l’affichage."""
+        data = self.matrices.pour_affichage("temps")
+
+        self.assertTrue(math.isnan(data[0, 2]))
+        self.assertEqual(data[0, 1], 5)
+
+    def test_analyseur_vectorise(self):
+        """Vérifie que le calcul vectorisé de l’analyseur donne le même résultat."""
+        trajets = [
+            TrajetObserve("T1", ["A", "B", "C"], 0, 0),
+            TrajetObserve("T2", ["C", "A"], 0, 0),
+            TrajetObserve("T3", ["A", "Z"], 0, 0),
+        ]
+        analyseur = AnalyseurTrajets(self.reseau, trajets)
+
+        scalaire = analyseur.calcul_theorie_tous_trajets()
+        vectorise = analyseur.calcul_theorie_tous_trajets(vectorise=True)
+
+        self.assertEqual(
+            [(i, d.distance_theorique, d.temps_theorique, d.segments_inexistants) for i, d in scalaire],
+            [(i, d.distance_theorique, d.temps_theorique, d.segments_inexistants) for i, d in vectorise]
+        )
+
+    def test_analyseur_par_lots(self):
+        """Vérifie le calcul théorique lot par lot sur un flux de trajets."""
+        trajets = (TrajetObserve(f"T{k}", ["A", "B", "C"], 0, 0) for k in range(5))
+        analyseur = AnalyseurTrajets(self.reseau, trajets)
+
+        lots = list(analyseur.calcul_theorie_par_lots(taille_lot=2))
+
+        self.assertEqual([len(lot) for lot in lots], [2, 2, 1])
+        self.assertEqual(lots[2][0][0], "T4")
+        self.assertEqual(lots[2][0][1].temps_theorique, 13)
+
+
+if __name__ == "__main__":
+    unittest.main()
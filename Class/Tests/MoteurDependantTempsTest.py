@@ -0,0 +1,102 @@
+import math
+import random
+import unittest
+
+from Class.ReseauUrbain import ReseauUrbain
+from Class.ProfilsTemps import ProfilsTemps
+from Class.MoteurDependantTemps import MoteurDependantTemps
+from Class.MoteurItineraire import MoteurItineraire
+from Class.Benchmarks.GenerateurReseau import GenerateurReseau
+
+
+class MoteurDependantTempsTest(unittest.TestCase):
+    """
+    Tests unitaires de la classe MoteurDependantTemps.
+
+    Ces tests vérifient :
+    - l’itinéraire arrivant au plus tôt selon l’heure de départ
+    - l’équivalence avec Dijkstra lorsque aucun profil n’est défini
+    - le profil d’arrivée sur une plage de départs (une seule recherche)
+    """
+
+    def setUp(self):
+        """
+        Réseau de test : A - B - D (rapide hors pointe, bouché de 7:00 à 9:00)
+        et A - C - D (toujours 12 minutes).
+        """
+        self.reseau = ReseauUrbain("reseau_test")
+        for nom in ["A", "B", "C", "D", "E"]:
+            self.reseau.ajouter_station(nom)
+        self.reseau.ajouter_route("A", "B", 1.0, 4.0)
+        self.reseau.ajouter_route("B", "D", 1.0, 4.0)
+        self.reseau.ajouter_route("A", "C", 1.0, 6.0)
+        self.reseau.ajouter_route("C", "D", 1.0, 6.0)
+
+        self.profils = ProfilsTemps(self.reseau)
+        self.profils.definir_profil("A", "B", [(0, 4), (420, 4), (450, 20), (540, 20), (600, 4)])
+        self.moteur = MoteurDependantTemps(self.reseau, self.profils)
+
+    def test_arrivee_au_plus_tot(self):
+        """Vérifie que l’itinéraire dépend de l’heure de départ."""
+        self.assertEqual(self.moteur.arrivee_au_plus_tot("A", "D", 360), (["A", "B", "D"], 368))
+        self.assertEqual(self.moteur.arrivee_au_plus_tot("A", "D", 480), (["A", "C", "D"], 492))
+
+    def test_inatteignable(self):
+        """Vérifie le cas d’une station isolée ou inconnue."""
+        self.assertEqual(self.moteur.arrivee_au_plus_tot("A", "E", 0), (None, math.inf))
+        with self.assertRaises(ValueError):
+            self.moteur.arrivee_au_plus_tot("A", "Z", 0)
+
+    def test_sans_profils(self):
+        """Vérifie l’équivalence avec Dijkstra lorsque les temps sont fixes."""
+        reseau = GenerateurReseau(200, degre_moyen=3, graine=2).reseau()
+        moteur = MoteurDependantTemps(reseau, ProfilsTemps(reseau))
+        dijkstra = MoteurItineraire(reseau)
+        aleatoire = random.Random(1)
+
+        for _ in range(20):
+            depart = aleatoire.choice(reseau.stations).nom
+            arrivee = aleatoire.choice(reseau.stations).nom
+            _, cout = dijkstra.dijkstra(depart, arrivee, "temps")
+            _, heure = moteur.arrivee_au_plus_tot(depart, arrivee, 100)
+            self.assertAlmostEqual(heure - 100, cout)
+
+    def test_profil_arrivee(self):
+        """Vérifie que le profil d’arrivée coïncide avec des requêtes individuelles."""
+        profil = self.moteur.profil_arrivee("A", "D", 360, 660, pas=15)
+
+        self.assertEqual(len(profil), 21)
+        for heure_depart, heure_arrivee in profil:
+            self.assertAlmostEqual(
+                heure_arrivee,
+                self.moteur.arrivee_au_plus_tot("A", "D", heure_depart)[1]
+            )
+        self.assertEqual(self.moteur.profil_arrivee("A", "E", 0, 10), [(0, math.inf), (5, math.inf), (10, math.inf)])
+
+    def test_profil_arrivee_reseau_aleatoire(self):
+        """Compare la recherche vectorielle aux requêtes individuelles sur un réseau aléatoire."""
+        reseau = GenerateurReseau(80, degre_moyen=3, graine=5).reseau()
+        profils = ProfilsTemps(reseau)
+        aleatoire = random.Random(2)
+        for i, j, _, temps in reseau.aretes():
+            if aleatoire.random() < 0.5:
+                pointe = temps * aleatoire.uniform(1.5, 3)
+                profils.definir_profil(
+                    reseau.stations[i].nom, reseau.stations[j].nom,
+                    [(0, temps), (400, temps), (480, pointe), (600, temps)],
+                    aleatoire.choice(ProfilsTemps.MODES)
+                )
+        moteur = MoteurDependantTemps(reseau, profils)
+
+        for _ in range(5):
+            depart = aleatoire.choice(reseau.stations).nom
+            arrivee = aleatoire.choice(reseau.stations).nom
+            for heure_depart, heure_arrivee in moteur.profil_arrivee(depart, arrivee, 380, 620, pas=20):
+                self.assertAlmostEqual(
+                    heure_arrivee,
+                    moteur.arrivee_au_plus_tot(depart, arrivee, heure_depart)[1]
+                )
+
+
+if __name__ == "__main__":
+    unittest.main()
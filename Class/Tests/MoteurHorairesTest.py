@@ -0,0 +1,144 @@
+import math
+import random
+import unittest
+
+from Class.ReseauUrbain import ReseauUrbain
+from Class.Horaires import Horaires
+from Class.MoteurHoraires import MoteurHoraires
+from Class.Benchmarks.GenerateurReseau import GenerateurReseau
+
+
+class MoteurHorairesTest(unittest.TestCase):
+    """
+    Tests unitaires de la classe MoteurHoraires (Connection Scan Algorithm).
+
+    Ces tests vérifient :
+    - l’arrivée au plus tôt et les étapes retournées
+    - le temps de correspondance
+    - le compromis nombre de correspondances / heure d’arrivée
+    - l’exactitude sur un tableau horaire aléatoire
+    """
+
+    def setUp(self):
+        """
+        Ligne directe lente A -> D (départ 8:00, arrivée 9:00) et
+        deux lignes rapides A -> B (8:00 -> 8:10) puis B -> D (8:15 -> 8:25).
+        """
+        self.reseau = ReseauUrbain("reseau_test")
+        for nom in ["A", "B", "C", "D", "E"]:
+            self.reseau.ajouter_station(nom)
+
+        self.horaires = Horaires(self.reseau, temps_correspondance=3)
+        self.horaires.ajouter_course("D1", "Directe", [("A", 480, 480), ("C", 520, 521), ("D", 540, 540)])
+        self.horaires.ajouter_course("R1", "Rapide1", [("A", 480, 480), ("B", 490, 490)])
+        self.horaires.ajouter_course("R2", "Rapide2", [("B", 495, 495), ("D", 505, 505)])
+        self.horaires.ajouter_course("R3", "Rapide2", [("B", 492, 492), ("D", 502, 502)])
+        self.moteur = MoteurHoraires(self.horaires)
+
+    def test_arrivee_au_plus_tot(self):
+        """Vérifie l’itinéraire avec correspondance (la course de 8:12 est trop juste)."""
+        etapes, heure = self.moteur.arrivee_au_plus_tot("A", "D", 470)
+
+        self.assertEqual(heure, 505)
+        self.assertEqual(etapes, [
+            ("Rapide1", "R1", "A", 480, "B", 490),
+            ("Rapide2", "R2", "B", 495, "D", 505),
+        ])
+
+    def test_trop_tard(self):
+        """Vérifie le cas où plus aucune course ne convient."""
+        self.assertEqual(self.moteur.arrivee_au_plus_tot("A", "D", 481), (None, math.inf))
+        self.assertEqual(self.moteur.arrivee_au_plus_tot("A", "E", 0), (None, math.inf))
+        self.assertEqual(self.moteur.arrivee_au_plus_tot("A", "A", 600), ([], 600))
+        with self.assertRaises(ValueError):
+            self.moteur.arrivee_au_plus_tot("A", "Z", 0)
+
+    def test_moins_de_correspondances(self):
+        """Vérifie le compromis : trajet direct, puis trajet plus rapide avec une correspondance."""
+        resultats = self.moteur.moins_de_correspondances("A", "D", 470)
+
+        self.assertEqual([(nb, heure) for nb, heure, _ in resultats], [(0, 540), (1, 505)])
+        self.assertEqual(resultats[0][2], [("Directe", "D1", "A", 480, "D", 540)])
+        self.assertEqual(self.moteur.moins_de_correspondances("A", "E", 0), [])
+
+    def arrivees_reference(self, horaires, depart_i, heure):
+        """
+        Arrivées au plus tôt par point fixe sur les courses (lent mais évident).
+        """
+        n = len(horaires.reseau.stations)
+        meilleures = [math.inf] * n
+        meilleures[depart_i] = heure
+        modifie = True
+        while modifie:
+            modifie = False
+            for k in range(len(horaires)):
+                a_bord = False
+                for position in range(horaires.offsets[k], horaires.offsets[k + 1]):
+                    station = horaires.arrets[position]
+                    if a_bord and horaires.heures_arrivee[position] < meilleures[station]:
+                        meilleures[station] = horaires.heures_arrivee[position]
+                        modifie = True
+                    pret = meilleures[station] + (0 if station == depart_i else horaires.temps_correspondance)
+                    if pret <= horaires.heures_depart[position]:
+                        a_bord = True
+        return meilleures
+
+    def test_connexions_instantanees(self):
+        """Vérifie l’enchaînement de connexions de durée nulle à la même heure (ajoutées dans le désordre)."""
+        reseau = ReseauUrbain("instantane")
+        for nom in ["S4", "S5", "S6"]:
+            reseau.ajouter_station(nom)
+        horaires = Horaires(reseau, temps_correspondance=0)
+        horaires.ajouter_course("C4", "L4", [("S6", 840, 840), ("S4", 840, 840)])
+        horaires.ajouter_course("C5", "L5", [("S5", 840, 840), ("S6", 840, 840)])
+        horaires.ajouter_course("C9", "L9", [("S5", 850, 850), ("S4", 900, 900)])
+        moteur = MoteurHoraires(horaires)
+
+        etapes, heure = moteur.arrivee_au_plus_tot("S5", "S4", 7)
+        self.assertEqual(heure, 840)
+        self.assertEqual([etape[1] for etape in etapes], ["C5", "C4"])
+        self.assertEqual(moteur.moins_de_correspondances("S5", "S4", 7)[-1][1], heure)
+
+    def test_tableau_aleatoire(self):
+        """Compare CSA et les tours de correspondances au point fixe de référence."""
+        generateur = GenerateurReseau(60, degre_moyen=3, graine=4)
+        reseau = generateur.reseau()
+        horaires = Horaires(reseau, temps_correspondance=2)
+        courses = {}
+        for id_course, ligne, station_id, arrivee, depart in generateur.horaires(6, longueur=8, debut=360, fin=600, intervalle=20):
+            courses.setdefault((id_course, ligne), []).append((generateur.noms[int(station_id)], arrivee, depart))
+        for (id_course, ligne), passages in courses.items():
+            horaires.ajouter_course(id_course, ligne, passages)
+
+        moteur = MoteurHoraires(horaires)
+        desservies = sorted({reseau.stations[i].nom for i in horaires.arrets})
+        aleatoire = random.Random(3)
+
+        for _ in range(15):
+            depart = aleatoire.choice(desservies)
+            heure = aleatoire.uniform(350, 550)
+            reference = self.arrivees_reference(horaires, reseau.index_par_nom[depart], heure)
+
+            for arrivee in desservies:
+                etapes, arrivee_csa = moteur.arrivee_au_plus_tot(depart, arrivee, heure)
+                self.assertEqual(arrivee_csa, reference[reseau.index_par_nom[arrivee]])
+
+                if etapes:
+                    # Étapes enchaînées dans le temps et dans l’espace
+                    self.assertEqual(etapes[0][2], depart)
+                    self.assertEqual(etapes[-1][4], arrivee)
+                    for precedente, suivante in zip(etapes, etapes[1:]):
+                        self.assertEqual(precedente[4], suivante[2])
+                        self.assertLessEqual(precedente[5] + 2, suivante[3])
+
+                if depart == arrivee:
+                    continue
+                resultats = moteur.moins_de_correspondances(depart, arrivee, heure, max_courses=10)
+                self.assertEqual(resultats[-1][1] if resultats else math.inf, arrivee_csa)
+                for nb, _, etapes_tour in resultats:
+                    self.assertEqual(nb, len(etapes_tour) - 1)
+                self.assertEqual([r[0] for r in resultats], sorted({r[0] for r in resultats}))
+
+
+if __name__ == "__main__":
+    unittest.main()
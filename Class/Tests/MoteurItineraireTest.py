@@ -0,0 +1,153 @@
+import math
+import random
+import unittest
+
+from Class.ReseauUrbain import ReseauUrbain
+from Class.MoteurItineraire import MoteurItineraire
+from Class.Benchmarks.GenerateurReseau import GenerateurReseau
+
+
+class MoteurItineraireTest(unittest.TestCase):
+    """
+    Tests unitaires de la classe MoteurItineraire.
+
+    Ces tests vérifient :
+    - le calcul du plus court chemin en temps et en distance
+    - la compatibilité avec une matrice dense en entrée
+    - les cas d’erreur (station inconnue, arrivée inatteignable)
+    - les recherches point à point (Dijkstra bidirectionnel, A*)
+    """
+
+    def setUp(self):
+        """
+        Réseau de test :
+
+            A --1/10-- B --1/10-- C
+             \\                  /
+              ------5/1---------
+
+        (distance / temps) : le chemin le plus court en distance passe par B,
+        le plus rapide est la liaison directe A - C.
+        """
+        self.reseau = ReseauUrbain("reseau_test")
+
+        for nom in ["A", "B", "C", "D"]:
+            self.reseau.ajouter_station(nom)
+
+        self.reseau.ajouter_route("A", "B", 1, 10)
+        self.reseau.ajouter_route("B", "C", 1, 10)
+        self.reseau.ajouter_route("A", "C", 5, 1)
+
+        self.moteur = MoteurItineraire(self.reseau)
+
+    def test_chemin_temps(self):
+        """Vérifie le plus court chemin selon le temps."""
+        chemin, cout = self.moteur.dijkstra("A", "C", "temps")
+
+        self.assertEqual(chemin, ["A", "C"])
+        self.assertEqual(cout, 1)
+
+    def test_chemin_distance(self):
+        """Vérifie le plus court chemin selon la distance."""
+        chemin, cout = self.moteur.dijkstra("A", "C", "distance")
+
+        self.assertEqual(chemin, ["A", "B", "C"])
+        self.assertEqual(cout, 2)
+
+    def test_matrice_dense(self):
+        """Vérifie qu’une matrice dense (-1 = absence de liaison) est acceptée."""
+        chemin, cout = self.moteur.dijkstra("A", "C", self.reseau.matrice_distances)
+
+        self.assertEqual(chemin, ["A", "B", "C"])
+        self.assertEqual(cout, 2)
+
+    def test_depart_egal_arrivee(self):
+        """Vérifie le cas d’un trajet de longueur nulle."""
+        chemin, cout = self.moteur.dijkstra("B", "B")
+
+        self.assertEqual(chemin, ["B"])
+        self.assertEqual(cout, 0)
+
+    def test_arrivee_inatteignable(self):
+        """Vérifie le cas d’une station isolée."""
+        chemin, cout = self.moteur.dijkstra("A", "D")
+
+        self.assertIsNone(chemin)
+        self.assertEqual(cout, math.inf)
+
+    def test_station_inconnue(self):
+        """Vérifie qu’une erreur est levée pour une station inconnue."""
+        with self.assertRaises(ValueError):
+            self.moteur.dijkstra("A", "Z")
+
+    # ======================================================
+    # TESTS DU DIJKSTRA BIDIRECTIONNEL ET DE A*
+    # ======================================================
+
+    def test_bidirectionnel_identique(self):
+        """Vérifie que le Dijkstra bidirectionnel trouve les mêmes coûts que Dijkstra."""
+        reseau = GenerateurReseau(300, degre_moyen=3, graine=4).reseau()
+        moteur = MoteurItineraire(reseau)
+        aleatoire = random.Random(0)
+
+        for _ in range(50):
+            depart = aleatoire.choice(reseau.stations).nom
+            arrivee = aleatoire.choice(reseau.stations).nom
+            for critere in ["temps", "distance"]:
+                attendu = moteur.dijkstra(depart, arrivee, critere)[1]
+                chemin, cout = moteur.dijkstra_bidirectionnel(depart, arrivee, critere)
+
+                self.assertAlmostEqual(cout, attendu)
+                self.assertEqual(chemin[0], depart)
+                self.assertEqual(chemin[-1], arrivee)
+
+    def test_bidirectionnel_inatteignable(self):
+        """Vérifie le Dijkstra bidirectionnel vers une station isolée."""
+        self.assertEqual(self.moteur.dijkstra_bidirectionnel("A", "D"), (None, math.inf))
+        self.assertEqual(self.moteur.dijkstra_bidirectionnel("A", "C", "distance"), (["A", "B", "C"], 2))
+
+    def reseau_ligne(self, n):
+        """
+        Réseau en ligne le long de l’équateur : chaque route est 10 % plus longue
+        que la distance à vol d’oiseau entre ses extrémités (heuristique admissible).
+        """
+        reseau = ReseauUrbain("ligne")
+        for i in range(n):
+            reseau.ajouter_station(f"S{i}", 0.0, 0.01 * i)
+        for i in range(n - 1):
+            a = reseau.stations[i]
+            b = reseau.stations[i + 1]
+            distance = a.distance_vol_oiseau(b) * 1.1
+            reseau.ajouter_route(a.nom, b.nom, distance, distance * 2)
+        return reseau
+
+    def test_a_etoile(self):
+        """Vérifie que A* donne le même résultat que Dijkstra en fixant moins de sommets."""
+        reseau = self.reseau_ligne(200)
+        moteur = MoteurItineraire(reseau)
+
+        for critere in ["temps", "distance"]:
+            chemin_attendu, cout_attendu = moteur.dijkstra("S100", "S190", critere)
+            fixes_dijkstra = moteur.noeuds_fixes
+
+            chemin, cout = moteur.a_etoile("S100", "S190", critere)
+
+            self.assertEqual(chemin, chemin_attendu)
+            self.assertAlmostEqual(cout, cout_attendu)
+            self.assertLess(moteur.noeuds_fixes, fixes_dijkstra)
+
+    def test_plus_court_chemin(self):
+        """Vérifie le choix entre A* (coordonnées) et Dijkstra bidirectionnel."""
+        # Sans coordonnées : repli sur le Dijkstra bidirectionnel
+        self.assertEqual(self.moteur.plus_court_chemin("A", "C", "temps"), (["A", "C"], 1))
+
+        with self.assertRaises(ValueError):
+            self.moteur.a_etoile("A", "C")
+
+        reseau = self.reseau_ligne(5)
+        chemin, _ = MoteurItineraire(reseau).plus_court_chemin("S0", "S4", "distance")
+        self.assertEqual(chemin, ["S0", "S1", "S2", "S3", "S4"])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,30 @@
+import unittest
+
+from Class.Noeud import Noeud
+
+
+class NoeudTest(unittest.TestCase):
+    """
+    Tests unitaires des parcours itératifs de la classe Noeud.
+    """
+
+    def test_ajoute_fin_non_destructif(self):
+        """Vérifie que Noeud.ajoute_fin renvoie une nouvelle liste sans modifier l’originale."""
+        noeud = Noeud("A", Noeud.vide())
+        nouveau = noeud.ajoute_fin("B")
+
+        self.assertEqual(list(noeud), ["A"])
+        self.assertEqual(list(nouveau), ["A", "B"])
+
+    def test_longue_chaine(self):
+        """Vérifie les parcours d’une longue chaîne sans RecursionError."""
+        tete = Noeud.vide()
+        for i in range(20000):
+            tete = Noeud(i, tete)
+
+        self.assertEqual(tete.get_longueur(), 20000)
+        self.assertEqual(tete.ListeToString().count(";"), 19999)
+
+
+if __name__ == '__main__':
+    unittest.main()
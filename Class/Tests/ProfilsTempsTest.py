@@ -0,0 +1,101 @@
+import os
+import shutil
+import tempfile
+import unittest
+
+from Class.ReseauUrbain import ReseauUrbain
+from Class.ProfilsTemps import ProfilsTemps
+
+
+class ProfilsTempsTest(unittest.TestCase):
+    """
+    Tests unitaires de la classe ProfilsTemps.
+
+    Ces tests vérifient :
+    - l’évaluation des profils linéaires et en paliers (y compris autour de minuit)
+    - le respect de la propriété FIFO
+    - la lecture des profils depuis le fichier CSV des routes
+    """
+
+    def setUp(self):
+        self.reseau = ReseauUrbain("reseau_test")
+        for nom in ["A", "B", "C"]:
+            self.reseau.ajouter_station(nom)
+        self.reseau.ajouter_route("A", "B", 1.0, 4.0)
+        self.reseau.ajouter_route("B", "C", 1.0, 5.0)
+
+        self.profils = ProfilsTemps(self.reseau)
+
+    def test_sans_profil(self):
+        """Vérifie qu’une route sans profil garde son temps fixe."""
+        self.assertEqual(self.profils.temps_parcours("A", "B", 480), 4.0)
+        self.assertEqual(len(self.profils), 0)
+
+    def test_profil_lineaire(self):
+        """Vérifie l’interpolation linéaire et le raccord entre deux journées."""
+        self.profils.definir_profil("A", "B", [(420, 4), (480, 10), (600, 4)])
+
+        self.assertAlmostEqual(self.profils.temps_parcours("A", "B", 450), 7.0)
+        self.assertAlmostEqual(self.profils.temps_parcours("B", "A", 540), 7.0)
+        self.assertAlmostEqual(self.profils.temps_parcours("A", "B", 1440 + 480), 10.0)
+        # Entre le dernier point (10:00) et le premier du lendemain (7:00) : constant
+        self.assertAlmostEqual(self.profils.temps_parcours("A", "B", 100), 4.0)
+
+    def test_profil_non_fifo(self):
+        """Vérifie le refus d’un profil où partir plus tard fait arriver plus tôt."""
+        with self.assertRaises(ValueError):
+            self.profils.definir_profil("A", "B", [(420, 20), (425, 4)])
+        with self.assertRaises(ValueError):
+            self.profils.definir_profil("A", "B", [(480, 4), (420, 5)])
+        with self.assertRaises(ValueError):
+            self.profils.definir_profil("A", "C", [(0, 4)])
+
+    def test_profil_paliers(self):
+        """Vérifie les paliers et l’attente d’un palier plus rapide (FIFO)."""
+        self.profils.definir_profil("B", "C", [(0, 5), (420, 20), (600, 5)], "paliers")
+
+        self.assertEqual(self.profils.temps_parcours("B", "C", 300), 5.0)
+        self.assertEqual(self.profils.temps_parcours("B", "C", 450), 20.0)
+        # À 9:55, attendre 10:00 fait arriver à 10:05 au lieu de 10:15
+        self.assertEqual(self.profils.temps_parcours("B", "C", 595), 10.0)
+
+        # L’heure d’arrivée ne décroît jamais avec l’heure de départ
+        arrivees = [self.profils.arrivee(1, 2, h) for h in range(0, 2 * 1440, 7)]
+        self.assertEqual(arrivees, sorted(arrivees))
+
+    def test_lire_profil(self):
+        """Vérifie la lecture du format texte des profils."""
+        self.assertEqual(
+            ProfilsTemps.lire_profil("0=4;7:30=9;570=5"),
+            ("lineaire", [(0.0, 4.0), (450.0, 9.0), (570.0, 5.0)])
+        )
+        self.assertEqual(
+            ProfilsTemps.lire_profil("paliers:0=4;7:00=6"),
+            ("paliers", [(0.0, 4.0), (420.0, 6.0)])
+        )
+        with self.assertRaises(ValueError):
+            ProfilsTemps.lire_profil("0=4;7:30")
+
+    def test_depuis_csv(self):
+        """Vérifie le chargement des profils depuis la colonne profil_temps."""
+        dossier = tempfile.mkdtemp() + os.sep
+        try:
+            with open(dossier + "stations_xl.csv", "w", encoding="utf-8") as f:
+                f.write("id,nom\n0,A\n1,B\n2,C\n")
+            with open(dossier + "routes_xl.csv", "w", encoding="utf-8") as f:
+                f.write("from,to,distance_km,temps_min,profil_temps\n")
+                f.write("0,1,1.0,4,0=4;8:00=10\n1,2,1.0,5,\n")
+
+            reseau = ReseauUrbain("csv")
+            reseau.charger_depuis_csv(dossier)
+            profils = ProfilsTemps.depuis_csv(reseau, dossier)
+        finally:
+            shutil.rmtree(dossier)
+
+        self.assertEqual(len(profils), 1)
+        self.assertAlmostEqual(profils.temps_parcours("A", "B", 240), 7.0)
+        self.assertEqual(profils.temps_parcours("B", "C", 240), 5.0)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,143 @@
+import os
+import shutil
+import tempfile
+import types
+import unittest
+
+from csv_files.ReadCSV import (
+    iter_csv_stations,
+    iter_csv_roads,
+    iter_csv_trajets,
+    iter_csv_horaires,
+    iter_chunks,
+    load_csv_trajets,
+    suivre_csv_trajets,
+)
+
+
+class ReadCSVTest(unittest.TestCase):
+    """
+    Tests unitaires des fonctions de lecture CSV.
+
+    Ces tests vérifient :
+    - la lecture en flux (générateurs) des stations, routes et trajets
+    - la gestion des mesures absentes
+    - le découpage en lots
+    - le suivi du fichier des trajets au fil de son écriture
+    - les erreurs du tableau horaire citant la ligne fautive
+    """
+
+    def setUp(self):
+        self.dossier = tempfile.mkdtemp() + os.sep
+
+        with open(self.dossier + "stations_xl.csv", "w", encoding="utf-8") as f:
+            f.write("id,nom\n0, Gare \n\n1,Centre\n")
+        with open(self.dossier + "routes_xl.csv", "w", encoding="utf-8") as f:
+            f.write("from,to,distance_km,temps_min\n0 , 1,1.5,4\n")
+        with open(self.dossier + "trajets_xl.csv", "w", encoding="utf-8") as f:
+            f.write("id_trajet,stations,temps_mesure,distance_mesuree\n")
+            f.write("1,Gare; Centre,20,\n")
+            f.write("2,Centre;Gare,12,1.5\n")
+
+    def tearDown(self):
+        shutil.rmtree(self.dossier)
+
+    def test_generateurs(self):
+        """Vérifie que les lecteurs en flux sont des générateurs paresseux."""
+        self.assertIsInstance(iter_csv_stations(self.dossier), types.GeneratorType)
+        self.assertIsInstance(iter_csv_roads(self.dossier), types.GeneratorType)
+        self.assertIsInstance(iter_csv_trajets(self.dossier), types.GeneratorType)
+
+    def test_lecture_stations_routes(self):
+        """Vérifie le nettoyage des valeurs et le saut des lignes vides."""
+        self.assertEqual(list(iter_csv_stations(self.dossier)), [(0, "Gare"), (1, "Centre")])
+        self.assertEqual(list(iter_csv_roads(self.dossier)), [("0", "1", 1.5, 4.0)])
+
+    def test_profils(self):
+        """Vérifie la lecture de la colonne optionnelle des profils horaires."""
+        self.assertEqual(
+            list(iter_csv_roads(self.dossier, avec_profils=True)),
+            [("0", "1", 1.5, 4.0, None)]
+        )
+
+        with open(self.dossier + "routes_xl.csv", "w", encoding="utf-8") as f:
+            f.write("from,to,distance_km,temps_min,profil_temps\n")
+            f.write("0,1,1.5,4, 0=4;8:00=9 \n1,2,1.0,3,\n")
+
+        self.assertEqual(
+            list(iter_csv_roads(self.dossier, avec_profils=True)),
+            [("0", "1", 1.5, 4.0, "0=4;8:00=9"), ("1", "2", 1.0, 3.0, None)]
+        )
+
+    def test_coordonnees(self):
+        """Vérifie la lecture des colonnes optionnelles de coordonnées."""
+        self.assertEqual(
+            list(iter_csv_stations(self.dossier, avec_coordonnees=True)),
+            [(0, "Gare", None, None), (1, "Centre", None, None)]
+        )
+
+        with open(self.dossier + "stations_xl.csv", "w", encoding="utf-8") as f:
+            f.write("id,nom,latitude,longitude\n0,Gare,48.8,2.3\n1,Centre,,\n")
+
+        self.assertEqual(
+            list(iter_csv_stations(self.dossier, avec_coordonnees=True)),
+            [(0, "Gare", 48.8, 2.3), (1, "Centre", None, None)]
+        )
+        self.assertEqual(list(iter_csv_stations(self.dossier)), [(0, "Gare"), (1, "Centre")])
+
+    def test_mesure_absente(self):
+        """Vérifie qu’une mesure vide est lue comme None."""
+        self.assertEqual(
+            load_csv_trajets(self.dossier),
+            [
+                ("1", ["Gare", "Centre"], 20.0, None),
+                ("2", ["Centre", "Gare"], 12.0, 1.5),
+            ]
+        )
+
+    def test_horaires_invalides(self):
+        """Vérifie la lecture des horaires et les erreurs citant le fichier et la ligne."""
+        entete = "id_course,ligne,station_id,arrivee,depart\nC1,L1,0,08:00,08:01\n"
+        with open(self.dossier + "horaires_xl.csv", "w", encoding="utf-8") as f:
+            f.write(entete + "C1,L1,1,8:10,\n")
+        self.assertEqual(
+            list(iter_csv_horaires(self.dossier, avec_numeros=True)),
+            [(2, "C1", "L1", "0", 480.0, 481.0), (3, "C1", "L1", "1", 490.0, 490.0)]
+        )
+
+        # Ligne tronquée, heure illisible, aucune heure
+        for ligne_fautive in ("C1,L1,1\n", "C1,L1,1,8h10,\n", "C1,L1,1,,\n"):
+            with open(self.dossier + "horaires_xl.csv", "w", encoding="utf-8") as f:
+                f.write(entete + ligne_fautive)
+            with self.assertRaisesRegex(ValueError, r"horaires_xl\.csv, ligne 3 : ligne invalide"):
+                list(iter_csv_horaires(self.dossier))
+
+    def test_lots(self):
+        """Vérifie le découpage d’un flux en lots de taille fixe."""
+        self.assertEqual(list(iter_chunks(range(5), 2)), [[0, 1], [2, 3], [4]])
+        self.assertEqual(list(iter_chunks([], 2)), [])
+
+        with self.assertRaises(ValueError):
+            list(iter_chunks(range(5), 0))
+
+    def test_suivi_trajets(self):
+        """Vérifie que les lignes ajoutées sont lues, et une ligne incomplète seulement une fois terminée."""
+        ajouts = [
+            "3,Gare;Centre,9,1.5\n4,Centre;",      # la ligne 4 est en cours d’écriture
+            "Gare,11,1.5\n",
+        ]
+
+        def arret():
+            # Appelée en fin de fichier : écrit la suite, puis arrête le suivi
+            if not ajouts:
+                return True
+            with open(self.dossier + "trajets_xl.csv", "a", encoding="utf-8") as f:
+                f.write(ajouts.pop(0))
+            return False
+
+        ids = [trajet[0] for trajet in suivre_csv_trajets(self.dossier, intervalle=0, arret=arret)]
+        self.assertEqual(ids, ["1", "2", "3", "4"])
+
+
+if __name__ == "__main__":
+    unittest.main()
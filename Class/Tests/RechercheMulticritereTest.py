@@ -0,0 +1,89 @@
+import math
+import random
+import unittest
+
+from Class.ReseauUrbain import ReseauUrbain
+from Class.MoteurItineraire import MoteurItineraire
+from Class.RechercheMulticritere import RechercheMulticritere
+from Class.Benchmarks.GenerateurReseau import GenerateurReseau
+
+
+class RechercheMulticritereTest(unittest.TestCase):
+    """
+    Tests unitaires de la classe RechercheMulticritere.
+
+    Ces tests vérifient :
+    - le calcul du front de Pareto (temps, distance)
+    - la cohérence des extrémités du front avec Dijkstra
+    - le cache des fronts et son invalidation
+    """
+
+    def setUp(self):
+        """
+        Trois chemins de A à D (distance / temps) :
+        - A - B - D : 2 km, 20 min (le plus court)
+        - A - C - D : 10 km, 4 min (le plus rapide)
+        - A - E - D : 12 km, 22 min (dominé)
+        """
+        self.reseau = ReseauUrbain("reseau_test")
+        for nom in ["A", "B", "C", "D", "E", "F"]:
+            self.reseau.ajouter_station(nom)
+
+        self.reseau.ajouter_route("A", "B", 1, 10)
+        self.reseau.ajouter_route("B", "D", 1, 10)
+        self.reseau.ajouter_route("A", "C", 5, 2)
+        self.reseau.ajouter_route("C", "D", 5, 2)
+        self.reseau.ajouter_route("A", "E", 6, 11)
+        self.reseau.ajouter_route("E", "D", 6, 11)
+
+        self.recherche = RechercheMulticritere(self.reseau)
+
+    def test_front_pareto(self):
+        """Vérifie que le front contient exactement les chemins non dominés."""
+        front = self.recherche.front_pareto("A", "D")
+
+        self.assertEqual(front, [(["A", "C", "D"], 4, 10), (["A", "B", "D"], 20, 2)])
+
+    def test_contrat_dijkstra(self):
+        """Vérifie l’extraction du meilleur chemin pour un critère."""
+        self.assertEqual(self.recherche.dijkstra("A", "D", "temps"), (["A", "C", "D"], 4))
+        self.assertEqual(self.recherche.dijkstra("A", "D", "distance"), (["A", "B", "D"], 2))
+        self.assertEqual(self.recherche.dijkstra("A", "F"), (None, math.inf))
+
+    def test_extremites_reseau_aleatoire(self):
+        """Vérifie que les extrémités du front coïncident avec Dijkstra sur chaque critère."""
+        reseau = GenerateurReseau(150, degre_moyen=3, graine=6).reseau()
+        recherche = RechercheMulticritere(reseau, max_etiquettes=1000)
+        moteur = MoteurItineraire(reseau)
+        aleatoire = random.Random(2)
+
+        for _ in range(20):
+            depart = aleatoire.choice(reseau.stations).nom
+            arrivee = aleatoire.choice(reseau.stations).nom
+            front = recherche.front_pareto(depart, arrivee)
+
+            self.assertAlmostEqual(front[0][1], moteur.dijkstra(depart, arrivee, "temps")[1])
+            self.assertAlmostEqual(front[-1][2], moteur.dijkstra(depart, arrivee, "distance")[1])
+
+            # Aucune solution du front n’en domine une autre
+            for i, (_, t1, d1) in enumerate(front):
+                for _, t2, d2 in front[i + 1:]:
+                    self.assertTrue(t1 < t2 and d1 > d2)
+
+    def test_cache(self):
+        """Vérifie que le front est mis en cache puis invalidé après modification du réseau."""
+        premier = self.recherche.front_pareto("A", "D")
+        self.assertIs(self.recherche.front_pareto("A", "D"), premier)
+
+        self.reseau.ajouter_route("A", "D", 1, 1)
+
+        self.assertEqual(self.recherche.front_pareto("A", "D"), [(["A", "D"], 1, 1)])
+
+    def test_station_inconnue(self):
+        """Vérifie qu’une erreur est levée pour une station inconnue."""
+        with self.assertRaises(ValueError):
+            self.recherche.front_pareto("A", "Z")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -1,3 +1,6 @@
+import os
+import shutil
+import tempfile
 import unittest
 from Class.ReseauUrbain import ReseauUrbain
 
@@ -11,6 +14,7 @@ class TestReseauUrbain(unittest.TestCase):
     - l’ajout de stations et de routes
     - la cohérence des matrices d’adjacence
     - la gestion des erreurs
+    - l’instantané binaire (sauvegarde, relecture, détection d’un instantané périmé)
     """
 
     # INITIALISATION COMMUNE
@@ -96,6 +100,195 @@ class TestReseauUrbain(unittest.TestCase):
         with self.assertRaises(ValueError):
             self.reseau.voisins("X")
 
+    # TESTS DU STOCKAGE CREUX
+    def test_adjacence_creuse(self):
+        """Vérifie que seules les routes existantes sont stockées."""
+        self.reseau.ajouter_station("A")
+        self.reseau.ajouter_station("B")
+        self.reseau.ajouter_station("C")
+
+        self.reseau.ajouter_route("A", "B", 10, 5)
+
+        self.assertEqual(self.reseau.adjacence_distances, [{1: 10}, {0: 10}, {}])
+        self.assertEqual(self.reseau.adjacence_temps, [{1: 5}, {0: 5}, {}])
+        self.assertEqual(list(self.reseau.aretes()), [(0, 1, 10, 5)])
+
+    def test_vue_matrice_mise_a_jour(self):
+        """Vérifie que la vue matricielle suit les modifications du réseau."""
+        self.reseau.ajouter_station("A")
+        self.reseau.ajouter_station("B")
+
+        self.assertEqual(self.reseau.matrice_temps, [[-1, -1], [-1, -1]])
+
+        self.reseau.ajouter_route("A", "B", 10, 5)
+
+        self.assertEqual(self.reseau.matrice_temps, [[-1, 5], [5, -1]])
+
+    # TESTS DES MODIFICATIONS DE ROUTES
+    def test_modifier_et_fermer_route(self):
+        """Vérifie la modification et la fermeture d’une route dans les deux sens."""
+        for nom in ["A", "B", "C"]:
+            self.reseau.ajouter_station(nom)
+        self.reseau.ajouter_route("A", "B", 10, 5)
+
+        self.reseau.modifier_route("B", "A", temps=8)
+        self.assertEqual(self.reseau.adjacence_temps, [{1: 8}, {0: 8}, {}])
+        self.assertEqual(self.reseau.adjacence_distances, [{1: 10}, {0: 10}, {}])
+
+        self.reseau.fermer_route("A", "B")
+        self.assertEqual(self.reseau.adjacence_temps, [{}, {}, {}])
+        self.assertEqual(self.reseau.matrice_distances[0][1], -1)
+
+        with self.assertRaises(ValueError):
+            self.reseau.fermer_route("A", "B")
+        with self.assertRaises(ValueError):
+            self.reseau.modifier_route("A", "C", 1, 1)
+
+    def test_journal(self):
+        """Vérifie le journal des modifications de routes."""
+        self.reseau.ajouter_station("A")
+        self.reseau.ajouter_station("B")
+        version = self.reseau.version
+
+        self.reseau.ajouter_route("A", "B", 10, 5)
+        self.reseau.modifier_route("A", "B", distance=12)
+        self.reseau.fermer_route("A", "B")
+
+        self.assertEqual(
+            [entree[1:] for entree in self.reseau.modifications_depuis(version)],
+            [(0, 1, None, (10, 5)), (0, 1, (10, 5), (12, 5)), (0, 1, (12, 5), None)]
+        )
+        self.assertEqual(self.reseau.modifications_depuis(self.reseau.version), [])
+
+    def test_journal_borne(self):
+        """Vérifie qu’un journal tronqué impose un recalcul complet (None)."""
+        self.reseau.journal = type(self.reseau.journal)(maxlen=2)
+        self.reseau.ajouter_station("A")
+        self.reseau.ajouter_station("B")
+        version = self.reseau.version
+
+        for temps in [1, 2, 3]:
+            self.reseau.ajouter_route("A", "B", 1, temps)
+
+        self.assertIsNone(self.reseau.modifications_depuis(version))
+        self.assertEqual(len(self.reseau.modifications_depuis(version + 1)), 2)
+
+    # TESTS DE L'INSTANTANÉ BINAIRE
+    def construire_reseau(self):
+        """Réseau de test : coordonnées partielles, noms accentués, routes réelles."""
+        self.reseau.ajouter_station("Gare", 48.85, 2.35)
+        self.reseau.ajouter_station("Hôpital")
+        self.reseau.ajouter_station("Île")
+        self.reseau.ajouter_route("Gare", "Hôpital", 1.5, 4.25)
+        self.reseau.ajouter_route("Hôpital", "Île", 0.1, 3)
+        self.reseau.ajouter_station("Isolée")
+
+    def test_instantane_binaire(self):
+        """Vérifie qu’un instantané relu redonne exactement le même réseau."""
+        self.construire_reseau()
+        dossier = tempfile.mkdtemp()
+        try:
+            fichier = os.path.join(dossier, "cache", "reseau.bin")
+            self.reseau.sauvegarder_binaire(fichier, "abc")
+
+            copie = ReseauUrbain("copie")
+            self.assertTrue(copie.charger_binaire(fichier, "abc"))
+            self.assertEqual(copie.index_par_nom, self.reseau.index_par_nom)
+            self.assertEqual(copie.adjacence_distances, self.reseau.adjacence_distances)
+            self.assertEqual(copie.adjacence_temps, self.reseau.adjacence_temps)
+            self.assertEqual((copie.stations[0].latitude, copie.stations[0].longitude), (48.85, 2.35))
+            self.assertIsNone(copie.stations[1].latitude)
+            self.assertEqual(copie.voisins("Hôpital"), ["Gare", "Île"])
+
+            # Le journal repart de zéro : les caches dépendants sont recalculés
+            self.assertIsNone(copie.modifications_depuis(0))
+            with self.assertRaises(ValueError):
+                copie.charger_binaire(fichier)
+
+            # Réseau vide
+            vide = ReseauUrbain("vide")
+            vide.sauvegarder_binaire(fichier)
+            relu = ReseauUrbain("relu")
+            self.assertTrue(relu.charger_binaire(fichier))
+            self.assertEqual(relu.stations, [])
+        finally:
+            shutil.rmtree(dossier)
+
+    def test_instantane_binaire_refuse(self):
+        """Vérifie qu’un instantané absent, périmé ou corrompu est refusé sans modifier le réseau."""
+        self.construire_reseau()
+        dossier = tempfile.mkdtemp()
+        try:
+            fichier = os.path.join(dossier, "reseau.bin")
+            self.assertFalse(ReseauUrbain("x").charger_binaire(fichier))
+
+            self.reseau.sauvegarder_binaire(fichier, "abc")
+            autre = ReseauUrbain("x")
+            self.assertFalse(autre.charger_binaire(fichier, "def"))
+            self.assertEqual(autre.stations, [])
+
+            # Fichier tronqué
+            with open(fichier, "rb") as f:
+                debut = f.read(100)
+            with open(fichier, "wb") as f:
+                f.write(debut)
+            self.assertFalse(ReseauUrbain("x").charger_binaire(fichier))
+
+            with open(fichier, "wb") as f:
+                f.write(b"pas un instantane" * 10)
+            self.assertFalse(ReseauUrbain("x").charger_binaire(fichier))
+        finally:
+            shutil.rmtree(dossier)
+
+    def test_charger_avec_instantane(self):
+        """Vérifie que charger() passe par les CSV puis par l’instantané, refait si un CSV change."""
+        dossier = tempfile.mkdtemp() + os.sep
+        try:
+            with open(dossier + "stations_xl.csv", "w", encoding="utf-8") as f:
+                f.write("id,nom\n0,Gare\n1,Centre\n")
+            with open(dossier + "routes_xl.csv", "w", encoding="utf-8") as f:
+                f.write("from,to,distance_km,temps_min\n0,1,1.5,4\n")
+            fichier = dossier + "cache/reseau.bin"
+
+            premier = ReseauUrbain("premier")
+            premier.charger(dossier, fichier)
+            self.assertTrue(os.path.exists(fichier))
+
+            second = ReseauUrbain("second")
+            self.assertTrue(second.charger_binaire(fichier, None))
+            self.assertEqual(second.adjacence_temps, premier.adjacence_temps)
+
+            with open(dossier + "routes_xl.csv", "w", encoding="utf-8") as f:
+                f.write("from,to,distance_km,temps_min\n0,1,1.5,6\n")
+            troisieme = ReseauUrbain("troisieme")
+            troisieme.charger(dossier, fichier)
+            self.assertEqual(troisieme.adjacence_temps[0][1], 6)
+
+            quatrieme = ReseauUrbain("quatrieme")
+            quatrieme.charger(dossier, fichier)
+            self.assertEqual(quatrieme.adjacence_temps[0][1], 6)
+        finally:
+            shutil.rmtree(dossier)
+
+    def test_instantane_par_jeu_de_donnees(self):
+        """Vérifie que chaque dossier de CSV a son propre instantané par défaut."""
+        dossiers = [tempfile.mkdtemp() + os.sep for _ in range(2)]
+        try:
+            for temps, dossier in zip((4, 7), dossiers):
+                with open(dossier + "stations_xl.csv", "w", encoding="utf-8") as f:
+                    f.write("id,nom\n0,Gare\n1,Centre\n")
+                with open(dossier + "routes_xl.csv", "w", encoding="utf-8") as f:
+                    f.write(f"from,to,distance_km,temps_min\n0,1,1.5,{temps}\n")
+                ReseauUrbain("jeu").charger(dossier)
+
+            for temps, dossier in zip((4, 7), dossiers):
+                reseau = ReseauUrbain("relu")
+                self.assertTrue(reseau.charger_binaire(os.path.join(dossier, "cache", "reseau.bin")))
+                self.assertEqual(reseau.adjacence_temps[0][1], temps)
+        finally:
+            for dossier in dossiers:
+                shutil.rmtree(dossier)
+
     # TEST DE REPRÉSENTATION TEXTE
     def test_str(self):
         """Vérifie la représentation textuelle du réseau."""
@@ -48,6 +48,31 @@ class TestStation(unittest.TestCase):
 
         self.assertEqual(station.affichage(), str(station))
 
+    # TESTS DES COORDONNÉES
+    def test_coordonnees(self):
+        """Vérifie les coordonnées optionnelles d’une station."""
+        self.assertFalse(Station(6, "Zoo").a_coordonnees())
+        self.assertTrue(Station(7, "Lycee", 48.85, 2.35).a_coordonnees())
+
+    def test_distance_vol_oiseau(self):
+        """Vérifie la distance haversine (un degré de longitude à l’équateur ≈ 111,19 km)."""
+        a = Station(8, "A", 0.0, 0.0)
+        b = Station(9, "B", 0.0, 1.0)
+
+        self.assertAlmostEqual(a.distance_vol_oiseau(b), 111.19, places=2)
+        self.assertEqual(a.distance_vol_oiseau(a), 0)
+
+    # TEST DE LA COMPACITÉ MÉMOIRE
+    def test_slots(self):
+        """
+        Vérifie que la station n’a pas de __dict__ (attributs déclarés par __slots__).
+        """
+        station = Station(5, "Port")
+
+        self.assertFalse(hasattr(station, "__dict__"))
+        with self.assertRaises(AttributeError):
+            station.autre = 1
+
 
 if __name__ == "__main__":
     unittest.main()
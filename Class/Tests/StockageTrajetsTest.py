@@ -0,0 +1,73 @@
+import unittest
+
+from Class.ReseauUrbain import ReseauUrbain
+from Class.AnalyseurTrajets import AnalyseurTrajets
+from Class.StockageTrajets import StockageTrajets
+from Class.TrajetObserve import TrajetObserve
+
+
+class StockageTrajetsTest(unittest.TestCase):
+    """
+    Tests unitaires de la classe StockageTrajets.
+
+    Ces tests vérifient :
+    - le stockage en colonnes (noms internés, indices, offsets, mesures)
+    - la reconstruction des trajets sous forme de TrajetObserve
+    - la compatibilité avec AnalyseurTrajets
+    """
+
+    def setUp(self):
+        self.lignes = [
+            ("1", ["A", "B", "C"], 20.0, 20.0),
+            ("2", ["C", "B"], None, 10.0),
+            ("3", ["A", "B", "C"], 100.0, 20.0),
+        ]
+        self.stockage = StockageTrajets.depuis_lignes(self.lignes)
+
+    def test_colonnes(self):
+        """Vérifie le contenu des colonnes et l’internement des noms."""
+        self.assertEqual(self.stockage.noms, ["A", "B", "C"])
+        self.assertEqual(list(self.stockage.indices), [0, 1, 2, 2, 1, 0, 1, 2])
+        self.assertEqual(list(self.stockage.offsets), [0, 3, 5, 8])
+        self.assertEqual(list(self.stockage.indices_trajet(1)), [2, 1])
+
+    def test_reconstruction(self):
+        """Vérifie que chaque trajet est restitué à l’identique."""
+        self.assertEqual(len(self.stockage), 3)
+
+        for trajet, (id_trajet, stations, tps, dist) in zip(self.stockage, self.lignes):
+            self.assertIsInstance(trajet, TrajetObserve)
+            self.assertEqual(trajet.idTraj, id_trajet)
+            self.assertEqual(trajet.nomsStations, stations)
+            self.assertEqual(trajet.tpsMesure, tps)
+            self.assertEqual(trajet.distMesure, dist)
+
+        self.assertEqual(self.stockage[-1].idTraj, "3")
+        with self.assertRaises(IndexError):
+            self.stockage[3]
+
+    def test_correspondance_reseau(self):
+        """Vérifie la correspondance entre indices locaux et indices du réseau."""
+        reseau = ReseauUrbain("reseau_test")
+        reseau.ajouter_station("C")
+        reseau.ajouter_station("A")
+
+        self.assertEqual(list(self.stockage.correspondance_reseau(reseau)), [1, -1, 0])
+
+    def test_analyseur(self):
+        """Vérifie que l’analyseur accepte directement le stockage en colonnes."""
+        reseau = ReseauUrbain("reseau_test")
+        for nom in ["A", "B", "C"]:
+            reseau.ajouter_station(nom)
+        reseau.ajouter_route("A", "B", 10, 10)
+        reseau.ajouter_route("B", "C", 10, 10)
+
+        anomalies = AnalyseurTrajets(reseau, self.stockage).detection_anomalies()
+
+        self.assertEqual(anomalies["1"], {"FORMAT": [], "LOGIQUE": [], "MESURE": []})
+        self.assertTrue(any("manquantes" in a for a in anomalies["2"]["FORMAT"]))
+        self.assertTrue(any("trop élevé" in a for a in anomalies["3"]["MESURE"]))
+
+
+if __name__ == "__main__":
+    unittest.main()
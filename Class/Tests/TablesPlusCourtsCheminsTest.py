@@ -0,0 +1,195 @@
+import math
+import os
+import shutil
+import tempfile
+import unittest
+from unittest import mock
+
+from Class.ReseauUrbain import ReseauUrbain
+from Class.MoteurItineraire import MoteurItineraire
+from Class.TablesPlusCourtsChemins import TablesPlusCourtsChemins
+from Class.MatricesNumpy import np
+from Class.Benchmarks.GenerateurReseau import GenerateurReseau
+
+
+class TablesPlusCourtsCheminsTest(unittest.TestCase):
+    """
+    Tests unitaires de la classe TablesPlusCourtsChemins.
+
+    Ces tests vérifient :
+    - la cohérence des tables avec le moteur de Dijkstra
+    - la sauvegarde et la réutilisation du cache sur disque
+    - l’invalidation du cache quand les fichiers CSV changent
+    - la réparation incrémentale après ajout, modification ou fermeture de routes
+    """
+
+    def setUp(self):
+        # Réseau de test écrit dans un dossier temporaire au format CSV
+        self.dossier = tempfile.mkdtemp() + os.sep
+        self.ecrire_csv(routes="0,1,1.0,10\n1,2,1.0,10\n0,2,5.0,1\n")
+
+        self.reseau = self.charger_reseau()
+        self.fichier_cache = self.dossier + "cache" + os.sep + "tables.pkl"
+
+    def tearDown(self):
+        shutil.rmtree(self.dossier)
+
+    def ecrire_csv(self, routes):
+        with open(self.dossier + "stations_xl.csv", "w", encoding="utf-8") as f:
+            f.write("id,nom\n0,A\n1,B\n2,C\n3,D\n")
+        with open(self.dossier + "routes_xl.csv", "w", encoding="utf-8") as f:
+            f.write("from,to,distance_km,temps_min\n" + routes)
+
+    def charger_reseau(self):
+        reseau = ReseauUrbain("reseau_test")
+        for nom in ["A", "B", "C", "D"]:
+            reseau.ajouter_station(nom)
+        reseau.ajouter_route("A", "B", 1.0, 10.0)
+        reseau.ajouter_route("B", "C", 1.0, 10.0)
+        reseau.ajouter_route("A", "C", 5.0, 1.0)
+        return reseau
+
+    def test_coherence_avec_dijkstra(self):
+        """Vérifie que chaque requête donne le même coût que Dijkstra."""
+        tables = TablesPlusCourtsChemins(self.reseau).calculer()
+        moteur = MoteurItineraire(self.reseau)
+
+        for depart in ["A", "B", "C", "D"]:
+            for arrivee in ["A", "B", "C", "D"]:
+                for critere in ["temps", "distance"]:
+                    self.assertEqual(
+                        tables.chemin(depart, arrivee, critere)[1],
+                        moteur.dijkstra(depart, arrivee, critere)[1]
+                    )
+
+        self.assertEqual(tables.chemin("A", "C", "distance"), (["A", "B", "C"], 2.0))
+        self.assertEqual(tables.chemin("C", "D", "temps"), (None, math.inf))
+
+    @unittest.skipIf(np is None, "NumPy n'est pas installé")
+    def test_floyd_warshall(self):
+        """Vérifie que Floyd–Warshall produit les mêmes tables que Dijkstra."""
+        dijkstra = TablesPlusCourtsChemins(self.reseau).calculer("dijkstra")
+        floyd = TablesPlusCourtsChemins(self.reseau).calculer("floyd_warshall")
+
+        for critere in ["temps", "distance"]:
+            self.assertEqual(dijkstra.couts[critere], floyd.couts[critere])
+        self.assertEqual(floyd.chemin("A", "C", "distance"), (["A", "B", "C"], 2.0))
+        self.assertEqual(floyd.chemin("B", "B", "temps"), (["B"], 0.0))
+
+    def test_cache_disque(self):
+        """Vérifie que les tables sont relues depuis le cache tant que les CSV sont inchangés."""
+        premieres = TablesPlusCourtsChemins.obtenir(self.reseau, self.fichier_cache, self.dossier)
+        self.assertTrue(os.path.exists(self.fichier_cache))
+
+        # Le calcul ne doit plus être relancé
+        with mock.patch.object(TablesPlusCourtsChemins, "calculer") as calculer:
+            relues = TablesPlusCourtsChemins.obtenir(self.reseau, self.fichier_cache, self.dossier)
+        calculer.assert_not_called()
+
+        self.assertEqual(relues.couts, premieres.couts)
+        self.assertEqual(relues.chemin("A", "C", "temps"), (["A", "C"], 1.0))
+
+    def test_cache_perime(self):
+        """Vérifie qu’une modification des CSV invalide le cache."""
+        TablesPlusCourtsChemins.obtenir(self.reseau, self.fichier_cache, self.dossier)
+
+        self.ecrire_csv(routes="0,1,1.0,10\n1,2,1.0,10\n0,2,5.0,1\n2,3,1.0,1\n")
+        self.reseau.ajouter_route("C", "D", 1.0, 1.0)
+
+        tables = TablesPlusCourtsChemins.obtenir(self.reseau, self.fichier_cache, self.dossier)
+
+        self.assertEqual(tables.chemin("A", "D", "temps"), (["A", "C", "D"], 2.0))
+
+    def test_cache_par_jeu_de_donnees(self):
+        """Vérifie que le cache par défaut est rangé dans le dossier des CSV."""
+        TablesPlusCourtsChemins.obtenir(self.reseau, base_path=self.dossier)
+        self.assertTrue(os.path.exists(os.path.join(self.dossier, "cache", "plus_courts_chemins.pkl")))
+
+    # ======================================================
+    # TESTS DE LA MISE À JOUR INCRÉMENTALE
+    # ======================================================
+
+    def verifier_tables(self, tables, reseau):
+        """Compare les tables réparées avec des tables recalculées entièrement."""
+        attendu = TablesPlusCourtsChemins(reseau).calculer()
+        for critere in ["temps", "distance"]:
+            for source in range(len(reseau.stations)):
+                for cible in range(len(reseau.stations)):
+                    self.assertAlmostEqual(
+                        tables.couts[critere][source][cible],
+                        attendu.couts[critere][source][cible]
+                    )
+            # Les prédécesseurs doivent décrire des chemins du bon coût
+            for depart in reseau.stations:
+                for arrivee in reseau.stations:
+                    chemin, cout = tables.chemin(depart.nom, arrivee.nom, critere)
+                    if chemin is None:
+                        continue
+                    adjacence = reseau.adjacence(critere)
+                    indices = [reseau.index_par_nom[nom] for nom in chemin]
+                    total = sum(adjacence[a][b] for a, b in zip(indices, indices[1:]))
+                    self.assertAlmostEqual(total, cout)
+
+    def test_fermeture_route(self):
+        """Vérifie la réparation des tables après la fermeture d’une route."""
+        tables = TablesPlusCourtsChemins(self.reseau).calculer()
+
+        self.reseau.fermer_route("A", "C")
+
+        with mock.patch.object(TablesPlusCourtsChemins, "calculer") as calculer:
+            self.assertEqual(tables.chemin("A", "C", "temps"), (["A", "B", "C"], 20.0))
+        calculer.assert_not_called()
+
+        self.reseau.fermer_route("B", "C")
+        self.assertEqual(tables.chemin("A", "C", "temps"), (None, math.inf))
+        self.verifier_tables(tables, self.reseau)
+
+    def test_ajout_et_modification_route(self):
+        """Vérifie la réparation des tables après un ajout puis une modification."""
+        tables = TablesPlusCourtsChemins(self.reseau).calculer()
+
+        self.reseau.ajouter_route("C", "D", 1.0, 1.0)
+        self.assertEqual(tables.chemin("A", "D", "temps"), (["A", "C", "D"], 2.0))
+
+        self.reseau.modifier_route("A", "C", temps=30.0)
+        self.assertEqual(tables.chemin("A", "D", "temps"), (["A", "B", "C", "D"], 21.0))
+        self.verifier_tables(tables, self.reseau)
+
+    def test_modifications_aleatoires(self):
+        """Vérifie les tables réparées sur une suite de perturbations aléatoires."""
+        generateur = GenerateurReseau(40, degre_moyen=3, graine=3)
+        reseau = generateur.reseau()
+        tables = TablesPlusCourtsChemins(reseau).calculer()
+        aretes = list(reseau.aretes())
+
+        for numero, (i, j, distance, temps) in enumerate(aretes[:12]):
+            depart = reseau.stations[i].nom
+            arrivee = reseau.stations[j].nom
+            if numero % 3 == 0:
+                reseau.fermer_route(depart, arrivee)
+            elif numero % 3 == 1:
+                reseau.modifier_route(depart, arrivee, distance * 3, temps / 2)
+            else:
+                # Plusieurs modifications de la même route dans un seul lot
+                reseau.fermer_route(depart, arrivee)
+                reseau.ajouter_route(depart, arrivee, distance / 2, temps * 4)
+
+            # Mise à jour tantôt après chaque modification, tantôt par lots
+            if numero % 2:
+                tables.mettre_a_jour()
+                self.verifier_tables(tables, reseau)
+
+        self.verifier_tables(tables, reseau)
+
+    def test_ajout_station_recalcul(self):
+        """Vérifie qu’un ajout de station provoque un recalcul complet."""
+        tables = TablesPlusCourtsChemins(self.reseau).calculer()
+
+        self.reseau.ajouter_station("E")
+        self.reseau.ajouter_route("D", "E", 1.0, 1.0)
+
+        self.assertEqual(tables.chemin("D", "E", "temps"), (["D", "E"], 1.0))
+
+
+if __name__ == "__main__":
+    unittest.main()
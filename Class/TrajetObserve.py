@@ -5,6 +5,10 @@ import unittest
 #Classe de trajet observée, avec la liste des stations parcourus et la meusure de temps et de distance.
 
 class TrajetObserve:
+    # __slots__ : pas de __dict__ par trajet, les millions de trajets observés restent compacts.
+    # Pour un stockage massif, voir StockageTrajets (stockage en colonnes).
+    __slots__ = ("idTraj", "nomsStations", "tpsMesure", "distMesure")
+
     def __init__(self, idTraj, nomsStations, tpsMesure, distMesure):
         self.idTraj=idTraj
         self.nomsStations = nomsStations
@@ -13,9 +17,10 @@ class TrajetObserve:
 
     def Conv_Liste_Chainee(self):
         #Création d'une liste chainée avec les données de l'objet.
+        #Chaque ajout en fin est en O(1) : la conversion est linéaire.
         result=ListeChainee(Noeud.vide())
         for i in self.nomsStations:
-            result=result.ajoute_fin(i)
+            result.ajoute_fin(i)
         return result
 
 class TestTrajetObserve(unittest.TestCase):
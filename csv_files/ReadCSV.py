@@ -1,51 +1,188 @@
 import csv
+import hashlib
+import time
 
 BASE_PATH = "./csv_files/reseau_xl/"
 
-def load_csv_stations():
-    stations = []
-    with open(BASE_PATH + "stations_xl.csv", newline='', encoding="utf-8") as csvfile:
+def _valeur_mesuree(texte):
+    # Convertit une valeur mesurée en float, ou None si la cellule est vide.
+    texte = texte.strip()
+    return float(texte) if texte else None
+
+
+def iter_csv_stations(base_path=BASE_PATH, avec_coordonnees=False, avec_numeros=False):
+    # Générateur : produit les stations (id, nom) une par une, sans tout charger en mémoire.
+    # Avec avec_coordonnees=True, produit (id, nom, latitude, longitude) : les coordonnées
+    # sont lues dans les colonnes optionnelles "latitude"/"longitude" (ou "lat"/"lon"),
+    # et valent None si ces colonnes sont absentes ou vides.
+    # Avec avec_numeros=True, chaque tuple commence par le numéro de sa ligne dans le fichier.
+    # Une ligne mal formée lève une ValueError qui cite son numéro.
+    with open(base_path + "stations_xl.csv", newline='', encoding="utf-8") as csvfile:
         reader = csv.reader(csvfile, delimiter=',')
-        next(reader)  # saut de l'en-tête
+        entete = [colonne.strip().lower() for colonne in next(reader, [])]  # saut de l'en-tête
+        col_lat = _colonne(entete, "latitude", "lat")
+        col_lon = _colonne(entete, "longitude", "lon")
         for row in reader:
             if not row:
                 continue
-            station_id = int(row[0])
-            nom_station = row[1].strip()   # correction importante
-            stations.append((station_id, nom_station))
-    return stations
+            try:
+                station_id = int(row[0])
+                nom_station = row[1].strip()   # correction importante
+                if avec_coordonnees:
+                    latitude = _valeur_mesuree(row[col_lat]) if col_lat is not None and col_lat < len(row) else None
+                    longitude = _valeur_mesuree(row[col_lon]) if col_lon is not None and col_lon < len(row) else None
+            except (ValueError, IndexError) as erreur:
+                raise ValueError(f"stations_xl.csv, ligne {reader.line_num} : ligne invalide {row!r}") from erreur
+            station = (station_id, nom_station, latitude, longitude) if avec_coordonnees else (station_id, nom_station)
+            yield (reader.line_num,) + station if avec_numeros else station
+
+
+def _colonne(entete, *noms):
+    # Retourne la position de la première colonne de l'en-tête portant l'un des noms, ou None.
+    for nom in noms:
+        if nom in entete:
+            return entete.index(nom)
+    return None
 
 
-def load_csv_roads():
-    routes = []
-    with open(BASE_PATH + "routes_xl.csv", newline='', encoding="utf-8") as csvfile:
+def iter_csv_roads(base_path=BASE_PATH, avec_profils=False, avec_numeros=False):
+    # Générateur : produit les routes (depart, arrivee, distance, temps) une par une.
+    # Avec avec_profils=True, produit (depart, arrivee, distance, temps, profil) : le profil
+    # horaire du temps de parcours est lu dans la colonne optionnelle "profil_temps"
+    # (texte brut, ex : "0=4;450=9;570=5"), et vaut None si la colonne est absente ou vide.
+    # Avec avec_numeros=True, chaque tuple commence par le numéro de sa ligne dans le fichier.
+    # Une ligne mal formée lève une ValueError qui cite son numéro.
+    with open(base_path + "routes_xl.csv", newline='', encoding="utf-8") as csvfile:
         reader = csv.reader(csvfile, delimiter=',')
-        next(reader)
+        entete = [colonne.strip().lower() for colonne in next(reader, [])]
+        col_profil = _colonne(entete, "profil_temps")
         for row in reader:
             if not row:
                 continue
-            depart = row[0].strip()        # correction importante
-            arrivee = row[1].strip()       # correction importante
-            distance = float(row[2])
-            temps = float(row[3])
-            routes.append((depart, arrivee, distance, temps))
-    return routes
+            try:
+                depart = row[0].strip()        # correction importante
+                arrivee = row[1].strip()       # correction importante
+                distance = float(row[2])
+                temps = float(row[3])
+            except (ValueError, IndexError) as erreur:
+                raise ValueError(f"routes_xl.csv, ligne {reader.line_num} : ligne invalide {row!r}") from erreur
+            route = (depart, arrivee, distance, temps)
+            if avec_profils:
+                profil = row[col_profil].strip() if col_profil is not None and col_profil < len(row) else ""
+                route += (profil or None,)
+            yield (reader.line_num,) + route if avec_numeros else route
 
 
-def load_csv_trajets():
-    trajets = []
-    with open(BASE_PATH + "trajets_xl.csv", newline='', encoding="utf-8") as csvfile:
+def iter_csv_trajets(base_path=BASE_PATH):
+    # Générateur : produit les trajets (id, stations, temps, distance) un par un.
+    # Une mesure absente (cellule vide) est renvoyée comme None.
+    with open(base_path + "trajets_xl.csv", newline='', encoding="utf-8") as csvfile:
         reader = csv.reader(csvfile, delimiter=',')
-        next(reader)
+        next(reader, None)
         for row in reader:
             if not row:
                 continue
-            id_trajet = row[0].strip()
-            stations = [s.strip() for s in row[1].split(";")]  # nettoyage
-            temps_mesure = float(row[2])
-            distance_mesuree = float(row[3])
-            trajets.append((id_trajet, stations, temps_mesure, distance_mesuree))
-    return trajets
+            yield _trajet_csv(row)
+
+
+def _trajet_csv(row):
+    # Convertit une ligne du CSV des trajets en (id, stations, temps, distance).
+    id_trajet = row[0].strip()
+    stations = [s.strip() for s in row[1].split(";")]  # nettoyage
+    temps_mesure = _valeur_mesuree(row[2]) if len(row) > 2 else None
+    distance_mesuree = _valeur_mesuree(row[3]) if len(row) > 3 else None
+    return id_trajet, stations, temps_mesure, distance_mesuree
+
+
+def suivre_csv_trajets(base_path=BASE_PATH, intervalle=0.5, arret=None):
+    # Générateur : suit le fichier des trajets comme "tail -f". Les trajets déjà présents
+    # sont produits, puis ceux ajoutés en fin de fichier au fur et à mesure de leur écriture.
+    # Une ligne n'est lue que lorsqu'elle est complète (terminée par un saut de ligne).
+    # - intervalle : attente (secondes) entre deux lectures lorsque la fin du fichier est atteinte
+    # - arret : fonction sans argument appelée en fin de fichier ; le suivi s'arrête
+    #   lorsqu'elle renvoie True (par défaut, le fichier est suivi indéfiniment)
+    with open(base_path + "trajets_xl.csv", newline='', encoding="utf-8") as csvfile:
+        debut = ""
+        entete_lue = False
+        while True:
+            ligne = csvfile.readline()
+            if ligne:
+                debut += ligne
+                if not debut.endswith("\n"):
+                    continue                # ligne en cours d'écriture
+                ligne, debut = debut, ""
+                if not entete_lue:
+                    entete_lue = True       # saut de l'en-tête
+                    continue
+                row = next(csv.reader([ligne]), None)
+                if row:
+                    yield _trajet_csv(row)
+                continue
+            if arret is not None and arret():
+                return
+            time.sleep(intervalle)
+
+
+def lire_heure(texte):
+    # Convertit une heure "HH:MM" (ou un nombre de minutes) en minutes depuis minuit.
+    texte = texte.strip()
+    if ":" in texte:
+        heures, minutes = texte.split(":", 1)
+        return int(heures) * 60 + float(minutes)
+    return float(texte)
+
+
+def iter_csv_horaires(base_path=BASE_PATH, avec_numeros=False):
+    # Générateur : produit les passages (id_course, ligne, station, arrivee, depart) un par un,
+    # dans l'ordre du fichier (les arrêts d'une course se suivent, dans l'ordre du parcours).
+    # Les heures sont converties en minutes depuis minuit ; une heure absente prend la valeur de l'autre.
+    # - avec_numeros : préfixe chaque passage du numéro de sa ligne dans le fichier
+    # Une ligne incomplète, ou sans heure valide, lève une ValueError citant sa ligne.
+    with open(base_path + "horaires_xl.csv", newline='', encoding="utf-8") as csvfile:
+        reader = csv.reader(csvfile, delimiter=',')
+        next(reader, None)
+        for row in reader:
+            if not row:
+                continue
+            try:
+                id_course = row[0].strip()
+                ligne = row[1].strip()
+                station = row[2].strip()
+                arrivee = lire_heure(row[3]) if row[3].strip() else None
+                depart = lire_heure(row[4]) if len(row) > 4 and row[4].strip() else arrivee
+                if depart is None:
+                    raise ValueError("aucune heure de passage")
+            except (ValueError, IndexError) as erreur:
+                raise ValueError(f"horaires_xl.csv, ligne {reader.line_num} : ligne invalide {row!r}") from erreur
+            passage = (id_course, ligne, station, depart if arrivee is None else arrivee, depart)
+            yield (reader.line_num,) + passage if avec_numeros else passage
+
+
+def iter_chunks(rows, size):
+    # Regroupe un itérable de lignes en lots (listes) d'au plus size éléments,
+    # pour un traitement vectorisé lot par lot à mémoire bornée.
+    if size <= 0:
+        raise ValueError("La taille d'un lot doit être strictement positive")
+    lot = []
+    for row in rows:
+        lot.append(row)
+        if len(lot) == size:
+            yield lot
+            lot = []
+    if lot:
+        yield lot
+
+
+def load_csv_stations(base_path=BASE_PATH):
+    return list(iter_csv_stations(base_path))
+
+
+def load_csv_roads(base_path=BASE_PATH):
+    return list(iter_csv_roads(base_path))
+
+
+def load_csv_trajets(base_path=BASE_PATH):
+    return list(iter_csv_trajets(base_path))
 
 
 def printCSV(filename):
@@ -53,3 +190,15 @@ def printCSV(filename):
         reader = csv.reader(csvfile, delimiter=',')
         for row in reader:
             print(row)
+
+
+def empreinte_fichiers(filenames, base_path=BASE_PATH):
+    # Empreinte SHA-256 du contenu de plusieurs fichiers CSV (dans l'ordre donné).
+    # Sert à détecter qu'un cache calculé à partir de ces fichiers est périmé.
+    empreinte = hashlib.sha256()
+    for filename in filenames:
+        with open(base_path + filename, "rb") as fichier:
+            for bloc in iter(lambda: fichier.read(1 << 16), b""):
+                empreinte.update(bloc)
+        empreinte.update(b"\0")
+    return empreinte.hexdigest()
@@ -1,5 +1,20 @@
 from Class.ReseauUrbain import ReseauUrbain
 from Class.AffichageReseau import AffichageReseau
+from Class.TablesPlusCourtsChemins import TablesPlusCourtsChemins
+from Class.RechercheMulticritere import RechercheMulticritere
+from Class.CheminsAlternatifs import CheminsAlternatifs
+from Class.ProfilsTemps import ProfilsTemps
+from Class.MoteurDependantTemps import MoteurDependantTemps
+from Class.Horaires import Horaires
+from Class.MoteurHoraires import MoteurHoraires
+from Class.MoteurItineraire import MoteurItineraire
+
+# Nombre maximal de stations pour afficher les matrices au démarrage
+AFFICHAGE_MATRICES_MAX = 20
+
+# Nombre maximal de stations pour précalculer les plus courts chemins entre toutes
+# les paires (calcul et mémoire en n² : environ 5 s dès 1 000 stations)
+TABLES_PLUS_COURTS_CHEMINS_MAX = 500
 
 # AFFICHAGE DU MENU PRINCIPAL
 def afficher_menu():
@@ -13,6 +28,11 @@ def afficher_menu():
     print("4 - Plus court chemin (temps)")
     print("5 - Plus court chemin (distance)")
     print("6 - Comparer deux trajets")
+    print("7 - Compromis temps / distance (front de Pareto)")
+    print("8 - Itinéraires alternatifs (k plus courts chemins en temps)")
+    print("9 - Fermer une route (perturbation)")
+    print("10 - Itinéraire selon l'heure de départ")
+    print("11 - Itinéraire selon les horaires des trains")
     print("0 - Quitter")
     return input("Choix : ").strip()
 
@@ -38,6 +58,28 @@ def demander_station(message, reseau):
         print("Station inconnue. Veuillez réessayer.")
 
 
+# DEMANDE D'UNE HEURE À L'UTILISATEUR
+def demander_heure(message):
+    """
+    Demande une heure au format HH:MM et la retourne en minutes depuis minuit.
+    """
+    while True:
+        saisie = input(message).strip()
+        try:
+            return ProfilsTemps.lire_heure(saisie)
+        except ValueError:
+            print("Heure invalide (format attendu : HH:MM).")
+
+
+# FORMATAGE D'UNE HEURE
+def formater_heure(minutes):
+    """
+    Convertit un nombre de minutes depuis minuit en texte HH:MM.
+    """
+    minutes = round(minutes) % ProfilsTemps.PERIODE
+    return f"{minutes // 60:02d}:{minutes % 60:02d}"
+
+
 # DEMANDE D'UN TRAJET (LISTE DE STATIONS)
 def demander_trajet(message, reseau):
     """
@@ -66,19 +108,22 @@ def demander_trajet(message, reseau):
 if __name__ == '__main__':
 
     # CRÉATION ET CHARGEMENT DU RÉSEAU
+    # Depuis l'instantané binaire s'il correspond aux CSV, sinon depuis les CSV
     reseau = ReseauUrbain("RER B")
-    reseau.charger_depuis_csv()
+    reseau.charger()
 
     print(reseau)
 
     # AFFICHAGE DES MATRICES (MODE DEBUG / CONTRÔLE)
-    print("\nMatrice des temps :")
-    for ligne in reseau.matrice_temps:
-        print(ligne)
+    # Réservé aux petits réseaux : chaque matrice est construite en n² valeurs
+    if len(reseau.stations) <= AFFICHAGE_MATRICES_MAX:
+        print("\nMatrice des temps :")
+        for ligne in reseau.matrice_temps:
+            print(ligne)
 
-    print("\nMatrice des distances :")
-    for ligne in reseau.matrice_distances:
-        print(ligne)
+        print("\nMatrice des distances :")
+        for ligne in reseau.matrice_distances:
+            print(ligne)
 
     # LISTE DES STATIONS DISPONIBLES
     print("\nStations du réseau :")
@@ -94,8 +139,22 @@ if __name__ == '__main__':
     except ValueError as e:
         print("Erreur :", e)
 
-    # INITIALISATION DU MODULE D'AFFICHAGE
+    # INITIALISATION DU MODULE D'AFFICHAGE ET DU MOTEUR D'ITINÉRAIRES
+    # Sur un petit réseau, les plus courts chemins entre toutes les paires de stations
+    # sont précalculés une fois, puis relus depuis le cache aux démarrages suivants ;
+    # au-delà, chaque requête est un Dijkstra (même contrat dijkstra(depart, arrivee, poids))
+    if len(reseau.stations) <= TABLES_PLUS_COURTS_CHEMINS_MAX:
+        moteur = TablesPlusCourtsChemins.obtenir(reseau)
+    else:
+        moteur = MoteurItineraire(reseau)
     affichage = AffichageReseau(reseau)
+    affichage.moteur = moteur
+    multicritere = RechercheMulticritere(reseau)
+    alternatifs = CheminsAlternatifs(reseau)
+    # Temps de parcours selon l'heure (colonne optionnelle profil_temps des routes)
+    horaire = MoteurDependantTemps(reseau, ProfilsTemps.depuis_csv(reseau))
+    # Tableau horaire des courses (horaires_xl.csv), 2 minutes minimum par correspondance
+    moteur_horaires = MoteurHoraires(Horaires.depuis_csv(reseau, temps_correspondance=2))
 
     # BOUCLE INTERACTIVE PRINCIPALE
     while True:
@@ -118,11 +177,7 @@ if __name__ == '__main__':
             depart = demander_station("Station de départ : ", reseau)
             arrivee = demander_station("Station d'arrivée : ", reseau)
 
-            chemin, cout = affichage.dijkstra(
-                depart,
-                arrivee,
-                reseau.matrice_temps
-            )
+            chemin, cout = moteur.dijkstra(depart, arrivee, "temps")
 
             if chemin is None:
                 print("Aucun chemin possible.")
@@ -135,11 +190,7 @@ if __name__ == '__main__':
             depart = demander_station("Station de départ : ", reseau)
             arrivee = demander_station("Station d'arrivée : ", reseau)
 
-            chemin, cout = affichage.dijkstra(
-                depart,
-                arrivee,
-                reseau.matrice_distances
-            )
+            chemin, cout = moteur.dijkstra(depart, arrivee, "distance")
 
             if chemin is None:
                 print("Aucun chemin possible.")
@@ -160,6 +211,84 @@ if __name__ == '__main__':
 
             affichage.afficher_deux_trajets(trajet_1, trajet_2)
 
+        # --- Front de Pareto temps / distance ---
+        elif choix == "7":
+            depart = demander_station("Station de départ : ", reseau)
+            arrivee = demander_station("Station d'arrivée : ", reseau)
+
+            front = multicritere.front_pareto(depart, arrivee)
+
+            if not front:
+                print("Aucun chemin possible.")
+            else:
+                print("Chemins non dominés (temps / distance) :")
+                for chemin, temps, distance in front:
+                    print(f"- {round(temps)} min, {round(distance, 1)} km : {' -> '.join(chemin)}")
+
+                # Comparaison visuelle du plus rapide (rouge) et du plus court (bleu)
+                affichage.afficher_deux_trajets(front[0][0], front[-1][0])
+
+        # --- k plus courts chemins (alternatives) ---
+        elif choix == "8":
+            depart = demander_station("Station de départ : ", reseau)
+            arrivee = demander_station("Station d'arrivée : ", reseau)
+            saisie = input("Nombre d'itinéraires (défaut 3) : ").strip()
+            k = int(saisie) if saisie.isdigit() and int(saisie) > 0 else 3
+
+            chemins = alternatifs.k_plus_courts(depart, arrivee, k, "temps")
+
+            if not chemins:
+                print("Aucun chemin possible.")
+            else:
+                for rang, (chemin, cout) in enumerate(chemins, start=1):
+                    print(f"{rang}. {round(cout)} min : {' -> '.join(chemin)}")
+                affichage.afficher_alternatives([chemin for chemin, _ in chemins])
+
+        # --- Fermeture d'une route (perturbation) ---
+        # Les tables de plus courts chemins (petit réseau) sont réparées à la requête suivante
+        elif choix == "9":
+            depart = demander_station("Première extrémité : ", reseau)
+            arrivee = demander_station("Seconde extrémité : ", reseau)
+
+            try:
+                reseau.fermer_route(depart, arrivee)
+                print(f"Route {depart} - {arrivee} fermée.")
+            except ValueError as e:
+                print("Erreur :", e)
+
+        # --- Itinéraire dépendant de l'heure de départ ---
+        elif choix == "10":
+            depart = demander_station("Station de départ : ", reseau)
+            arrivee = demander_station("Station d'arrivée : ", reseau)
+            heure = demander_heure("Heure de départ (HH:MM) : ")
+
+            chemin, heure_arrivee = horaire.arrivee_au_plus_tot(depart, arrivee, heure)
+
+            if chemin is None:
+                print("Aucun chemin possible.")
+            else:
+                print(f"Arrivée à {formater_heure(heure_arrivee)} : {' -> '.join(chemin)}")
+
+                # Arrivées pour des départs dans l'heure qui suit
+                for heure_depart, arrivee_prevue in horaire.profil_arrivee(depart, arrivee, heure, heure + 60, 15):
+                    print(f"- départ {formater_heure(heure_depart)} -> arrivée {formater_heure(arrivee_prevue)}")
+
+        # --- Itinéraire selon les horaires ---
+        elif choix == "11":
+            depart = demander_station("Station de départ : ", reseau)
+            arrivee = demander_station("Station d'arrivée : ", reseau)
+            heure = demander_heure("Heure de départ (HH:MM) : ")
+
+            resultats = moteur_horaires.moins_de_correspondances(depart, arrivee, heure)
+
+            if not resultats:
+                print("Aucune course ne convient.")
+            for nb_correspondances, heure_arrivee, etapes in resultats:
+                print(f"\nArrivée à {formater_heure(heure_arrivee)} ({nb_correspondances} correspondance(s)) :")
+                for ligne, _, montee, heure_montee, descente, heure_descente in etapes:
+                    print(f"- ligne {ligne} : {montee} {formater_heure(heure_montee)}"
+                          f" -> {descente} {formater_heure(heure_descente)}")
+
         # --- Quitter le programme ---
         elif choix == "0":
             print("Fin du programme.")